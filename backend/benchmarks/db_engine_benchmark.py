@@ -0,0 +1,122 @@
+"""
+Concurrent read/write throughput of the SQLite engine, before and after tuning.
+
+"baseline" is the previous engine (default rollback journal, 30 s busy
+timeout); "tuned" is create_database_engine (WAL plus pragmas). Both run
+the same mix against a fresh database file: reader threads load a debate
+with its responses, writer threads append responses and commit each one.
+
+    cd backend && python -m benchmarks.db_engine_benchmark --readers 8 --writers 2
+"""
+import argparse
+import itertools
+import os
+import tempfile
+import threading
+import time
+from typing import Dict
+
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import sessionmaker
+
+from db.database import Base, create_database_engine
+from models.database_models import Debate, MPResponse
+
+
+def _baseline_engine(url: str) -> Engine:
+    return create_engine(url, connect_args={"check_same_thread": False, "timeout": 30})
+
+
+def _seed(engine: Engine, debates: int, responses_per_debate: int) -> None:
+    Base.metadata.create_all(bind=engine)
+    Session = sessionmaker(bind=engine)
+    with Session() as db:
+        for d in range(debates):
+            debate = Debate(title=f"Debate {d}", description="Benchmark debate")
+            db.add(debate)
+            db.flush()
+            db.add_all(
+                MPResponse(debate_id=debate.id, mp_role="academic", content="x" * 400, round_number=r + 1)
+                for r in range(responses_per_debate)
+            )
+        db.commit()
+
+
+def run(engine: Engine, readers: int, writers: int, seconds: float, debates: int) -> Dict[str, float]:
+    Session = sessionmaker(bind=engine)
+    counts = {"reads": 0, "writes": 0, "errors": 0}
+    lock = threading.Lock()
+    deadline = time.perf_counter() + seconds
+    # Each appended response gets its own round, as one role speaks once per round
+    rounds = itertools.count(1)
+
+    def reader(index: int) -> None:
+        done = 0
+        while time.perf_counter() < deadline:
+            with Session() as db:
+                debate_id = (done + index) % debates + 1
+                db.query(Debate).filter(Debate.id == debate_id).first()
+                db.query(MPResponse).filter(MPResponse.debate_id == debate_id).all()
+            done += 1
+        with lock:
+            counts["reads"] += done
+
+    def writer(index: int) -> None:
+        done = errors = 0
+        while time.perf_counter() < deadline:
+            try:
+                with Session() as db:
+                    db.add(MPResponse(
+                        debate_id=(done + index) % debates + 1,
+                        mp_role="government",
+                        content="y" * 400,
+                        round_number=next(rounds)
+                    ))
+                    db.commit()
+                done += 1
+            except Exception:
+                errors += 1
+        with lock:
+            counts["writes"] += done
+            counts["errors"] += errors
+
+    threads = [threading.Thread(target=reader, args=(i,)) for i in range(readers)]
+    threads += [threading.Thread(target=writer, args=(i,)) for i in range(writers)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    return {
+        "reads_per_second": counts["reads"] / elapsed,
+        "writes_per_second": counts["writes"] / elapsed,
+        "write_errors": counts["errors"]
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--readers", type=int, default=8)
+    parser.add_argument("--writers", type=int, default=2)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--debates", type=int, default=200)
+    args = parser.parse_args()
+
+    for name, factory in (("baseline", _baseline_engine), ("tuned", create_database_engine)):
+        with tempfile.TemporaryDirectory() as directory:
+            url = f"sqlite:///{os.path.join(directory, 'bench.db')}"
+            engine = factory(url)
+            _seed(engine, args.debates, responses_per_debate=8)
+            result = run(engine, args.readers, args.writers, args.seconds, args.debates)
+            engine.dispose()
+        print(
+            f"{name:>8}: {result['reads_per_second']:8.0f} reads/s  "
+            f"{result['writes_per_second']:7.0f} writes/s  "
+            f"{result['write_errors']} write errors"
+        )
+
+
+if __name__ == "__main__":
+    main()
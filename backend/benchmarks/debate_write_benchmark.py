@@ -0,0 +1,120 @@
+"""
+Commits, statements and wall time to persist full debates, per step versus batched.
+
+"per-step" is the previous write path: every response and vote is its own
+add + commit + refresh, followed by a status update. "default" is the
+path run_full_debate takes by default: each opening speech is stored as
+soon as it is made, then one INSERT ... RETURNING per later round and one
+for the votes together with the status update. "batched" is the path
+with independent_openings, where the opening round is batched as well.
+All write the same debates to a fresh database file with the
+application's async engine.
+
+    cd backend && python -m benchmarks.debate_write_benchmark --debates 200 --rounds 2
+"""
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+from typing import Dict
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker
+
+from db.database import (Base, create_async_database_engine,
+                         create_database_engine, get_async_database_url)
+from models.database_models import Debate
+from repositories.debate_repository import DebateRepository
+from services.mp_roles import MP_ROLES
+
+SPEECH = "The committee should weigh innovation against privacy and oversight. " * 6
+
+
+async def _per_step(db, debate_id: int, rounds: int) -> None:
+    for round_number in range(1, rounds + 1):
+        for role in MP_ROLES:
+            await DebateRepository.add_response(db, debate_id, role, SPEECH, "#000000", round_number=round_number)
+    for role in MP_ROLES:
+        await DebateRepository.create_vote(db, debate_id, role, "for", "Benchmark vote")
+    await DebateRepository.update_debate_status(db, debate_id, "completed")
+
+
+async def _batched(db, debate_id: int, rounds: int, sequential_openings: bool = False) -> None:
+    for round_number in range(1, rounds + 1):
+        speeches = [
+            {"mp_role": role, "content": SPEECH, "color": "#000000", "round_number": round_number}
+            for role in MP_ROLES
+        ]
+        if round_number == 1 and sequential_openings:
+            for speech in speeches:
+                await DebateRepository.add_responses(db, debate_id, [speech])
+        else:
+            await DebateRepository.add_responses(db, debate_id, speeches)
+    await DebateRepository.add_votes(
+        db,
+        debate_id,
+        [{"mp_role": role, "vote": "for", "reasoning": "Benchmark vote"} for role in MP_ROLES],
+        status="completed"
+    )
+
+
+async def _default(db, debate_id: int, rounds: int) -> None:
+    await _batched(db, debate_id, rounds, sequential_openings=True)
+
+
+MODES = {"per-step": _per_step, "default": _default, "batched": _batched}
+
+
+async def run(engine: AsyncEngine, mode: str, debates: int, rounds: int) -> Dict[str, float]:
+    Session = async_sessionmaker(engine, expire_on_commit=False, autoflush=False)
+    write = MODES[mode]
+    async with Session() as db:
+        created = [Debate(title=f"Debate {d}", description="Benchmark debate", rounds=rounds) for d in range(debates)]
+        db.add_all(created)
+        await db.commit()
+        debate_ids = [debate.id for debate in created]
+
+    counts = {"commits": 0, "statements": 0}
+    on_commit = lambda connection: counts.__setitem__("commits", counts["commits"] + 1)
+    on_execute = lambda *args: counts.__setitem__("statements", counts["statements"] + 1)
+    event.listen(engine.sync_engine, "commit", on_commit)
+    event.listen(engine.sync_engine, "before_cursor_execute", on_execute)
+    started = time.perf_counter()
+    async with Session() as db:
+        for debate_id in debate_ids:
+            await write(db, debate_id, rounds)
+    elapsed = time.perf_counter() - started
+    event.remove(engine.sync_engine, "commit", on_commit)
+    event.remove(engine.sync_engine, "before_cursor_execute", on_execute)
+    return {
+        "commits_per_debate": counts["commits"] / debates,
+        "statements_per_debate": counts["statements"] / debates,
+        "ms_per_debate": 1000 * elapsed / debates
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--debates", type=int, default=200)
+    parser.add_argument("--rounds", type=int, default=1)
+    args = parser.parse_args()
+
+    for mode in MODES:
+        with tempfile.TemporaryDirectory() as directory:
+            url = f"sqlite:///{os.path.join(directory, 'bench.db')}"
+            sync_engine = create_database_engine(url)
+            Base.metadata.create_all(bind=sync_engine)
+            sync_engine.dispose()
+            engine = create_async_database_engine(get_async_database_url(url))
+            result = await run(engine, mode, args.debates, args.rounds)
+            await engine.dispose()
+        print(
+            f"{mode:>8}: {result['commits_per_debate']:5.1f} commits/debate  "
+            f"{result['statements_per_debate']:5.1f} statements/debate  "
+            f"{result['ms_per_debate']:6.2f} ms/debate"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
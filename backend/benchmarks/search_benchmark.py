@@ -0,0 +1,124 @@
+"""
+Latency of /search queries over a large SQLite transcript store.
+
+Builds a fresh database through the migrations (so the FTS5 tables and
+their triggers are the real ones), inserts synthetic debates with
+--responses MP responses and one vote per four responses, then times
+SearchRepository.search for rare, common and multi-word queries.
+
+    cd backend && python -m benchmarks.search_benchmark --responses 100000
+"""
+import argparse
+import asyncio
+import os
+import random
+import tempfile
+import time
+
+import numpy as np
+from alembic import command
+from sqlalchemy import insert
+
+from db.database import (create_async_database_engine, create_database_engine,
+                         get_async_database_url)
+from db.init_db import get_alembic_config
+from models.database_models import Debate, MPResponse, Vote
+from repositories.search_repository import SearchRepository
+from services.mp_roles import MP_ROLES
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+WORDS = (
+    "oversight safeguards privacy innovation liability transparency accountability market "
+    "competition surveillance biometric audit disclosure consent regulator funding research "
+    "citizens workers automation risk benchmark licensing open source compute export security"
+).split()
+RARE_WORDS = ["quasar", "zeppelin", "obsidian", "marmalade"]
+
+QUERIES = {
+    "rare word": "zeppelin",
+    "common word": "privacy",
+    "two words": "privacy oversight",
+    "stemmed phrase": "regulators auditing"
+}
+
+
+def _speech(rng: random.Random) -> str:
+    words = [rng.choice(WORDS) for _ in range(60)]
+    if rng.random() < 0.001:
+        words[rng.randrange(len(words))] = rng.choice(RARE_WORDS)
+    return " ".join(words)
+
+
+def _seed(url: str, responses: int) -> None:
+    engine = create_database_engine(url)
+    config = get_alembic_config()
+    with engine.begin() as connection:
+        config.attributes["connection"] = connection
+        command.upgrade(config, "head")
+
+    rng = random.Random(7)
+    per_debate = len(MP_ROLES) * 2
+    debates = max(1, responses // per_debate)
+    with engine.begin() as connection:
+        connection.execute(insert(Debate), [
+            {"id": d + 1, "title": f"Debate {d}", "description": "Synthetic", "status": "completed"}
+            for d in range(debates)
+        ])
+        connection.execute(insert(MPResponse), [
+            {
+                "debate_id": i // per_debate + 1,
+                "mp_role": MP_ROLES[i % len(MP_ROLES)],
+                "content": _speech(rng),
+                "round_number": 1 + (i % per_debate) // len(MP_ROLES)
+            }
+            for i in range(debates * per_debate)
+        ])
+        connection.execute(insert(Vote), [
+            {
+                "debate_id": d + 1,
+                "mp_role": role,
+                "vote": "for",
+                "reasoning": _speech(rng)
+            }
+            for d in range(debates) for role in MP_ROLES
+        ])
+    engine.dispose()
+
+
+async def _time_queries(url: str, repeats: int, limit: int) -> None:
+    engine = create_async_database_engine(get_async_database_url(url))
+    Session = async_sessionmaker(engine, expire_on_commit=False)
+    async with Session() as db:
+        for name, query in QUERIES.items():
+            for mp_role in (None, "academic"):
+                timings = []
+                for _ in range(repeats):
+                    started = time.perf_counter()
+                    hits = await SearchRepository.search(db, query, kinds=["responses", "votes"], mp_role=mp_role, limit=limit)
+                    timings.append(1000 * (time.perf_counter() - started))
+                label = f"{name} ({'academic' if mp_role else 'any role'})"
+                print(
+                    f"{label:>32}: p50 {np.percentile(timings, 50):7.2f} ms  "
+                    f"p95 {np.percentile(timings, 95):7.2f} ms  "
+                    f"{len(hits['responses'])} responses, {len(hits['votes'])} votes"
+                )
+    await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--responses", type=int, default=100000)
+    parser.add_argument("--repeats", type=int, default=20)
+    parser.add_argument("--limit", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        url = f"sqlite:///{os.path.join(directory, 'bench.db')}"
+        started = time.perf_counter()
+        _seed(url, args.responses)
+        print(f"Seeded {args.responses} responses in {time.perf_counter() - started:.1f}s")
+        asyncio.run(_time_queries(url, args.repeats, args.limit))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,9 @@
-from sqlalchemy import create_engine
+from typing import AsyncIterator
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import (AsyncEngine, AsyncSession,
+                                    async_sessionmaker, create_async_engine)
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 import os
@@ -7,25 +12,127 @@ import os
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 DB_PATH = os.path.join(BASE_DIR, "ai_parliament.db")
 
-# Create database URL
-SQLALCHEMY_DATABASE_URL = f"sqlite:///{DB_PATH}"
+def get_database_url() -> str:
+    """
+    Get the database URL from DATABASE_URL, defaulting to the local SQLite file.
+
+    Returns:
+        str: SQLAlchemy database URL
+    """
+    url = os.getenv("DATABASE_URL", f"sqlite:///{DB_PATH}")
+    # Heroku-style URLs use a scheme SQLAlchemy no longer accepts
+    if url.startswith("postgres://"):
+        url = "postgresql://" + url[len("postgres://"):]
+    return url
+
+def get_async_database_url(url: str) -> str:
+    """
+    Map a database URL onto its asyncio driver.
+
+    Args:
+        url: SQLAlchemy database URL with a synchronous driver
+
+    Returns:
+        str: The same database via aiosqlite or asyncpg
+    """
+    scheme, _, rest = url.partition("://")
+    dialect = scheme.split("+")[0]
+    if dialect == "sqlite":
+        return f"sqlite+aiosqlite://{rest}"
+    if dialect == "postgresql":
+        return f"postgresql+asyncpg://{rest}"
+    return url
+
+def _apply_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    """
+    Tune every new SQLite connection.
+
+    WAL lets readers proceed while a writer commits, and synchronous=NORMAL
+    is durable under WAL except for the last transactions on power loss.
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute(f"PRAGMA busy_timeout={int(os.getenv('SQLITE_BUSY_TIMEOUT_MS', '5000'))}")
+    # Negative cache_size is in KiB
+    cursor.execute(f"PRAGMA cache_size=-{int(os.getenv('SQLITE_CACHE_SIZE_KB', '65536'))}")
+    cursor.execute(f"PRAGMA mmap_size={int(os.getenv('SQLITE_MMAP_SIZE_BYTES', str(256 * 1024 * 1024)))}")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.close()
+
+def create_database_engine(url: str) -> Engine:
+    """
+    Build an engine tuned for the database behind the URL.
+
+    Args:
+        url: SQLAlchemy database URL
 
-# Create engine with proper permissions
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL,
-    connect_args={
-        "check_same_thread": False,  # Needed for SQLite
-        "timeout": 30  # Add timeout for busy database
-    }
-)
+    Returns:
+        Engine: SQLite engines get WAL and the pragmas above; server databases
+        get a sized connection pool that pings connections before use
+    """
+    if url.startswith("sqlite"):
+        engine = create_engine(
+            url,
+            connect_args={
+                "check_same_thread": False,  # Needed for SQLite
+                "timeout": float(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000")) / 1000
+            }
+        )
+        event.listen(engine, "connect", _apply_sqlite_pragmas)
+        return engine
 
+    return create_engine(
+        url,
+        pool_size=int(os.getenv("DB_POOL_SIZE", "10")),
+        max_overflow=int(os.getenv("DB_MAX_OVERFLOW", "20")),
+        pool_timeout=float(os.getenv("DB_POOL_TIMEOUT", "30")),
+        pool_recycle=int(os.getenv("DB_POOL_RECYCLE", "1800")),
+        pool_pre_ping=True
+    )
+
+def create_async_database_engine(url: str) -> AsyncEngine:
+    """
+    Build the asyncio counterpart of create_database_engine.
+
+    Args:
+        url: SQLAlchemy database URL with an asyncio driver
+
+    Returns:
+        AsyncEngine: Configured like the synchronous engine for the same database
+    """
+    if url.startswith("sqlite"):
+        engine = create_async_engine(
+            url,
+            connect_args={"timeout": float(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000")) / 1000}
+        )
+        event.listen(engine.sync_engine, "connect", _apply_sqlite_pragmas)
+        return engine
+
+    return create_async_engine(
+        url,
+        pool_size=int(os.getenv("DB_POOL_SIZE", "10")),
+        max_overflow=int(os.getenv("DB_MAX_OVERFLOW", "20")),
+        pool_timeout=float(os.getenv("DB_POOL_TIMEOUT", "30")),
+        pool_recycle=int(os.getenv("DB_POOL_RECYCLE", "1800")),
+        pool_pre_ping=True
+    )
+
+# Create database URL
+SQLALCHEMY_DATABASE_URL = get_database_url()
+
+# Synchronous engine for schema management and scripts
+engine = create_database_engine(SQLALCHEMY_DATABASE_URL)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+# Asyncio engine used by the application
+async_engine = create_async_database_engine(get_async_database_url(SQLALCHEMY_DATABASE_URL))
+# Objects stay usable after commit; reloading them would need a lazy query
+AsyncSessionLocal = async_sessionmaker(async_engine, expire_on_commit=False, autoflush=False)
+
 Base = declarative_base()
 
-def get_db():
+async def get_db() -> AsyncIterator[AsyncSession]:
     """Database session generator."""
-    db = SessionLocal()
-    try:
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
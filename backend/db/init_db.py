@@ -1,17 +1,39 @@
-from db.database import Base, engine
 import logging
+import os
+
+from alembic import command
+from alembic.config import Config
+from db.database import BASE_DIR, engine
+from sqlalchemy import inspect
 
 logger = logging.getLogger(__name__)
 
+# Revision matching databases built by create_all before migrations existed
+BASELINE_REVISION = "0001"
+
+def get_alembic_config() -> Config:
+    """Alembic configuration for backend/alembic.ini."""
+    config = Config(os.path.join(BASE_DIR, "alembic.ini"))
+    config.set_main_option("script_location", os.path.join(BASE_DIR, "migrations"))
+    # Keep the application's logging setup
+    config.attributes["configure_logger"] = False
+    return config
+
 def init_database():
-    """Initialize the database by creating all tables."""
+    """Bring the database schema up to date by running the Alembic migrations."""
     try:
-        Base.metadata.create_all(bind=engine)
-        logger.info("Database tables created successfully")
+        config = get_alembic_config()
+        with engine.begin() as connection:
+            config.attributes["connection"] = connection
+            tables = set(inspect(connection).get_table_names())
+            if tables and "alembic_version" not in tables:
+                logger.info(f"Stamping existing database at baseline revision {BASELINE_REVISION}")
+                command.stamp(config, BASELINE_REVISION)
+            command.upgrade(config, "head")
+        logger.info("Database schema is up to date")
     except Exception as e:
-        logger.error(f"Error creating database tables: {str(e)}")
+        logger.error(f"Error migrating database: {str(e)}")
         raise
 
 if __name__ == "__main__":
     init_database()
-
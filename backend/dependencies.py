@@ -1,20 +1,120 @@
 from services.arxiv_service import ArxivService
-from services.openai_service import OpenAIService
+from services.debate_service import FullDebateCoordinator
+from services.job_runner import DebateJobRunner
+from services.llm_cache import LLMCompletionCache
+from services.llm_providers import LLMProvider, LocalLLMProvider, OpenAIProvider
+from services.llm_resilience import ResilientCaller
+from services.openai_service import DEFAULT_MODEL, OpenAIService
+from services.rate_limiter import LLMRateLimiter
+from services.response_cache import ResponseCache
+from services.turn_tracker import DebateTurnTracker
 from functools import lru_cache
 import os
+from typing import Optional
+from monitoring.llm_metrics import LLMTelemetry
 from monitoring.vote_metrics import VoteConsistencyMonitor
 
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
 @lru_cache()
 def get_arxiv_service() -> ArxivService:
     return ArxivService()
 
 @lru_cache()
-def get_openai_service() -> OpenAIService:
+def get_llm_cache() -> Optional[LLMCompletionCache]:
+    """
+    Get the process-wide LLM completion cache.
+    
+    Returns:
+        LLMCompletionCache, or None when LLM_CACHE_ENABLED is false
+    """
+    if os.getenv("LLM_CACHE_ENABLED", "true").lower() not in ("1", "true", "yes"):
+        return None
+    return LLMCompletionCache(
+        db_path=os.getenv("LLM_CACHE_PATH", os.path.join(BASE_DIR, "llm_cache.db")),
+        memory_size=int(os.getenv("LLM_CACHE_MEMORY_SIZE", "512")),
+        max_entries=int(os.getenv("LLM_CACHE_MAX_ENTRIES", "10000")),
+        ttl_seconds=float(os.getenv("LLM_CACHE_TTL_SECONDS", str(7 * 24 * 3600)))
+    )
+
+@lru_cache()
+def get_response_cache() -> ResponseCache:
+    """
+    Get the process-wide cache of serialized debate and paper responses.
+    
+    Returns:
+        ResponseCache: Keyed on resource versions; RESPONSE_CACHE_MAX_ENTRIES=0
+        keeps ETags and 304s but stores nothing
+    """
+    return ResponseCache(
+        max_entries=int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", "2048")),
+        completed_max_age=int(os.getenv("COMPLETED_DEBATE_MAX_AGE_SECONDS", "86400"))
+    )
+
+@lru_cache()
+def get_rate_limiter() -> LLMRateLimiter:
+    """Get the process-wide LLM admission limiter."""
+    return LLMRateLimiter(
+        requests_per_minute=int(os.getenv("LLM_REQUESTS_PER_MINUTE", "500")),
+        tokens_per_minute=int(os.getenv("LLM_TOKENS_PER_MINUTE", "200000"))
+    )
+
+@lru_cache()
+def get_llm_resilience() -> ResilientCaller:
+    """Get the retry/deadline/hedging policy shared by all LLM calls."""
+    return ResilientCaller(
+        max_attempts=int(os.getenv("LLM_MAX_ATTEMPTS", "4")),
+        base_delay=float(os.getenv("LLM_BACKOFF_BASE_SECONDS", "0.5")),
+        max_delay=float(os.getenv("LLM_BACKOFF_MAX_SECONDS", "8")),
+        deadline_seconds=float(os.getenv("LLM_CALL_DEADLINE_SECONDS", "45")),
+        hedge=os.getenv("LLM_HEDGE_ENABLED", "false").lower() in ("1", "true", "yes"),
+        hedge_quantile=float(os.getenv("LLM_HEDGE_QUANTILE", "95"))
+    )
+
+def get_llm_provider() -> LLMProvider:
+    """
+    Build the LLM provider selected by LLM_PROVIDER.
+    
+    "openai" (default) calls the OpenAI API; "local" uses the offline
+    latency-simulating stand-in and needs no API key.
+    """
+    provider_name = os.getenv("LLM_PROVIDER", "openai").lower()
+    if provider_name == "local":
+        seed = os.getenv("LOCAL_LLM_SEED")
+        return LocalLLMProvider(
+            latency_median_ms=float(os.getenv("LOCAL_LLM_LATENCY_MEDIAN_MS", "800")),
+            latency_sigma=float(os.getenv("LOCAL_LLM_LATENCY_SIGMA", "0.5")),
+            tokens_per_second=float(os.getenv("LOCAL_LLM_TOKENS_PER_SECOND", "60")),
+            error_rate=float(os.getenv("LOCAL_LLM_ERROR_RATE", "0")),
+            seed=int(seed) if seed is not None else None
+        )
+    if provider_name != "openai":
+        raise ValueError(f"Unknown LLM_PROVIDER: {provider_name}")
+    
     api_key = os.getenv("OPENAI_API_KEY")
-    print("API KEY: ", api_key)
     if not api_key:
         raise ValueError("OPENAI_API_KEY environment variable is not set")
-    return OpenAIService(api_key=api_key)
+    # Retries are handled by the resilience layer, not the SDK
+    return OpenAIProvider(api_key=api_key, max_retries=0)
+
+@lru_cache()
+def get_openai_service() -> OpenAIService:
+    return OpenAIService(
+        model=os.getenv("OPENAI_MODEL", DEFAULT_MODEL),
+        cache=get_llm_cache(),
+        rate_limiter=get_rate_limiter(),
+        resilience=get_llm_resilience(),
+        context_token_budget=int(os.getenv("DEBATE_CONTEXT_TOKEN_BUDGET", "2000")),
+        provider=get_llm_provider(),
+        telemetry=get_llm_telemetry()
+    )
+
+async def close_openai_service() -> None:
+    """Close the shared OpenAI client if one was created."""
+    if get_openai_service.cache_info().currsize:
+        await get_openai_service().aclose()
+        get_openai_service.cache_clear()
+        get_llm_cache.cache_clear()
 
 @lru_cache()
 def get_vote_monitor() -> VoteConsistencyMonitor:
@@ -25,3 +125,49 @@ def get_vote_monitor() -> VoteConsistencyMonitor:
         VoteConsistencyMonitor: The monitoring service instance
     """
     return VoteConsistencyMonitor()
+
+@lru_cache()
+def get_llm_telemetry() -> LLMTelemetry:
+    """
+    Get or create a singleton instance of LLMTelemetry.
+    
+    Returns:
+        LLMTelemetry: The per-call LLM metrics store
+    """
+    return LLMTelemetry(max_calls=int(os.getenv("LLM_TELEMETRY_MAX_CALLS", "10000")))
+
+@lru_cache()
+def get_debate_coordinator() -> FullDebateCoordinator:
+    """
+    Get or create the coordinator that deduplicates full-debate runs.
+    
+    Returns:
+        FullDebateCoordinator: Shared by the inline endpoint and the job runner
+    """
+    return FullDebateCoordinator(
+        service_factory=get_openai_service,
+        turn_tracker=get_turn_tracker()
+    )
+
+@lru_cache()
+def get_turn_tracker() -> DebateTurnTracker:
+    """
+    Get or create the live turn state of running debates.
+    
+    Returns:
+        DebateTurnTracker: Updated by the debate engine, read by the moderator
+    """
+    return DebateTurnTracker()
+
+@lru_cache()
+def get_job_runner() -> DebateJobRunner:
+    """
+    Get or create the background worker pool for full-debate jobs.
+    
+    Returns:
+        DebateJobRunner: The job runner, started and stopped by the app lifespan
+    """
+    return DebateJobRunner(
+        coordinator=get_debate_coordinator(),
+        workers=int(os.getenv("DEBATE_JOB_WORKERS", "2"))
+    )
@@ -1,24 +1,43 @@
 import logging
 import os
+from contextlib import asynccontextmanager
 from dotenv import load_dotenv
+
+# Load environment variables from .env file before db/database.py builds
+# its engines from DATABASE_URL at import time
+load_dotenv()
+
 from datetime import datetime
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from db.database import async_engine
 from db.init_db import init_database
-from routers import debates, moderator, policy_papers, monitoring
-
-# Load environment variables from .env file
-load_dotenv()
+from dependencies import close_openai_service, get_job_runner
+from repositories.pagination import NEXT_CURSOR_HEADER
+from routers import debates, jobs, moderator, policy_papers, monitoring, search
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Tie shared client and worker lifecycles to the application."""
+    job_runner = get_job_runner()
+    await job_runner.start()
+    yield
+    await job_runner.stop()
+    get_job_runner.cache_clear()
+    await close_openai_service()
+    await async_engine.dispose()
+
 # Initialize the app
-app = FastAPI(title="AI Parliament API")
+app = FastAPI(title="AI Parliament API", lifespan=lifespan)
 
-# Initialize database
-init_database()
+# Apply pending migrations; set DB_MIGRATE_ON_STARTUP=false where
+# `alembic upgrade head` runs as a deploy step instead
+if os.getenv("DB_MIGRATE_ON_STARTUP", "true").lower() == "true":
+    init_database()
 
 # CORS Configuration
 app.add_middleware(
@@ -27,13 +46,16 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER, "ETag"],
 )
 
 # Include routers
 app.include_router(debates.router)
+app.include_router(jobs.router)
 app.include_router(moderator.router)
 app.include_router(policy_papers.router)
 app.include_router(monitoring.router)
+app.include_router(search.router)
 
 @app.get("/health")
 async def health_check():
@@ -0,0 +1,78 @@
+from logging.config import fileConfig
+
+from alembic import context
+from dotenv import load_dotenv
+
+# `alembic upgrade` migrates the database configured in .env, like the app
+load_dotenv()
+
+from db.database import Base, create_database_engine, get_database_url
+# Register every table on Base.metadata for autogenerate
+import models.database_models  # noqa: F401
+
+config = context.config
+
+# Skip logging setup when run from init_database inside the application
+if config.config_file_name is not None and config.attributes.get("configure_logger", True):
+    fileConfig(config.config_file_name)
+
+target_metadata = Base.metadata
+
+
+def include_object(object, name, type_, reflected, compare_to) -> bool:
+    """Leave the full-text search structures of revision 0004 out of autogenerate."""
+    if type_ == "table" and reflected and compare_to is None and "_fts" in name:
+        return False
+    if name is not None and name.endswith("search_vector") and type_ in ("column", "index"):
+        return False
+    return True
+
+
+def run_migrations_offline() -> None:
+    """Emit the migration SQL without connecting to the database."""
+    url = get_database_url()
+    context.configure(
+        url=url,
+        target_metadata=target_metadata,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+        include_object=include_object,
+        render_as_batch=url.startswith("sqlite")
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online() -> None:
+    """Run the migrations against the database, reusing a passed-in connection."""
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        _run_with(connection)
+        return
+
+    engine = create_database_engine(get_database_url())
+    try:
+        with engine.connect() as connection:
+            _run_with(connection)
+    finally:
+        engine.dispose()
+
+
+def _run_with(connection) -> None:
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        include_object=include_object,
+        # SQLite can only alter tables by copying them
+        render_as_batch=connection.dialect.name == "sqlite"
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
@@ -0,0 +1,87 @@
+"""Baseline schema
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-17
+
+The schema as the original create_all built it: papers, debates, MP
+responses and votes. Databases without an alembic_version table are
+stamped at this revision by init_database; 0001a then adds whatever the
+application created on top of it before migrations were introduced.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '0001'
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('policy_papers',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('title', sa.Text(), nullable=False),
+    sa.Column('content', sa.Text(), nullable=False),
+    sa.Column('summary', sa.Text(), nullable=False),
+    sa.Column('source', sa.String(length=50), nullable=True),
+    sa.Column('url', sa.Text(), nullable=True),
+    sa.Column('status', sa.String(length=20), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_policy_papers_id', 'policy_papers', ['id'], unique=False)
+
+    op.create_table('debates',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('title', sa.Text(), nullable=False),
+    sa.Column('description', sa.Text(), nullable=False),
+    sa.Column('policy_text', sa.Text(), nullable=True),
+    sa.Column('status', sa.String(length=20), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('paper_id', sa.Integer(), nullable=True),
+    sa.ForeignKeyConstraint(['paper_id'], ['policy_papers.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_debates_id', 'debates', ['id'], unique=False)
+
+    op.create_table('mp_responses',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('debate_id', sa.Integer(), nullable=True),
+    sa.Column('mp_role', sa.String(), nullable=True),
+    sa.Column('content', sa.Text(), nullable=True),
+    sa.Column('color', sa.String(), nullable=True),
+    sa.Column('timestamp', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['debate_id'], ['debates.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_mp_responses_id', 'mp_responses', ['id'], unique=False)
+
+    op.create_table('votes',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('debate_id', sa.Integer(), nullable=True),
+    sa.Column('mp_role', sa.String(), nullable=True),
+    sa.Column('vote', sa.String(), nullable=True),
+    sa.Column('reasoning', sa.Text(), nullable=True),
+    sa.Column('timestamp', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.ForeignKeyConstraint(['debate_id'], ['debates.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_votes_id', 'votes', ['id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_votes_id', table_name='votes')
+    op.drop_table('votes')
+    op.drop_index('ix_mp_responses_id', table_name='mp_responses')
+    op.drop_table('mp_responses')
+    op.drop_index('ix_debates_id', table_name='debates')
+    op.drop_table('debates')
+    op.drop_index('ix_policy_papers_id', table_name='policy_papers')
+    op.drop_table('policy_papers')
@@ -0,0 +1,108 @@
+"""Pre-migration schema additions
+
+Revision ID: 0001a
+Revises: 0001
+Create Date: 2026-10-17
+
+Tables and columns the application added on top of the baseline while
+the schema was still built by create_all: background jobs, idempotency
+keys, parliament member votes, debate rounds, response round numbers
+and arXiv identity of papers. create_all only ever added missing tables,
+so a database stamped at 0001 may already hold any of these tables but
+none of the columns; each is only created if it is missing.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0001a'
+down_revision: Union[str, Sequence[str], None] = '0001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Columns added to baseline tables, in the order they were introduced
+NEW_COLUMNS = (
+    ('debates', 'rounds', sa.Integer()),
+    ('mp_responses', 'round_number', sa.Integer()),
+    ('policy_papers', 'arxiv_id', sa.String(length=64)),
+    ('policy_papers', 'fetched_at', sa.DateTime()),
+)
+
+
+def _columns(table: str) -> set:
+    return {column['name'] for column in sa.inspect(op.get_bind()).get_columns(table)}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    tables = set(sa.inspect(op.get_bind()).get_table_names())
+
+    for table, name, type_ in NEW_COLUMNS:
+        if name not in _columns(table):
+            with op.batch_alter_table(table, schema=None) as batch_op:
+                batch_op.add_column(sa.Column(name, type_, nullable=True))
+    # Rows from before rounds existed took part in a single round
+    op.execute("UPDATE debates SET rounds = 1 WHERE rounds IS NULL")
+    op.execute("UPDATE mp_responses SET round_number = 1 WHERE round_number IS NULL")
+    indexes = {index['name'] for index in sa.inspect(op.get_bind()).get_indexes('policy_papers')}
+    if 'ix_policy_papers_arxiv_id' not in indexes:
+        op.create_index('ix_policy_papers_arxiv_id', 'policy_papers', ['arxiv_id'], unique=True)
+
+    if 'idempotency_keys' not in tables:
+        op.create_table('idempotency_keys',
+        sa.Column('key', sa.String(length=255), nullable=False),
+        sa.Column('request_hash', sa.String(length=64), nullable=False),
+        sa.Column('status', sa.String(length=20), nullable=True),
+        sa.Column('response', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('key')
+        )
+    if 'debate_jobs' not in tables:
+        op.create_table('debate_jobs',
+        sa.Column('id', sa.String(length=32), nullable=False),
+        sa.Column('paper_id', sa.Integer(), nullable=False),
+        sa.Column('status', sa.String(length=20), nullable=True),
+        sa.Column('params', sa.Text(), nullable=True),
+        sa.Column('responses_done', sa.Integer(), nullable=True),
+        sa.Column('votes_done', sa.Integer(), nullable=True),
+        sa.Column('debate_id', sa.Integer(), nullable=True),
+        sa.Column('result', sa.Text(), nullable=True),
+        sa.Column('error', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.Column('started_at', sa.DateTime(), nullable=True),
+        sa.Column('finished_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['debate_id'], ['debates.id'], ),
+        sa.ForeignKeyConstraint(['paper_id'], ['policy_papers.id'], ),
+        sa.PrimaryKeyConstraint('id')
+        )
+    if 'member_votes' not in tables:
+        op.create_table('member_votes',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('debate_id', sa.Integer(), nullable=True),
+        sa.Column('member_index', sa.Integer(), nullable=False),
+        sa.Column('mp_role', sa.String(), nullable=True),
+        sa.Column('vote', sa.String(), nullable=True),
+        sa.Column('score', sa.Float(), nullable=True),
+        sa.Column('reasoning', sa.Text(), nullable=True),
+        sa.ForeignKeyConstraint(['debate_id'], ['debates.id'], ),
+        sa.PrimaryKeyConstraint('id')
+        )
+        op.create_index('ix_member_votes_debate_id', 'member_votes', ['debate_id'], unique=False)
+        op.create_index('ix_member_votes_id', 'member_votes', ['id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_member_votes_id', table_name='member_votes')
+    op.drop_index('ix_member_votes_debate_id', table_name='member_votes')
+    op.drop_table('member_votes')
+    op.drop_table('debate_jobs')
+    op.drop_table('idempotency_keys')
+    op.drop_index('ix_policy_papers_arxiv_id', table_name='policy_papers')
+    for table, name, _ in reversed(NEW_COLUMNS):
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.drop_column(name)
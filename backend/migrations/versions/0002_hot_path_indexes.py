@@ -0,0 +1,47 @@
+"""Hot path indexes
+
+Revision ID: 0002
+Revises: 0001a
+Create Date: 2026-10-17
+
+Indexes for the transcript, vote and paper lookups that otherwise scan
+whole tables, and a unique member seat per parliament vote.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0002'
+down_revision: Union[str, Sequence[str], None] = '0001a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_mp_responses_debate_id', 'mp_responses', ['debate_id'], unique=False)
+    op.create_index('ix_votes_debate_id_mp_role', 'votes', ['debate_id', 'mp_role'], unique=False)
+    op.create_index('ix_policy_papers_status', 'policy_papers', ['status'], unique=False)
+    op.create_index('ix_debates_paper_id_status', 'debates', ['paper_id', 'status'], unique=False)
+    op.create_index('ix_debate_jobs_status_created_at', 'debate_jobs', ['status', 'created_at'], unique=False)
+    op.create_index('ix_debate_jobs_paper_id_status', 'debate_jobs', ['paper_id', 'status'], unique=False)
+    op.create_index(
+        'uq_member_votes_debate_id_member_index',
+        'member_votes',
+        ['debate_id', 'member_index'],
+        unique=True
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('uq_member_votes_debate_id_member_index', table_name='member_votes')
+    op.drop_index('ix_debate_jobs_paper_id_status', table_name='debate_jobs')
+    op.drop_index('ix_debate_jobs_status_created_at', table_name='debate_jobs')
+    op.drop_index('ix_debates_paper_id_status', table_name='debates')
+    op.drop_index('ix_policy_papers_status', table_name='policy_papers')
+    op.drop_index('ix_votes_debate_id_mp_role', table_name='votes')
+    op.drop_index('ix_mp_responses_debate_id', table_name='mp_responses')
@@ -0,0 +1,63 @@
+"""Vote tallies
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-17
+
+Per-debate vote counts maintained alongside every vote insert, backfilled
+from the votes already stored.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0003'
+down_revision: Union[str, Sequence[str], None] = '0002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('vote_tallies',
+    sa.Column('debate_id', sa.Integer(), nullable=False),
+    sa.Column('votes_for', sa.Integer(), nullable=False),
+    sa.Column('votes_against', sa.Integer(), nullable=False),
+    sa.Column('votes_abstain', sa.Integer(), nullable=False),
+    sa.Column('result', sa.String(length=20), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['debate_id'], ['debates.id'], ),
+    sa.PrimaryKeyConstraint('debate_id')
+    )
+    op.create_index('ix_vote_tallies_result', 'vote_tallies', ['result'], unique=False)
+
+    op.execute("""
+        INSERT INTO vote_tallies (debate_id, votes_for, votes_against, votes_abstain, result, updated_at)
+        SELECT debate_id, votes_for, votes_against, votes_abstain,
+               CASE
+                   WHEN votes_for + votes_against = 0 THEN 'abstained'
+                   WHEN 2 * votes_for > votes_for + votes_against THEN 'passed'
+                   WHEN 2 * votes_against > votes_for + votes_against THEN 'rejected'
+                   ELSE 'tied'
+               END,
+               CURRENT_TIMESTAMP
+        FROM (
+            SELECT debate_id,
+                   SUM(CASE WHEN vote = 'for' THEN 1 ELSE 0 END) AS votes_for,
+                   SUM(CASE WHEN vote = 'against' THEN 1 ELSE 0 END) AS votes_against,
+                   SUM(CASE WHEN vote = 'abstain' THEN 1 ELSE 0 END) AS votes_abstain
+            FROM votes
+            WHERE debate_id IS NOT NULL
+            GROUP BY debate_id
+        ) AS counts
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_vote_tallies_result', table_name='vote_tallies')
+    op.drop_table('vote_tallies')
@@ -0,0 +1,96 @@
+"""Full-text search
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-17
+
+Search indexes over papers, MP responses and vote reasoning, maintained by
+the database on every write. SQLite gets external-content FTS5 tables
+updated by triggers; PostgreSQL gets generated tsvector columns with GIN
+indexes. Neither is mapped on the models, see repositories/search_repository.py.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0004'
+down_revision: Union[str, Sequence[str], None] = '0003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Indexed columns per table, most important first
+SEARCH_COLUMNS = {
+    'policy_papers': ('title', 'summary', 'content'),
+    'mp_responses': ('content',),
+    'votes': ('reasoning',),
+}
+
+# PostgreSQL ranks title matches above summary and content matches
+WEIGHTS = ('A', 'B', 'C')
+
+
+def _sqlite_upgrade(table: str, columns: Sequence[str]) -> None:
+    fts = f'{table}_fts'
+    column_list = ', '.join(columns)
+    new_values = ', '.join(f'new.{column}' for column in columns)
+    old_values = ', '.join(f'old.{column}' for column in columns)
+    op.execute(
+        f"CREATE VIRTUAL TABLE {fts} USING fts5({column_list}, "
+        f"content='{table}', content_rowid='id', tokenize='porter unicode61')"
+    )
+    op.execute(
+        f"CREATE TRIGGER {fts}_insert AFTER INSERT ON {table} BEGIN "
+        f"INSERT INTO {fts}(rowid, {column_list}) VALUES (new.id, {new_values}); END"
+    )
+    op.execute(
+        f"CREATE TRIGGER {fts}_delete AFTER DELETE ON {table} BEGIN "
+        f"INSERT INTO {fts}({fts}, rowid, {column_list}) VALUES ('delete', old.id, {old_values}); END"
+    )
+    # Only edits to indexed columns touch the index, not status changes
+    op.execute(
+        f"CREATE TRIGGER {fts}_update AFTER UPDATE OF {column_list} ON {table} BEGIN "
+        f"INSERT INTO {fts}({fts}, rowid, {column_list}) VALUES ('delete', old.id, {old_values}); "
+        f"INSERT INTO {fts}(rowid, {column_list}) VALUES (new.id, {new_values}); END"
+    )
+    op.execute(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')")
+
+
+def _postgresql_upgrade(table: str, columns: Sequence[str]) -> None:
+    if len(columns) == 1:
+        document = f"to_tsvector('english', coalesce({columns[0]}, ''))"
+    else:
+        document = ' || '.join(
+            f"setweight(to_tsvector('english', coalesce({column}, '')), '{weight}')"
+            for column, weight in zip(columns, WEIGHTS)
+        )
+    op.execute(
+        f"ALTER TABLE {table} ADD COLUMN search_vector tsvector "
+        f"GENERATED ALWAYS AS ({document}) STORED"
+    )
+    op.execute(f"CREATE INDEX ix_{table}_search_vector ON {table} USING GIN (search_vector)")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    dialect = op.get_bind().dialect.name
+    for table, columns in SEARCH_COLUMNS.items():
+        if dialect == 'sqlite':
+            _sqlite_upgrade(table, columns)
+        elif dialect == 'postgresql':
+            _postgresql_upgrade(table, columns)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    dialect = op.get_bind().dialect.name
+    for table in SEARCH_COLUMNS:
+        if dialect == 'sqlite':
+            for trigger in ('insert', 'delete', 'update'):
+                op.execute(f"DROP TRIGGER IF EXISTS {table}_fts_{trigger}")
+            op.execute(f"DROP TABLE IF EXISTS {table}_fts")
+        elif dialect == 'postgresql':
+            op.execute(f"DROP INDEX IF EXISTS ix_{table}_search_vector")
+            op.execute(f"ALTER TABLE {table} DROP COLUMN IF EXISTS search_vector")
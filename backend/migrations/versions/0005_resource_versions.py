@@ -0,0 +1,38 @@
+"""Resource versions
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-17
+
+Version counters on debates and papers, bumped by every write that
+changes what their read endpoints return. HTTP ETags and the response
+cache are keyed on them.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0005'
+down_revision: Union[str, Sequence[str], None] = '0004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table('debates', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('version', sa.Integer(), server_default='1', nullable=False))
+    with op.batch_alter_table('policy_papers', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('version', sa.Integer(), server_default='1', nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('policy_papers', schema=None) as batch_op:
+        batch_op.drop_column('version')
+    with op.batch_alter_table('debates', schema=None) as batch_op:
+        batch_op.drop_column('version')
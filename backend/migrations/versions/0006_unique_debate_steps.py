@@ -0,0 +1,118 @@
+"""Unique debate steps
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-17
+
+One response per MP role and round, and one vote per MP role, in each
+debate. Duplicates left by runs that resumed the same debate in parallel
+are reported and removed first, keeping the earliest row; the vote
+tallies and versions of the affected debates are recomputed.
+
+"""
+import logging
+from typing import List, Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0006'
+down_revision: Union[str, Sequence[str], None] = '0005'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+logger = logging.getLogger("alembic.runtime.migration")
+
+# Rows that repeat an earlier row's step; the earliest row is kept
+DUPLICATE_VOTES = """
+    FROM votes
+    WHERE debate_id IS NOT NULL AND mp_role IS NOT NULL
+      AND id NOT IN (
+          SELECT MIN(id) FROM votes
+          WHERE debate_id IS NOT NULL AND mp_role IS NOT NULL
+          GROUP BY debate_id, mp_role
+      )
+"""
+DUPLICATE_RESPONSES = """
+    FROM mp_responses
+    WHERE debate_id IS NOT NULL AND round_number IS NOT NULL AND mp_role IS NOT NULL
+      AND id NOT IN (
+          SELECT MIN(id) FROM mp_responses
+          WHERE debate_id IS NOT NULL AND round_number IS NOT NULL AND mp_role IS NOT NULL
+          GROUP BY debate_id, round_number, mp_role
+      )
+"""
+
+
+def _remove_duplicates(connection: sa.engine.Connection, table: str, duplicates: str) -> List[int]:
+    """Delete a table's duplicate steps and return the debates they belonged to."""
+    debate_ids = list(connection.scalars(sa.text(f"SELECT DISTINCT debate_id {duplicates}")))
+    if debate_ids:
+        count = connection.scalar(sa.text(f"SELECT COUNT(*) {duplicates}"))
+        logger.warning(
+            f"Removing {count} duplicate rows from {table} in debates {sorted(debate_ids)}"
+        )
+        connection.execute(sa.text(f"DELETE {duplicates}"))
+    return debate_ids
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    connection = op.get_bind()
+    vote_debates = _remove_duplicates(connection, 'votes', DUPLICATE_VOTES)
+    response_debates = _remove_duplicates(connection, 'mp_responses', DUPLICATE_RESPONSES)
+
+    if vote_debates:
+        ids = sa.bindparam('ids', expanding=True)
+        connection.execute(
+            sa.text("DELETE FROM vote_tallies WHERE debate_id IN :ids").bindparams(ids),
+            {"ids": vote_debates}
+        )
+        connection.execute(sa.text("""
+            INSERT INTO vote_tallies (debate_id, votes_for, votes_against, votes_abstain, result, updated_at)
+            SELECT debate_id, votes_for, votes_against, votes_abstain,
+                   CASE
+                       WHEN votes_for + votes_against = 0 THEN 'abstained'
+                       WHEN 2 * votes_for > votes_for + votes_against THEN 'passed'
+                       WHEN 2 * votes_against > votes_for + votes_against THEN 'rejected'
+                       ELSE 'tied'
+                   END,
+                   CURRENT_TIMESTAMP
+            FROM (
+                SELECT debate_id,
+                       SUM(CASE WHEN vote = 'for' THEN 1 ELSE 0 END) AS votes_for,
+                       SUM(CASE WHEN vote = 'against' THEN 1 ELSE 0 END) AS votes_against,
+                       SUM(CASE WHEN vote = 'abstain' THEN 1 ELSE 0 END) AS votes_abstain
+                FROM votes
+                WHERE debate_id IN :ids
+                GROUP BY debate_id
+            ) AS counts
+        """).bindparams(ids), {"ids": vote_debates})
+
+    changed = sorted(set(vote_debates) | set(response_debates))
+    if changed:
+        connection.execute(
+            sa.text("UPDATE debates SET version = version + 1 WHERE id IN :ids")
+            .bindparams(sa.bindparam('ids', expanding=True)),
+            {"ids": changed}
+        )
+
+    op.drop_index('ix_votes_debate_id_mp_role', table_name='votes')
+    op.create_index('uq_votes_debate_id_mp_role', 'votes', ['debate_id', 'mp_role'], unique=True)
+    op.drop_index('ix_mp_responses_debate_id', table_name='mp_responses')
+    op.create_index(
+        'uq_mp_responses_debate_id_round_number_mp_role',
+        'mp_responses',
+        ['debate_id', 'round_number', 'mp_role'],
+        unique=True
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('uq_mp_responses_debate_id_round_number_mp_role', table_name='mp_responses')
+    op.create_index('ix_mp_responses_debate_id', 'mp_responses', ['debate_id'], unique=False)
+    op.drop_index('uq_votes_debate_id_mp_role', table_name='votes')
+    op.create_index('ix_votes_debate_id_mp_role', 'votes', ['debate_id', 'mp_role'], unique=False)
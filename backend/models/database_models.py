@@ -1,39 +1,50 @@
 from datetime import datetime
 
 from db.database import Base
-from sqlalchemy import (Column, DateTime, ForeignKey, Integer, String, Text,
-                        func)
+from sqlalchemy import (Column, DateTime, Float, ForeignKey, Index, Integer,
+                        String, Text, func)
 from sqlalchemy.orm import relationship
 
 
 class Debate(Base):
     """Database model for debates."""
     __tablename__ = "debates"
+    # Latest debate of a paper by status (resume and reuse of full debates)
+    __table_args__ = (Index("ix_debates_paper_id_status", "paper_id", "status"),)
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(Text, nullable=False)
     description = Column(Text, nullable=False)
     policy_text = Column(Text)
     status = Column(String(20), default='active')
+    rounds = Column(Integer, default=1)
     created_at = Column(DateTime, default=datetime.utcnow)
+    # Bumped by every write to the debate, its responses or votes (ETags)
+    version = Column(Integer, nullable=False, default=1, server_default="1")
     
     # Foreign key to PolicyPaper
     paper_id = Column(Integer, ForeignKey('policy_papers.id'))
     # Relationship with PolicyPaper
     paper = relationship("PolicyPaper", back_populates="debate")
     # Relationship with responses
-    responses = relationship("MPResponse", back_populates="debate")
-    votes = relationship("Vote", back_populates="debate")
+    responses = relationship("MPResponse", back_populates="debate", order_by="MPResponse.id")
+    votes = relationship("Vote", back_populates="debate", order_by="Vote.id")
+    # Running vote counts, kept by DebateRepository
+    tally = relationship("VoteTally", uselist=False, viewonly=True)
 
 class MPResponse(Base):
     """Database model for MP responses."""
     __tablename__ = "mp_responses"
+    __table_args__ = (
+        Index("uq_mp_responses_debate_id_round_number_mp_role", "debate_id", "round_number", "mp_role", unique=True),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     debate_id = Column(Integer, ForeignKey("debates.id"))
     mp_role = Column(String)
     content = Column(Text)
     color = Column(String, default="#000000")
+    round_number = Column(Integer, default=1)
     timestamp = Column(DateTime, default=datetime.utcnow)
     
     # Relationship
@@ -42,7 +53,9 @@ class MPResponse(Base):
 class Vote(Base):
     """Database model for votes."""
     __tablename__ = "votes"
-    
+    # Also serves lookups by debate_id alone
+    __table_args__ = (Index("uq_votes_debate_id_mp_role", "debate_id", "mp_role", unique=True),)
+
     id = Column(Integer, primary_key=True, index=True)
     debate_id = Column(Integer, ForeignKey("debates.id"))
     mp_role = Column(String)
@@ -53,18 +66,79 @@ class Vote(Base):
     # Relationship
     debate = relationship("Debate", back_populates="votes")
 
+class VoteTally(Base):
+    """Database model for the running vote count of a debate, kept in step with votes."""
+    __tablename__ = "vote_tallies"
+
+    debate_id = Column(Integer, ForeignKey("debates.id"), primary_key=True)
+    votes_for = Column(Integer, nullable=False, default=0)
+    votes_against = Column(Integer, nullable=False, default=0)
+    votes_abstain = Column(Integer, nullable=False, default=0)
+    result = Column(String(20), index=True)  # 'passed', 'rejected', 'tied', 'abstained'
+    updated_at = Column(DateTime, default=datetime.utcnow)
+
+class MemberVote(Base):
+    """Database model for votes of a sampled parliament on a debate."""
+    __tablename__ = "member_votes"
+    __table_args__ = (
+        Index("uq_member_votes_debate_id_member_index", "debate_id", "member_index", unique=True),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    debate_id = Column(Integer, ForeignKey("debates.id"), index=True)
+    member_index = Column(Integer, nullable=False)
+    mp_role = Column(String)
+    vote = Column(String)  # 'for', 'against', 'abstain'
+    score = Column(Float)
+    reasoning = Column(Text)  # Only set for members sampled to explain their vote
+
 class PolicyPaper(Base):
     """Database model for policy papers."""
     __tablename__ = "policy_papers"
 
     id = Column(Integer, primary_key=True, index=True)
+    arxiv_id = Column(String(64), unique=True, index=True)  # Version-less, e.g. '2401.01234'
     title = Column(Text, nullable=False)
     content = Column(Text, nullable=False)
     summary = Column(Text, nullable=False)
     source = Column(String(50), default='arxiv')
     url = Column(Text)
-    status = Column(String(20), default='pending')
+    status = Column(String(20), default='pending', index=True)
     created_at = Column(DateTime, default=datetime.utcnow)
+    fetched_at = Column(DateTime)  # Last time an arXiv import returned this paper
+    # Bumped by every write to the paper (ETags)
+    version = Column(Integer, nullable=False, default=1, server_default="1")
     
     # Relationship with Debate
     debate = relationship("Debate", back_populates="paper", uselist=False)
+
+class DebateJob(Base):
+    """Database model for background full-debate jobs."""
+    __tablename__ = "debate_jobs"
+    __table_args__ = (
+        Index("ix_debate_jobs_status_created_at", "status", "created_at"),
+        Index("ix_debate_jobs_paper_id_status", "paper_id", "status"),
+    )
+
+    id = Column(String(32), primary_key=True)
+    paper_id = Column(Integer, ForeignKey('policy_papers.id'), nullable=False)
+    status = Column(String(20), default='queued')  # 'queued', 'running', 'completed', 'failed'
+    params = Column(Text)  # JSON-encoded pipeline options
+    responses_done = Column(Integer, default=0)
+    votes_done = Column(Integer, default=0)
+    debate_id = Column(Integer, ForeignKey('debates.id'))
+    result = Column(Text)  # JSON-encoded pipeline result
+    error = Column(Text)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    started_at = Column(DateTime)
+    finished_at = Column(DateTime)
+
+class IdempotencyKey(Base):
+    """Database model for responses stored against client idempotency keys."""
+    __tablename__ = "idempotency_keys"
+
+    key = Column(String(255), primary_key=True)  # '<scope>:<Idempotency-Key header>'
+    request_hash = Column(String(64), nullable=False)
+    status = Column(String(20), default='pending')  # 'pending', 'completed'
+    response = Column(Text)  # JSON-encoded response body
+    created_at = Column(DateTime, default=datetime.utcnow)
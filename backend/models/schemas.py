@@ -1,7 +1,7 @@
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 class DebateBase(BaseModel):
@@ -18,6 +18,7 @@ class DebateResponse(DebateBase):
     """Schema for debate responses."""
     id: int
     status: str
+    rounds: int = 1
     created_at: datetime
     paper_id: Optional[int] = None
 
@@ -34,6 +35,7 @@ class MPResponse(MPResponseBase):
     """Schema for MP responses in debates."""
     id: int
     debate_id: int
+    round_number: int = 1
     timestamp: datetime
 
     class Config:
@@ -71,6 +73,12 @@ class VoteSummary(BaseModel):
     total_votes: int
     result: str
 
+class DebateFullResponse(DebateResponse):
+    """Schema for a debate with its transcript, votes and vote summary."""
+    responses: List[MPResponse] = []
+    votes: List[VoteResponse] = []
+    summary: Dict[str, Any]
+
 class VoteMetricsSummary(BaseModel):
     average_consistency: float
     total_votes: int
@@ -94,3 +102,27 @@ class DebateMetrics(BaseModel):
     vote_decisions: VoteDistribution
     metrics: Optional[Dict[str, float]] = None
     message: Optional[str] = None
+
+class JobStatus(BaseModel):
+    """Schema for background job status."""
+    id: str
+    paper_id: int
+    status: str
+    responses_done: int
+    responses_total: int
+    votes_done: int
+    votes_total: int
+    debate_id: Optional[int] = None
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+class ParliamentVoteRequest(BaseModel):
+    """Schema for putting a debate to a sampled parliament."""
+    members: int = Field(300, ge=1, le=10000)
+    mixture: Optional[Dict[str, float]] = None  # Relative seat share per MP role
+    jitter: float = Field(0.15, ge=0.0, le=1.0)
+    speakers: int = Field(8, ge=0, le=50)  # Members whose reasoning is written by the LLM
+    seed: Optional[int] = None
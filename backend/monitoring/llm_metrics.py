@@ -0,0 +1,114 @@
+import logging
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Deque, Dict, List, Optional
+
+import numpy as np
+
+# USD per million tokens: (prompt, completion)
+MODEL_PRICES = {
+    "gpt-4o-mini": (0.15, 0.60),
+    "gpt-4o": (2.50, 10.00)
+}
+
+
+@dataclass
+class LLMCallMetric:
+    """Stores the outcome of a single LLM call."""
+    call_type: str  # 'response', 'vote', 'topic', 'consistency', 'summary', 'evaluation'
+    mp_role: Optional[str]
+    model: str
+    provider: str
+    prompt_tokens: int
+    completion_tokens: int
+    latency: float
+    outcome: str  # 'ok', 'fallback', 'error'
+    cached: bool
+    timestamp: datetime
+
+    @property
+    def cost(self) -> float:
+        if self.cached or self.provider != "openai":
+            return 0.0
+        prompt_price, completion_price = MODEL_PRICES.get(self.model, (0.0, 0.0))
+        return (
+            self.prompt_tokens * prompt_price + self.completion_tokens * completion_price
+        ) / 1_000_000
+
+
+class LLMTelemetry:
+    """Keeps a bounded history of LLM calls and aggregates it on demand."""
+
+    def __init__(self, max_calls: int = 10000):
+        self.logger = logging.getLogger(__name__)
+        self.metrics: Deque[LLMCallMetric] = deque(maxlen=max_calls)
+
+    def record(self, metric: LLMCallMetric) -> None:
+        """Store a call metric, evicting the oldest once full."""
+        self.metrics.append(metric)
+        if metric.outcome != "ok":
+            self.logger.warning(
+                f"LLM {metric.call_type} call for {metric.mp_role or 'n/a'} ended with "
+                f"{metric.outcome} after {metric.latency:.2f}s"
+            )
+
+    def summary(self, since: Optional[datetime] = None) -> Dict[str, Any]:
+        """
+        Aggregate recorded calls.
+
+        Args:
+            since: Only include calls made at or after this time
+
+        Returns:
+            Dict with overall totals plus breakdowns by call type and MP role
+        """
+        metrics = [m for m in self.metrics if since is None or m.timestamp >= since]
+
+        by_call_type: Dict[str, List[LLMCallMetric]] = {}
+        by_role: Dict[str, List[LLMCallMetric]] = {}
+        for metric in metrics:
+            by_call_type.setdefault(metric.call_type, []).append(metric)
+            if metric.mp_role:
+                by_role.setdefault(metric.mp_role, []).append(metric)
+
+        return {
+            "overall": self._aggregate(metrics),
+            "by_call_type": {name: self._aggregate(group) for name, group in by_call_type.items()},
+            "by_role": {name: self._aggregate(group) for name, group in by_role.items()}
+        }
+
+    @staticmethod
+    def _aggregate(metrics: List[LLMCallMetric]) -> Dict[str, Any]:
+        if not metrics:
+            return {
+                "calls": 0,
+                "ok": 0,
+                "fallback": 0,
+                "error": 0,
+                "cache_hits": 0,
+                "latency": {"mean": 0.0, "p50": 0.0, "p95": 0.0, "p99": 0.0, "max": 0.0},
+                "prompt_tokens": 0,
+                "completion_tokens": 0,
+                "cost_usd": 0.0
+            }
+
+        latencies = np.array([m.latency for m in metrics], dtype=float)
+        p50, p95, p99 = np.percentile(latencies, [50, 95, 99])
+        return {
+            "calls": len(metrics),
+            "ok": sum(1 for m in metrics if m.outcome == "ok"),
+            "fallback": sum(1 for m in metrics if m.outcome == "fallback"),
+            "error": sum(1 for m in metrics if m.outcome == "error"),
+            "cache_hits": sum(1 for m in metrics if m.cached),
+            "latency": {
+                "mean": float(latencies.mean()),
+                "p50": float(p50),
+                "p95": float(p95),
+                "p99": float(p99),
+                "max": float(latencies.max())
+            },
+            "prompt_tokens": sum(m.prompt_tokens for m in metrics),
+            "completion_tokens": sum(m.completion_tokens for m in metrics),
+            "cost_usd": sum(m.cost for m in metrics)
+        }
@@ -0,0 +1,204 @@
+"""
+Drain the backlog of pending policy papers through full debates.
+
+Each paper runs as a debate job, so progress is checkpointed in the
+database the same way as for POST /jobs/full-debate: an interrupted run
+picks up where it stopped, only generating the steps that are missing.
+
+    python orchestrate.py --workers 4 --limit 50 --token-budget 500000
+"""
+import argparse
+import asyncio
+import logging
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+from dotenv import load_dotenv
+
+# DATABASE_URL is read when db.database is imported
+load_dotenv()
+
+from db.database import AsyncSessionLocal, async_engine
+from db.init_db import init_database
+from dependencies import (close_openai_service, get_debate_coordinator,
+                          get_llm_telemetry)
+from repositories.debate_repository import DebateRepository
+from repositories.job_repository import JobRepository
+from services.job_runner import DebateJobRunner
+from services.mp_roles import MP_ROLES
+
+logger = logging.getLogger("orchestrate")
+
+
+class BacklogOrchestrator:
+    """Runs pending papers through full debates with a bounded worker pool."""
+
+    def __init__(
+        self,
+        runner: DebateJobRunner,
+        workers: int = 4,
+        options: Optional[Dict[str, Any]] = None,
+        token_budget: Optional[int] = None,
+        cost_budget: Optional[float] = None
+    ):
+        self.runner = runner
+        self.workers = workers
+        self.options = options or {}
+        self.token_budget = token_budget
+        self.cost_budget = cost_budget
+        self.telemetry = get_llm_telemetry()
+        self.started_at = datetime.utcnow()
+        self.outcomes: List[Dict[str, Any]] = []
+        self.skipped = 0
+
+    def _llm_usage(self) -> Dict[str, Any]:
+        return self.telemetry.summary(since=self.started_at)["overall"]
+
+    def _over_budget(self) -> bool:
+        usage = self._llm_usage()
+        tokens = usage["prompt_tokens"] + usage["completion_tokens"]
+        if self.token_budget is not None and tokens >= self.token_budget:
+            return True
+        return self.cost_budget is not None and usage["cost_usd"] >= self.cost_budget
+
+    async def run(self, paper_ids: List[int]) -> Dict[str, Any]:
+        """
+        Debate the given papers and report throughput.
+
+        Workers stop taking new papers once the token or cost budget is
+        spent; debates already running are finished.
+        """
+        self.started_at = datetime.utcnow()
+        started = time.perf_counter()
+        queue: "asyncio.Queue[int]" = asyncio.Queue()
+        for paper_id in paper_ids:
+            queue.put_nowait(paper_id)
+
+        async def worker() -> None:
+            while not queue.empty():
+                if self._over_budget():
+                    self.skipped += queue.qsize()
+                    while not queue.empty():
+                        queue.get_nowait()
+                    return
+                await self._debate(queue.get_nowait())
+
+        await asyncio.gather(*(worker() for _ in range(max(1, self.workers))))
+        return self._report(time.perf_counter() - started)
+
+    async def _debate(self, paper_id: int) -> None:
+        async with AsyncSessionLocal() as db:
+            # Reuse the checkpointed job of an interrupted run for this paper
+            job = await JobRepository.get_active_job_for_paper(db, paper_id)
+            if job is None:
+                job = await JobRepository.create_job(db, paper_id, self.options)
+            job_id = job.id
+
+        started = time.perf_counter()
+        await self.runner.run_job(job_id)
+        elapsed = time.perf_counter() - started
+
+        async with AsyncSessionLocal() as db:
+            job = await JobRepository.get_job(db, job_id)
+            self.outcomes.append({
+                "paper_id": paper_id,
+                "status": job.status,
+                "seconds": elapsed,
+                "error": job.error
+            })
+        logger.info(f"Paper {paper_id}: {job.status} in {elapsed:.1f}s")
+
+    def _report(self, elapsed: float) -> Dict[str, Any]:
+        usage = self._llm_usage()
+        tokens = usage["prompt_tokens"] + usage["completion_tokens"]
+        minutes = max(elapsed, 1e-9) / 60
+        completed = [o for o in self.outcomes if o["status"] == "completed"]
+        durations = np.array([o["seconds"] for o in completed], dtype=float)
+        return {
+            "papers": len(self.outcomes) + self.skipped,
+            "completed": len(completed),
+            "failed": len(self.outcomes) - len(completed),
+            "skipped_for_budget": self.skipped,
+            "elapsed_seconds": elapsed,
+            "debates_per_minute": len(completed) / minutes,
+            "llm_calls": usage["calls"],
+            "llm_errors": usage["error"] + usage["fallback"],
+            "cache_hits": usage["cache_hits"],
+            "tokens": tokens,
+            "tokens_per_minute": tokens / minutes,
+            "cost_usd": usage["cost_usd"],
+            "debate_seconds_p50": float(np.percentile(durations, 50)) if durations.size else 0.0,
+            "debate_seconds_p95": float(np.percentile(durations, 95)) if durations.size else 0.0,
+            "failures": [
+                {"paper_id": o["paper_id"], "error": o["error"]}
+                for o in self.outcomes if o["status"] != "completed"
+            ]
+        }
+
+
+def print_report(report: Dict[str, Any]) -> None:
+    print("\nBacklog run")
+    print(f"  papers:             {report['papers']}")
+    print(f"  completed:          {report['completed']}")
+    print(f"  failed:             {report['failed']}")
+    print(f"  skipped (budget):   {report['skipped_for_budget']}")
+    print(f"  elapsed:            {report['elapsed_seconds']:.1f}s")
+    print(f"  debates/min:        {report['debates_per_minute']:.2f}")
+    print(f"  debate p50 / p95:   {report['debate_seconds_p50']:.1f}s / {report['debate_seconds_p95']:.1f}s")
+    print(f"  LLM calls:          {report['llm_calls']} ({report['llm_errors']} errors, {report['cache_hits']} cache hits)")
+    print(f"  tokens:             {report['tokens']} ({report['tokens_per_minute']:.0f}/min)")
+    print(f"  cost:               ${report['cost_usd']:.4f}")
+    for failure in report["failures"]:
+        print(f"  ! paper {failure['paper_id']}: {failure['error']}")
+
+
+async def main(args: argparse.Namespace) -> None:
+    init_database()
+    async with AsyncSessionLocal() as db:
+        papers = await DebateRepository.get_papers_to_debate(db, limit=args.limit)
+        paper_ids = [paper.id for paper in papers]
+
+    if not paper_ids:
+        print("No pending papers.")
+        return
+    logger.info(f"Debating {len(paper_ids)} papers with {args.workers} workers")
+
+    # Workers are driven directly here; the runner's own pool is not started
+    runner = DebateJobRunner(coordinator=get_debate_coordinator(), workers=0)
+    orchestrator = BacklogOrchestrator(
+        runner,
+        workers=args.workers,
+        options={
+            "max_concurrency": args.max_concurrency,
+            "independent_openings": args.independent_openings,
+            "rounds": args.rounds
+        },
+        token_budget=args.token_budget,
+        cost_budget=args.cost_budget
+    )
+    try:
+        print_report(await orchestrator.run(paper_ids))
+    finally:
+        await close_openai_service()
+        await async_engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run pending policy papers through full debates.")
+    parser.add_argument("--workers", type=int, default=4, help="Debates to run at once")
+    parser.add_argument("--limit", type=int, default=None, help="Maximum number of papers to take")
+    parser.add_argument("--rounds", type=int, default=1, help="Speaking rounds per debate")
+    parser.add_argument(
+        "--max-concurrency",
+        type=int,
+        default=len(MP_ROLES),
+        choices=range(1, len(MP_ROLES) + 1),
+        help="LLM calls in flight per debate"
+    )
+    parser.add_argument("--independent-openings", action="store_true", help="Generate opening statements in parallel")
+    parser.add_argument("--token-budget", type=int, default=None, help="Stop starting debates after this many tokens")
+    parser.add_argument("--cost-budget", type=float, default=None, help="Stop starting debates after this many USD")
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main(parser.parse_args()))
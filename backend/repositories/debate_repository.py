@@ -1,13 +1,62 @@
-from sqlalchemy.orm import Session
-from typing import List, Optional
-from models.database_models import Debate, MPResponse, Vote, PolicyPaper
+from datetime import datetime
+from sqlalchemy import case, delete, func, insert, literal, or_, select, update
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, selectinload
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from models.database_models import (Debate, MemberVote, MPResponse, Vote,
+                                    PolicyPaper, VoteTally)
 from models.schemas import DebateCreate
+from repositories.pagination import keyset_page
+
+# Fields the list endpoints can return, in output order
+DEBATE_FIELDS = ("id", "title", "description", "policy_text", "status", "rounds", "paper_id", "created_at")
+RESPONSE_FIELDS = ("id", "debate_id", "mp_role", "content", "color", "round_number", "timestamp")
+VOTE_FIELDS = ("id", "debate_id", "mp_role", "vote", "reasoning", "timestamp")
+
+# Tally column per vote choice; votes with any other value are not counted
+TALLY_COLUMNS = {"for": "votes_for", "against": "votes_against", "abstain": "votes_abstain"}
+
+def _tally_result(votes_for, votes_against):
+    """SQL form of services.parliament.vote_result; abstentions do not count towards the majority."""
+    decided = votes_for + votes_against
+    return case(
+        (decided == 0, "abstained"),
+        (votes_for * 2 > decided, "passed"),
+        (votes_against * 2 > decided, "rejected"),
+        else_="tied"
+    )
+
+def _tally_summary(tally: Optional[VoteTally]) -> Dict[str, Any]:
+    """Vote summary of a debate from its tally row, if it has one."""
+    if tally is None:
+        return {"for": 0, "against": 0, "abstain": 0, "total": 0, "result": "abstained"}
+    return {
+        "for": tally.votes_for,
+        "against": tally.votes_against,
+        "abstain": tally.votes_abstain,
+        "total": tally.votes_for + tally.votes_against + tally.votes_abstain,
+        "result": tally.result
+    }
+
+class DuplicateStepError(Exception):
+    """Raised when a debate already has the response or vote being written."""
+
+async def _commit_step(db: AsyncSession, debate_id: int) -> None:
+    """Commit one new response or vote; each MP role speaks once per round and votes once."""
+    try:
+        await db.commit()
+    except IntegrityError as e:
+        await db.rollback()
+        raise DuplicateStepError(f"Debate {debate_id} already has this response or vote") from e
 
 class DebateRepository:
     """Repository for database operations related to debates."""
     
     @staticmethod
-    async def create_debate(db: Session, debate: DebateCreate) -> Debate:
+    async def create_debate(db: AsyncSession, debate: DebateCreate) -> Debate:
         """Create a new debate in the database."""
         db_debate = Debate(
             title=debate.title,
@@ -15,38 +64,92 @@ class DebateRepository:
             policy_text=debate.policy_text
         )
         db.add(db_debate)
-        db.commit()
-        db.refresh(db_debate)
+        await db.commit()
+        await db.refresh(db_debate)
         return db_debate
 
     @staticmethod
-    async def get_debate(db: Session, debate_id: int) -> Optional[Debate]:
+    async def get_debate(db: AsyncSession, debate_id: int) -> Optional[Debate]:
         """Get a debate by ID."""
-        return db.query(Debate).filter(Debate.id == debate_id).first()
+        return await db.get(Debate, debate_id)
+
+    @staticmethod
+    async def list_debates(
+        db: AsyncSession,
+        fields: List[str],
+        cursor: Optional[str] = None,
+        limit: int = 50,
+        status: Optional[str] = None,
+        paper_id: Optional[int] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """List debates newest first, one keyset page at a time."""
+        filters = []
+        if status is not None:
+            filters.append(Debate.status == status)
+        if paper_id is not None:
+            filters.append(Debate.paper_id == paper_id)
+        return await keyset_page(db, Debate, fields, filters, cursor, limit, newest_first=True)
+
+    @staticmethod
+    async def list_responses(
+        db: AsyncSession,
+        debate_id: int,
+        fields: List[str],
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        round_number: Optional[int] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """List a debate's responses in speaking order, one keyset page at a time."""
+        filters = [MPResponse.debate_id == debate_id]
+        if round_number is not None:
+            filters.append(MPResponse.round_number == round_number)
+        return await keyset_page(db, MPResponse, fields, filters, cursor, limit)
+
+    @staticmethod
+    async def list_votes(
+        db: AsyncSession,
+        debate_id: int,
+        fields: List[str],
+        cursor: Optional[str] = None,
+        limit: int = 100
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """List a debate's votes in the order they were cast, one keyset page at a time."""
+        return await keyset_page(db, Vote, fields, [Vote.debate_id == debate_id], cursor, limit)
 
     @staticmethod
     async def add_response(
-        db: Session, 
+        db: AsyncSession, 
         debate_id: int, 
         mp_role: str, 
         content: str,
-        color: str
+        color: str,
+        round_number: Optional[int] = None
     ) -> MPResponse:
-        """Add a response to the debate."""
+        """Add a response to the debate, by default in the role's next round."""
+        if round_number is None:
+            last_round = await db.scalar(
+                select(func.max(MPResponse.round_number)).where(
+                    MPResponse.debate_id == debate_id,
+                    MPResponse.mp_role == mp_role
+                )
+            )
+            round_number = (last_round or 0) + 1
         db_response = MPResponse(
             debate_id=debate_id,
             mp_role=mp_role,
             content=content,
-            color=color
+            color=color,
+            round_number=round_number
         )
         db.add(db_response)
-        db.commit()
-        db.refresh(db_response)
+        await DebateRepository._touch_debate(db, debate_id)
+        await _commit_step(db, debate_id)
+        await db.refresh(db_response)
         return db_response
 
     @staticmethod
     async def add_vote(
-        db: Session, 
+        db: AsyncSession, 
         debate_id: int, 
         mp_role: str, 
         vote: bool, 
@@ -60,18 +163,56 @@ class DebateRepository:
             reasoning=reasoning
         )
         db.add(db_vote)
-        db.commit()
-        db.refresh(db_vote)
+        await DebateRepository._count_votes(db, debate_id, [vote])
+        await DebateRepository._touch_debate(db, debate_id)
+        await _commit_step(db, debate_id)
+        await db.refresh(db_vote)
         return db_vote
 
     @staticmethod
-    async def get_debate_responses(db: Session, debate_id: int) -> List[MPResponse]:
+    async def add_responses(
+        db: AsyncSession,
+        debate_id: int,
+        responses: List[Dict[str, Any]]
+    ) -> List[MPResponse]:
+        """
+        Add several responses to a debate in one transaction.
+
+        Responses for a role and round that already have one, written by
+        another run of the same debate, are skipped.
+
+        Args:
+            db: Database session
+            debate_id: ID of the debate
+            responses: Dicts with mp_role, content, color and round_number
+
+        Returns:
+            The stored responses, in the order they were given
+        """
+        if not responses:
+            return []
+        insert_response = postgresql_insert if db.bind.dialect.name == "postgresql" else sqlite_insert
+        result = await db.scalars(
+            insert_response(MPResponse)
+            .on_conflict_do_nothing(index_elements=["debate_id", "round_number", "mp_role"])
+            .returning(MPResponse, sort_by_parameter_order=True),
+            [{**response, "debate_id": debate_id} for response in responses]
+        )
+        stored = list(result.all())
+        if stored:
+            await DebateRepository._touch_debate(db, debate_id)
+        await db.commit()
+        return stored
+
+    @staticmethod
+    async def get_debate_responses(db: AsyncSession, debate_id: int) -> List[MPResponse]:
         """Get all responses for a debate."""
-        return db.query(MPResponse).filter(MPResponse.debate_id == debate_id).all()
+        result = await db.execute(select(MPResponse).where(MPResponse.debate_id == debate_id))
+        return list(result.scalars().all())
 
     @staticmethod
     async def create_vote(
-        db: Session, 
+        db: AsyncSession, 
         debate_id: int, 
         mp_role: str, 
         vote: str,
@@ -84,34 +225,284 @@ class DebateRepository:
             reasoning=reasoning
         )
         db.add(db_vote)
-        db.commit()
-        db.refresh(db_vote)
+        await DebateRepository._count_votes(db, debate_id, [vote])
+        await DebateRepository._touch_debate(db, debate_id)
+        await _commit_step(db, debate_id)
+        await db.refresh(db_vote)
         return db_vote
 
     @staticmethod
-    async def get_debate_votes(db: Session, debate_id: int) -> List[Vote]:
-        return db.query(Vote).filter(Vote.debate_id == debate_id).all()
+    async def add_votes(
+        db: AsyncSession,
+        debate_id: int,
+        votes: List[Dict[str, Any]],
+        status: Optional[str] = None
+    ) -> List[Vote]:
+        """
+        Add several votes to a debate in one transaction.
+
+        Votes of roles that have already voted, in another run of the same
+        debate, are skipped and not counted.
+
+        Args:
+            db: Database session
+            debate_id: ID of the debate
+            votes: Dicts with mp_role, vote and reasoning
+            status: New status for the debate, set in the same transaction
+
+        Returns:
+            The stored votes, in the order they were given
+        """
+        stored: List[Vote] = []
+        if votes:
+            insert_vote = postgresql_insert if db.bind.dialect.name == "postgresql" else sqlite_insert
+            result = await db.scalars(
+                insert_vote(Vote)
+                .on_conflict_do_nothing(index_elements=["debate_id", "mp_role"])
+                .returning(Vote, sort_by_parameter_order=True),
+                [{**vote, "debate_id": debate_id} for vote in votes]
+            )
+            stored = list(result.all())
+            await DebateRepository._count_votes(db, debate_id, [vote.vote for vote in stored])
+        if stored or status is not None:
+            values = {"status": status} if status is not None else {}
+            await DebateRepository._touch_debate(db, debate_id, **values)
+        await db.commit()
+        return stored
 
     @staticmethod
-    async def create_debate_from_paper(db: Session, paper: PolicyPaper, debate_data: dict) -> Debate:
+    async def _touch_debate(db: AsyncSession, debate_id: int, **values: Any) -> None:
+        """Bump a debate's version, and set any other columns given, in the caller's transaction."""
+        await db.execute(
+            update(Debate).where(Debate.id == debate_id).values(version=Debate.version + 1, **values)
+        )
+
+    @staticmethod
+    async def get_debate_version(db: AsyncSession, debate_id: int) -> Optional[Tuple[int, str]]:
+        """
+        Get the current version and status of a debate without loading it.
+
+        Returns:
+            Tuple of (version, status), or None if the debate does not exist
+        """
+        result = await db.execute(select(Debate.version, Debate.status).where(Debate.id == debate_id))
+        row = result.first()
+        return (row.version, row.status) if row is not None else None
+
+    @staticmethod
+    async def get_debate_votes(db: AsyncSession, debate_id: int) -> List[Vote]:
+        result = await db.execute(select(Vote).where(Vote.debate_id == debate_id))
+        return list(result.scalars().all())
+
+    @staticmethod
+    async def _count_votes(db: AsyncSession, debate_id: int, votes: Iterable[str]) -> None:
+        """
+        Add votes to the debate's tally in the caller's transaction.
+
+        The increment and the new result are a single upsert, so concurrent
+        voters on the same debate cannot lose each other's counts.
+        """
+        counts = {column: 0 for column in TALLY_COLUMNS.values()}
+        for vote in votes:
+            if vote in TALLY_COLUMNS:
+                counts[TALLY_COLUMNS[vote]] += 1
+        if not any(counts.values()):
+            return
+
+        insert_tally = postgresql_insert if db.bind.dialect.name == "postgresql" else sqlite_insert
+        statement = insert_tally(VoteTally).values(
+            debate_id=debate_id,
+            result=_tally_result(literal(counts["votes_for"]), literal(counts["votes_against"])),
+            updated_at=datetime.utcnow(),
+            **counts
+        )
+        # SET expressions all see the row as it was before this update
+        updated = {column: getattr(VoteTally, column) + statement.excluded[column] for column in counts}
+        statement = statement.on_conflict_do_update(
+            index_elements=[VoteTally.debate_id],
+            set_={
+                **updated,
+                "result": _tally_result(updated["votes_for"], updated["votes_against"]),
+                "updated_at": statement.excluded.updated_at
+            }
+        )
+        await db.execute(statement)
+
+    @staticmethod
+    async def get_vote_summary(db: AsyncSession, debate_id: int) -> Dict[str, Any]:
+        """Get the vote counts and result of a debate from its tally."""
+        tally = await db.get(VoteTally, debate_id, populate_existing=True)
+        return _tally_summary(tally)
+
+    @staticmethod
+    async def get_full_debate(
+        db: AsyncSession,
+        debate_id: int
+    ) -> Optional[Tuple[Debate, Dict[str, Any]]]:
+        """
+        Load a debate with its responses, votes and vote summary.
+
+        The debate and its tally come from one joined query and the
+        responses and votes from one IN query each, so a debate of any
+        size costs three queries.
+
+        Args:
+            db: Database session
+            debate_id: ID of the debate
+
+        Returns:
+            Tuple of (debate with responses and votes loaded, vote summary),
+            or None if the debate does not exist
+        """
+        query = (
+            select(Debate)
+            .where(Debate.id == debate_id)
+            .options(
+                joinedload(Debate.tally),
+                selectinload(Debate.responses),
+                selectinload(Debate.votes)
+            )
+            .execution_options(populate_existing=True)
+        )
+        debate = (await db.execute(query)).unique().scalar_one_or_none()
+        if debate is None:
+            return None
+        return debate, _tally_summary(debate.tally)
+
+    @staticmethod
+    async def get_outcome_statistics(
+        db: AsyncSession,
+        since: Optional[datetime] = None
+    ) -> Dict[str, Any]:
+        """
+        Aggregate debate outcomes over the vote tallies.
+
+        Args:
+            db: Database session
+            since: Only count debates that received a vote after this time
+
+        Returns:
+            Dict with debates per result, the pass rate and total votes cast
+        """
+        query = select(
+            VoteTally.result,
+            func.count(),
+            func.sum(VoteTally.votes_for),
+            func.sum(VoteTally.votes_against),
+            func.sum(VoteTally.votes_abstain)
+        ).group_by(VoteTally.result)
+        if since is not None:
+            query = query.where(VoteTally.updated_at >= since)
+
+        by_result = {"passed": 0, "rejected": 0, "tied": 0, "abstained": 0}
+        votes = {choice: 0 for choice in TALLY_COLUMNS}
+        for result, debates, votes_for, against, abstain in await db.execute(query):
+            by_result[result] = debates
+            votes["for"] += votes_for or 0
+            votes["against"] += against or 0
+            votes["abstain"] += abstain or 0
+        debates = sum(by_result.values())
+        return {
+            "debates": debates,
+            "by_result": by_result,
+            "pass_rate": by_result["passed"] / debates if debates else 0.0,
+            "votes": votes
+        }
+
+    @staticmethod
+    async def replace_member_votes(
+        db: AsyncSession,
+        debate_id: int,
+        rows: List[Dict[str, Any]]
+    ) -> None:
+        """Store a parliament vote in one statement, replacing any earlier one."""
+        await db.execute(delete(MemberVote).where(MemberVote.debate_id == debate_id))
+        if rows:
+            await db.execute(insert(MemberVote), [{**row, "debate_id": debate_id} for row in rows])
+        await db.commit()
+
+    @staticmethod
+    async def get_member_vote_counts(db: AsyncSession, debate_id: int) -> Dict[str, Dict[str, int]]:
+        """Count a debate's parliament votes per role and choice in the database."""
+        rows = await db.execute(
+            select(MemberVote.mp_role, MemberVote.vote, func.count(MemberVote.id))
+            .where(MemberVote.debate_id == debate_id)
+            .group_by(MemberVote.mp_role, MemberVote.vote)
+        )
+        counts: Dict[str, Dict[str, int]] = {}
+        for mp_role, vote, count in rows:
+            counts.setdefault(mp_role, {})[vote] = count
+        return counts
+
+    @staticmethod
+    async def get_member_speeches(db: AsyncSession, debate_id: int) -> List[MemberVote]:
+        """Get the parliament votes that came with a written explanation."""
+        result = await db.execute(
+            select(MemberVote)
+            .where(MemberVote.debate_id == debate_id, MemberVote.reasoning.isnot(None))
+            .order_by(MemberVote.member_index)
+        )
+        return list(result.scalars().all())
+
+    @staticmethod
+    async def update_debate_status(db: AsyncSession, debate_id: int, status: str) -> None:
+        """Set the status of a debate."""
+        await DebateRepository._touch_debate(db, debate_id, status=status)
+        await db.commit()
+
+    @staticmethod
+    async def get_latest_debate_for_paper(
+        db: AsyncSession,
+        paper_id: int,
+        status: Optional[str] = None
+    ) -> Optional[Debate]:
+        """Get the most recent debate created from a paper, optionally by status."""
+        query = select(Debate).where(Debate.paper_id == paper_id)
+        if status is not None:
+            query = query.where(Debate.status == status)
+        result = await db.execute(query.order_by(Debate.id.desc()).limit(1))
+        return result.scalars().first()
+
+    @staticmethod
+    async def get_papers_to_debate(db: AsyncSession, limit: Optional[int] = None) -> List[PolicyPaper]:
+        """Get pending papers and papers whose debate was left unfinished, oldest first."""
+        unfinished = select(Debate.paper_id).where(
+            Debate.status == "active",
+            Debate.paper_id.isnot(None)
+        )
+        query = (
+            select(PolicyPaper)
+            .where(or_(PolicyPaper.status == "pending", PolicyPaper.id.in_(unfinished)))
+            .order_by(PolicyPaper.id)
+        )
+        if limit is not None:
+            query = query.limit(limit)
+        result = await db.execute(query)
+        return list(result.scalars().all())
+
+    @staticmethod
+    async def create_debate_from_paper(
+        db: AsyncSession,
+        paper: PolicyPaper,
+        debate_data: dict,
+        rounds: int = 1
+    ) -> Debate:
         """Create a new debate from a policy paper."""
         try:
             db_debate = Debate(
                 title=debate_data["debate_topic"],
                 description=debate_data["background"],
                 policy_text=paper.content,
-                status="active"
+                status="active",
+                rounds=rounds,
+                paper_id=paper.id
             )
             db.add(db_debate)
-            db.commit()
-            db.refresh(db_debate)
-            
-            # Update paper with debate reference
-            paper.debate_id = db_debate.id
             paper.status = "debated"
-            db.commit()
+            paper.version = PolicyPaper.version + 1
+            await db.commit()
             
             return db_debate
         except Exception as e:
-            db.rollback()
+            await db.rollback()
             raise Exception(f"Failed to create debate: {str(e)}")
@@ -0,0 +1,69 @@
+import json
+from datetime import datetime, timedelta
+from typing import Any, Optional, Tuple
+
+from models.database_models import IdempotencyKey
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# Keys older than this can be reused for a new request
+IDEMPOTENCY_KEY_TTL = timedelta(hours=24)
+
+
+class IdempotencyRepository:
+    """Repository for database operations related to idempotency keys."""
+
+    @staticmethod
+    async def claim(db: AsyncSession, key: str, request_hash: str) -> Tuple[IdempotencyKey, bool]:
+        """
+        Reserve a key for a request, or return the record that already holds it.
+
+        The primary key makes the reservation atomic, so of several concurrent
+        requests with the same key exactly one gets claimed=True.
+
+        Args:
+            db: Database session
+            key: Scoped idempotency key
+            request_hash: Fingerprint of the request payload
+
+        Returns:
+            Tuple of (record, claimed)
+        """
+        existing = await db.get(IdempotencyKey, key)
+        if existing is not None and existing.created_at < datetime.utcnow() - IDEMPOTENCY_KEY_TTL:
+            await db.delete(existing)
+            await db.commit()
+            existing = None
+        if existing is not None:
+            return existing, False
+
+        record = IdempotencyKey(key=key, request_hash=request_hash, status="pending")
+        db.add(record)
+        try:
+            await db.commit()
+        except IntegrityError:
+            await db.rollback()
+            return await db.get(IdempotencyKey, key, populate_existing=True), False
+        return record, True
+
+    @staticmethod
+    async def complete(db: AsyncSession, record: IdempotencyKey, response: Any) -> None:
+        """Store the response to replay for later requests with the same key."""
+        record.status = "completed"
+        record.response = json.dumps(response, default=str)
+        await db.commit()
+
+    @staticmethod
+    async def release(db: AsyncSession, key: str) -> None:
+        """Drop a pending key after a failed request so it can be retried."""
+        await db.rollback()
+        await db.execute(delete(IdempotencyKey).where(
+            IdempotencyKey.key == key,
+            IdempotencyKey.status == "pending"
+        ))
+        await db.commit()
+
+    @staticmethod
+    def stored_response(record: IdempotencyKey) -> Optional[Any]:
+        return json.loads(record.response) if record.response else None
@@ -0,0 +1,98 @@
+import json
+import uuid
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from models.database_models import DebateJob
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+class JobRepository:
+    """Repository for database operations related to background jobs."""
+
+    @staticmethod
+    async def create_job(db: AsyncSession, paper_id: int, params: Dict[str, Any]) -> DebateJob:
+        """Create a queued full-debate job."""
+        db_job = DebateJob(
+            id=uuid.uuid4().hex,
+            paper_id=paper_id,
+            status="queued",
+            params=json.dumps(params)
+        )
+        db.add(db_job)
+        await db.commit()
+        await db.refresh(db_job)
+        return db_job
+
+    @staticmethod
+    async def get_job(db: AsyncSession, job_id: str) -> Optional[DebateJob]:
+        """Get a job by ID."""
+        return await db.get(DebateJob, job_id)
+
+    @staticmethod
+    async def get_unfinished_jobs(db: AsyncSession) -> List[DebateJob]:
+        """Get queued and running jobs, oldest first."""
+        result = await db.execute(
+            select(DebateJob)
+            .where(DebateJob.status.in_(["queued", "running"]))
+            .order_by(DebateJob.created_at)
+        )
+        return list(result.scalars().all())
+
+    @staticmethod
+    async def get_active_job_for_paper(db: AsyncSession, paper_id: int) -> Optional[DebateJob]:
+        """Get the queued or running job for a paper, if any."""
+        result = await db.execute(
+            select(DebateJob)
+            .where(DebateJob.paper_id == paper_id)
+            .where(DebateJob.status.in_(["queued", "running"]))
+            .order_by(DebateJob.created_at)
+            .limit(1)
+        )
+        return result.scalars().first()
+
+    @staticmethod
+    async def mark_running(db: AsyncSession, job: DebateJob) -> None:
+        job.status = "running"
+        job.started_at = datetime.utcnow()
+        job.responses_done = 0
+        job.votes_done = 0
+        job.error = None
+        await db.commit()
+
+    @staticmethod
+    async def update_progress(
+        db: AsyncSession,
+        job: DebateJob,
+        responses_done: int,
+        votes_done: int,
+        debate_id: Optional[int] = None
+    ) -> None:
+        job.responses_done = responses_done
+        job.votes_done = votes_done
+        if debate_id is not None:
+            job.debate_id = debate_id
+        await db.commit()
+
+    @staticmethod
+    async def mark_completed(db: AsyncSession, job: DebateJob, result: Dict[str, Any]) -> None:
+        job.status = "completed"
+        job.debate_id = result.get("debate_id")
+        job.result = json.dumps(result, default=str)
+        job.finished_at = datetime.utcnow()
+        await db.commit()
+
+    @staticmethod
+    async def mark_failed(db: AsyncSession, job: DebateJob, error: str) -> None:
+        job.status = "failed"
+        job.error = error
+        job.finished_at = datetime.utcnow()
+        await db.commit()
+
+    @staticmethod
+    async def requeue(db: AsyncSession, job: DebateJob) -> None:
+        """Put an interrupted job back in the queue."""
+        job.status = "queued"
+        job.started_at = None
+        await db.commit()
@@ -0,0 +1,122 @@
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from models.database_models import PolicyPaper
+from repositories.pagination import keyset_page
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# Columns an import refreshes on a paper that already exists; status and
+# debates are left alone so re-importing never resets a debated paper
+ARXIV_UPSERT_COLUMNS = ("title", "content", "summary", "url", "fetched_at")
+
+# Fields the list endpoint can return, in output order
+PAPER_FIELDS = (
+    "id", "arxiv_id", "title", "summary", "content", "source", "url", "status", "created_at", "fetched_at"
+)
+
+
+class PaperRepository:
+    """Repository for database operations related to policy papers."""
+
+    @staticmethod
+    async def get_paper(db: AsyncSession, paper_id: int) -> Optional[PolicyPaper]:
+        """Get a paper by ID."""
+        return await db.get(PolicyPaper, paper_id)
+
+    @staticmethod
+    async def get_paper_version(db: AsyncSession, paper_id: int) -> Optional[int]:
+        """Get the current version of a paper, or None if it does not exist."""
+        return await db.scalar(select(PolicyPaper.version).where(PolicyPaper.id == paper_id))
+
+    @staticmethod
+    async def list_papers(
+        db: AsyncSession,
+        fields: List[str],
+        cursor: Optional[str] = None,
+        limit: int = 50,
+        status: Optional[str] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """List papers newest first, one keyset page at a time."""
+        filters = [PolicyPaper.status == status] if status is not None else []
+        return await keyset_page(db, PolicyPaper, fields, filters, cursor, limit, newest_first=True)
+
+    @staticmethod
+    async def get_fresh_arxiv_papers(
+        db: AsyncSession,
+        limit: int,
+        max_age: timedelta
+    ) -> List[PolicyPaper]:
+        """
+        Get the most recently imported arXiv papers seen within max_age.
+
+        Args:
+            db: Database session
+            limit: Maximum number of papers
+            max_age: How long an imported paper counts as fresh
+
+        Returns:
+            Papers ordered by last import time, newest first
+        """
+        result = await db.execute(
+            select(PolicyPaper)
+            .where(
+                PolicyPaper.arxiv_id.isnot(None),
+                PolicyPaper.fetched_at >= datetime.utcnow() - max_age
+            )
+            .order_by(PolicyPaper.fetched_at.desc(), PolicyPaper.id)
+            .limit(limit)
+        )
+        return list(result.scalars().all())
+
+    @staticmethod
+    async def upsert_arxiv_papers(db: AsyncSession, papers: List[Dict[str, Any]]) -> List[PolicyPaper]:
+        """
+        Insert or refresh papers by arXiv ID in a single statement that
+        also returns the stored rows.
+
+        Args:
+            db: Database session
+            papers: Paper dicts as returned by ArxivService.fetch_ai_papers
+
+        Returns:
+            The stored papers, in the order they were given
+        """
+        if not papers:
+            return []
+
+        fetched_at = datetime.utcnow()
+        rows = {}
+        for paper in papers:
+            # Last occurrence wins if a feed lists a paper twice
+            rows[paper["arxiv_id"]] = {
+                "arxiv_id": paper["arxiv_id"],
+                "title": paper["title"],
+                "content": paper["summary"],
+                "summary": paper["summary"][:500],
+                "url": paper.get("url", ""),
+                "source": "arxiv",
+                "status": "pending",
+                "created_at": fetched_at,
+                "fetched_at": fetched_at
+            }
+
+        insert = postgresql_insert if db.bind.dialect.name == "postgresql" else sqlite_insert
+        statement = insert(PolicyPaper).values(list(rows.values()))
+        statement = statement.on_conflict_do_update(
+            index_elements=[PolicyPaper.arxiv_id],
+            set_={
+                **{column: statement.excluded[column] for column in ARXIV_UPSERT_COLUMNS},
+                "version": PolicyPaper.version + 1
+            }
+        )
+        # One multi-row INSERT; RETURNING spares a second query for the rows
+        result = await db.scalars(
+            statement.returning(PolicyPaper),
+            execution_options={"populate_existing": True}
+        )
+        stored = {paper.arxiv_id: paper for paper in result.all()}
+        await db.commit()
+        return [stored[arxiv_id] for arxiv_id in rows]
@@ -0,0 +1,183 @@
+import re
+from typing import Any, Dict, List, Optional, Sequence
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# Kinds of documents that can be searched
+SEARCH_KINDS = ("papers", "responses", "votes")
+
+# Markers around matched terms in snippets
+SNIPPET_START = "**"
+SNIPPET_END = "**"
+SNIPPET_WORDS = 16
+
+
+def _sqlite_query(fts: str, columns: str, source: str, rank: str) -> str:
+    """
+    FTS5 query ranking every match that passes the filters.
+
+    Setting the rank function in the query lets FTS5 sort by it itself
+    (ORDER BY rank), and snippet only runs for the rows of the page.
+    """
+    return f"""
+        SELECT {columns},
+               snippet({fts}, -1, :start, :end, '...', :words) AS snippet,
+               -{fts}.rank AS score
+        FROM {fts} {source}
+        WHERE {fts} MATCH :query AND {fts}.rank MATCH '{rank}' {{filters}}
+        ORDER BY {fts}.rank
+        LIMIT :limit OFFSET :offset
+    """
+
+
+# SQLite: external-content FTS5 tables kept in sync by triggers (revision 0004)
+_SQLITE_QUERIES = {
+    "papers": _sqlite_query(
+        "policy_papers_fts",
+        "p.id, p.title, p.status",
+        "JOIN policy_papers p ON p.id = policy_papers_fts.rowid",
+        "bm25(10.0, 4.0, 1.0)"
+    ),
+    "responses": _sqlite_query(
+        "mp_responses_fts",
+        "r.id, r.debate_id, d.title AS debate_title, d.status, r.mp_role, r.round_number",
+        "JOIN mp_responses r ON r.id = mp_responses_fts.rowid JOIN debates d ON d.id = r.debate_id",
+        "bm25()"
+    ),
+    "votes": _sqlite_query(
+        "votes_fts",
+        "v.id, v.debate_id, d.title AS debate_title, d.status, v.mp_role, v.vote",
+        "JOIN votes v ON v.id = votes_fts.rowid JOIN debates d ON d.id = v.debate_id",
+        "bm25()"
+    )
+}
+
+# PostgreSQL: generated tsvector columns with GIN indexes (revision 0004).
+# Headlines are only built for the rows that made the page.
+_POSTGRESQL_QUERIES = {
+    "papers": """
+        SELECT hit.id, hit.title, hit.status,
+               ts_headline('english', hit.title || ' - ' || coalesce(hit.summary, ''), hit.query, :headline) AS snippet,
+               hit.score
+        FROM (
+            SELECT p.id, p.title, p.summary, p.status, q AS query, ts_rank_cd(p.search_vector, q) AS score
+            FROM policy_papers p, websearch_to_tsquery('english', :query) q
+            WHERE p.search_vector @@ q {filters}
+            ORDER BY score DESC
+            LIMIT :limit OFFSET :offset
+        ) hit
+        ORDER BY hit.score DESC
+    """,
+    "responses": """
+        SELECT hit.id, hit.debate_id, hit.debate_title, hit.status, hit.mp_role, hit.round_number,
+               ts_headline('english', coalesce(hit.content, ''), hit.query, :headline) AS snippet,
+               hit.score
+        FROM (
+            SELECT r.id, r.debate_id, d.title AS debate_title, d.status, r.mp_role, r.round_number,
+                   r.content, q AS query, ts_rank_cd(r.search_vector, q) AS score
+            FROM mp_responses r
+            JOIN debates d ON d.id = r.debate_id, websearch_to_tsquery('english', :query) q
+            WHERE r.search_vector @@ q {filters}
+            ORDER BY score DESC
+            LIMIT :limit OFFSET :offset
+        ) hit
+        ORDER BY hit.score DESC
+    """,
+    "votes": """
+        SELECT hit.id, hit.debate_id, hit.debate_title, hit.status, hit.mp_role, hit.vote,
+               ts_headline('english', coalesce(hit.reasoning, ''), hit.query, :headline) AS snippet,
+               hit.score
+        FROM (
+            SELECT v.id, v.debate_id, d.title AS debate_title, d.status, v.mp_role, v.vote,
+                   v.reasoning, q AS query, ts_rank_cd(v.search_vector, q) AS score
+            FROM votes v
+            JOIN debates d ON d.id = v.debate_id, websearch_to_tsquery('english', :query) q
+            WHERE v.search_vector @@ q {filters}
+            ORDER BY score DESC
+            LIMIT :limit OFFSET :offset
+        ) hit
+        ORDER BY hit.score DESC
+    """
+}
+
+# Filter columns per kind; papers have a status but no MP role
+_FILTER_COLUMNS = {
+    "papers": {"status": "p.status"},
+    "responses": {"status": "d.status", "mp_role": "r.mp_role"},
+    "votes": {"status": "d.status", "mp_role": "v.mp_role"}
+}
+
+
+def search_terms(query: str) -> List[str]:
+    """Words of a user query; punctuation and search operators are dropped."""
+    return re.findall(r"\w+", query)
+
+
+class SearchRepository:
+    """Repository for full-text search over papers and debate transcripts."""
+
+    @staticmethod
+    async def search(
+        db: AsyncSession,
+        query: str,
+        kinds: Sequence[str] = SEARCH_KINDS,
+        mp_role: Optional[str] = None,
+        status: Optional[str] = None,
+        limit: int = 20,
+        offset: int = 0
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Find the best matches for every word of a query.
+
+        Args:
+            db: Database session
+            query: Free text; every word must match
+            kinds: Which of papers, responses and votes to search
+            mp_role: Only responses and votes of this role
+            status: Only papers, or debates, with this status
+            limit: Maximum hits per kind
+            offset: Number of best hits per kind to skip, for later pages
+
+        Returns:
+            Dict of hits per kind, best first, each with a snippet and score
+
+        Raises:
+            ValueError: If mp_role is given for a kind that has no MP role
+        """
+        for kind in kinds:
+            if mp_role is not None and "mp_role" not in _FILTER_COLUMNS[kind]:
+                raise ValueError(f"Search kind {kind} cannot be filtered by MP role")
+
+        terms = search_terms(query)
+        if not terms:
+            return {kind: [] for kind in kinds}
+
+        if db.bind.dialect.name == "postgresql":
+            queries = _POSTGRESQL_QUERIES
+            params: Dict[str, Any] = {
+                "query": " ".join(terms),
+                "headline": f"StartSel={SNIPPET_START}, StopSel={SNIPPET_END}, "
+                            f"MaxWords={SNIPPET_WORDS}, MinWords={SNIPPET_WORDS // 2}"
+            }
+        else:
+            queries = _SQLITE_QUERIES
+            # Quoting each word keeps FTS5 query syntax out of user input
+            params = {
+                "query": " ".join(f'"{term}"' for term in terms),
+                "start": SNIPPET_START,
+                "end": SNIPPET_END,
+                "words": SNIPPET_WORDS
+            }
+        params.update(limit=limit, offset=offset, status=status, mp_role=mp_role)
+
+        hits: Dict[str, List[Dict[str, Any]]] = {}
+        for kind in kinds:
+            filters = "".join(
+                f" AND {column} = :{name}"
+                for name, column in _FILTER_COLUMNS[kind].items()
+                if params[name] is not None
+            )
+            result = await db.execute(text(queries[kind].format(filters=filters)), params)
+            hits[kind] = [dict(row._mapping) for row in result]
+        return hits
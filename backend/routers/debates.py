@@ -1,22 +1,141 @@
-from typing import Any, Dict, List
+import hashlib
+import json
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple
 
-from db.database import get_db
-from dependencies import get_openai_service, get_vote_monitor
-from fastapi import APIRouter, Depends, HTTPException
-from models.database_models import PolicyPaper
-from models.schemas import DebateCreate, DebateResponse, MPResponse, Vote, VoteResponse
+from db.database import AsyncSessionLocal, get_db
+from dependencies import (get_debate_coordinator, get_openai_service,
+                          get_response_cache, get_vote_monitor)
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
+from models.schemas import (DebateCreate, DebateFullResponse, DebateResponse,
+                            MPResponse, ParliamentVoteRequest)
 from monitoring.vote_metrics import VoteConsistencyMonitor
-from repositories.debate_repository import DebateRepository
+from repositories.debate_repository import (DEBATE_FIELDS, RESPONSE_FIELDS,
+                                           VOTE_FIELDS, DebateRepository,
+                                           DuplicateStepError)
+from repositories.idempotency_repository import IdempotencyRepository
+from repositories.pagination import NEXT_CURSOR_HEADER, select_fields
+from repositories.paper_repository import PaperRepository
+from services.debate_service import (MAX_DEBATE_ROUNDS, DebateService,
+                                     FullDebateCoordinator)
+from services.mp_roles import MP_ROLES
 from services.openai_service import OpenAIService
-from sqlalchemy.orm import Session
+from services.parliament import VOTE_CHOICES, vote_result
+from services.response_cache import ResponseCache, json_response, serialize
+from sqlalchemy.ext.asyncio import AsyncSession
 import logging
 
 router = APIRouter(prefix="/debates", tags=["debates"])
 
+def _sse_event(event: str, data: Dict[str, Any]) -> str:
+    """Format a Server-Sent Events message."""
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+async def _run_idempotent(
+    db: AsyncSession,
+    idempotency_key: Optional[str],
+    scope: str,
+    payload: Dict[str, Any],
+    handler: Callable[[], Awaitable[Any]]
+) -> Any:
+    """
+    Run a write handler at most once per Idempotency-Key.
+
+    Retries with the same key and payload get the stored response back
+    without touching the LLM or the database again.
+
+    Args:
+        db: Database session
+        idempotency_key: Value of the Idempotency-Key header, if sent
+        scope: Endpoint the key is scoped to
+        payload: Request parameters the key must keep matching
+        handler: Performs the request and returns the response body
+
+    Returns:
+        The handler's response, or the stored one for a repeated key
+
+    Raises:
+        HTTPException: If the key is reused with a different payload or
+            the original request is still running
+    """
+    if not idempotency_key:
+        return await handler()
+
+    key = f"{scope}:{idempotency_key}"
+    request_hash = hashlib.sha256(
+        json.dumps(payload, sort_keys=True, default=str).encode("utf-8")
+    ).hexdigest()
+    record, claimed = await IdempotencyRepository.claim(db, key, request_hash)
+    if not claimed:
+        if record.request_hash != request_hash:
+            raise HTTPException(
+                status_code=422,
+                detail="Idempotency-Key was already used with a different request"
+            )
+        if record.status != "completed":
+            raise HTTPException(
+                status_code=409,
+                detail="A request with this Idempotency-Key is still in progress"
+            )
+        return IdempotencyRepository.stored_response(record)
+
+    try:
+        response = jsonable_encoder(await handler())
+    except Exception:
+        await IdempotencyRepository.release(db, key)
+        raise
+    await IdempotencyRepository.complete(db, record, response)
+    return response
+
+async def _respond_for_debate(
+    request: Request,
+    db: AsyncSession,
+    cache: ResponseCache,
+    if_none_match: Optional[str],
+    debate_id: int,
+    build: Callable[[], Awaitable[Any]],
+    headers: Optional[Dict[str, str]] = None
+) -> Response:
+    """
+    Serve a read of a debate with its version as ETag, from the response cache if possible.
+
+    Args:
+        request: The request; its path and query tell cached responses apart
+        db: Database session
+        cache: Shared response cache
+        if_none_match: Value of the If-None-Match header, if sent
+        debate_id: ID of the debate the response is derived from
+        build: Produces the response body on a cache miss
+        headers: Extra headers that build fills in and the cache keeps with the body
+
+    Returns:
+        A 304, the cached body or a freshly built one
+    """
+    headers = {} if headers is None else headers
+
+    async def build_with_headers() -> Tuple[Any, Dict[str, str]]:
+        return await build(), headers
+
+    current = await DebateRepository.get_debate_version(db, debate_id)
+    if current is None:
+        # Nothing to version; build decides between an empty body and a 404
+        body = await build()
+        return Response(content=serialize(body), media_type="application/json", headers=headers)
+    version, status = current
+    return await cache.respond(
+        if_none_match,
+        f"debate-{debate_id}",
+        version,
+        f"{request.url.path}?{request.url.query}",
+        build_with_headers,
+        cache.cache_control(status)
+    )
+
 @router.post("/", response_model=DebateResponse)
 async def create_debate(
     debate: DebateCreate, 
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Create a new debate session."""
     try:
@@ -24,27 +143,129 @@ async def create_debate(
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@router.get("/")
+async def list_debates(
+    cursor: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=500),
+    fields: Optional[str] = None,
+    status: Optional[str] = None,
+    paper_id: Optional[int] = None,
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_db)
+) -> List[Dict[str, Any]]:
+    """
+    List debates, newest first.
+    
+    Pages are keyset-based: pass the X-Next-Cursor header of a page as
+    cursor to get the next one; the header is absent on the last page.
+    The ETag is a hash of the page, so an unchanged page costs a 304.
+    
+    Args:
+        cursor: Cursor of the page to fetch
+        limit: Maximum number of debates per page
+        fields: Comma-separated fields to return, e.g. "id,title,status"
+        status: Only debates with this status
+        paper_id: Only debates of this paper
+        if_none_match: ETag of a copy the client already has
+        db: Database session
+        
+    Returns:
+        List of debates with the requested fields
+    """
+    try:
+        rows, next_cursor = await DebateRepository.list_debates(
+            db,
+            select_fields(fields, DEBATE_FIELDS),
+            cursor=cursor,
+            limit=limit,
+            status=status,
+            paper_id=paper_id
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    headers = {NEXT_CURSOR_HEADER: next_cursor} if next_cursor else {}
+    return json_response(if_none_match, rows, headers)
+
 @router.get("/{debate_id}", response_model=DebateResponse)
 async def get_debate(
-    debate_id: int, 
-    db: Session = Depends(get_db)
+    debate_id: int,
+    request: Request,
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_db),
+    cache: ResponseCache = Depends(get_response_cache)
 ):
-    """Get details of a specific debate."""
-    debate = await DebateRepository.get_debate(db, debate_id)
-    if not debate:
-        raise HTTPException(status_code=404, detail="Debate not found")
-    return debate
+    """
+    Get details of a specific debate.
+    
+    Responses carry the debate's version as ETag; send it back as
+    If-None-Match to get a 304 while the debate is unchanged.
+    """
+    async def build() -> DebateResponse:
+        debate = await DebateRepository.get_debate(db, debate_id)
+        if not debate:
+            raise HTTPException(status_code=404, detail="Debate not found")
+        return DebateResponse.model_validate(debate)
+
+    return await _respond_for_debate(request, db, cache, if_none_match, debate_id, build)
+
+@router.get("/{debate_id}/full", response_model=DebateFullResponse)
+async def get_full_debate(
+    debate_id: int,
+    request: Request,
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_db),
+    cache: ResponseCache = Depends(get_response_cache)
+):
+    """
+    Get a debate with all of its responses, votes and vote summary.
+    
+    Replaces separate calls to the debate, responses, votes and
+    vote-summary endpoints when rendering a whole debate. Cached and
+    revalidated like GET /debates/{debate_id}.
+    
+    Args:
+        debate_id: ID of the debate
+        request: The request
+        if_none_match: ETag of a copy the client already has
+        db: Database session
+        cache: Shared response cache
+        
+    Returns:
+        The debate's details, responses and votes in the order they were
+        stored, and the vote summary
+        
+    Raises:
+        HTTPException: If debate not found
+    """
+    async def build() -> DebateFullResponse:
+        loaded = await DebateRepository.get_full_debate(db, debate_id)
+        if loaded is None:
+            raise HTTPException(status_code=404, detail="Debate not found")
+        debate, summary = loaded
+        return DebateFullResponse(
+            **DebateResponse.model_validate(debate).model_dump(),
+            responses=debate.responses,
+            votes=debate.votes,
+            summary=summary
+        )
+
+    return await _respond_for_debate(request, db, cache, if_none_match, debate_id, build)
 
 @router.post("/{debate_id}/responses", response_model=MPResponse)
 async def add_mp_response(
     debate_id: int,
     mp_role: str,  # Changed from body to query parameter
     content: str = None,  # Optional content
-    db: Session = Depends(get_db),
+    idempotency_key: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_db),
     openai_service: OpenAIService = Depends(get_openai_service)
 ):
-    """Add an AI-generated MP response to the debate."""
-    try:
+    """
+    Add an AI-generated MP response to the debate.
+    
+    Send an Idempotency-Key header to make client retries safe.
+    """
+    async def add_response() -> MPResponse:
         debate = await DebateRepository.get_debate(db, debate_id)
         if not debate:
             raise HTTPException(status_code=404, detail="Debate not found")
@@ -52,53 +273,171 @@ async def add_mp_response(
         debate_history = await DebateRepository.get_debate_responses(db, debate_id)
         
         # Generate AI response if no content provided
-        if content is None:
-            content = await openai_service.generate_mp_response(
+        text = content
+        if text is None:
+            text = await openai_service.generate_mp_response(
                 mp_role,
                 debate.title,
-                debate_history
+                debate_history,
+                priority="interactive"
             )
         
-        return await DebateRepository.add_response(db, debate_id, mp_role, content)
+        mp_color = openai_service.mp_roles.get(mp_role, {}).get("color", "#000000")
+        try:
+            db_response = await DebateRepository.add_response(db, debate_id, mp_role, text, mp_color)
+        except DuplicateStepError:
+            raise HTTPException(status_code=409, detail=f"{mp_role} has already spoken in this round")
+        return MPResponse.model_validate(db_response)
+
+    try:
+        return await _run_idempotent(
+            db,
+            idempotency_key,
+            f"POST /debates/{debate_id}/responses",
+            {"mp_role": mp_role, "content": content},
+            add_response
+        )
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-@router.get("/{debate_id}/responses", response_model=List[MPResponse])
+@router.get("/{debate_id}/responses/stream")
+async def stream_mp_response(
+    debate_id: int,
+    mp_role: str,
+    db: AsyncSession = Depends(get_db),
+    openai_service: OpenAIService = Depends(get_openai_service)
+) -> StreamingResponse:
+    """
+    Stream an AI-generated MP response as Server-Sent Events.
+    
+    Emits a "token" event per generated chunk and, once the completion ends,
+    persists the response and emits a "done" event carrying the stored
+    MPResponse. Failures are reported as an "error" event.
+    """
+    debate = await DebateRepository.get_debate(db, debate_id)
+    if not debate:
+        raise HTTPException(status_code=404, detail="Debate not found")
+    if mp_role not in openai_service.mp_roles:
+        raise HTTPException(status_code=400, detail=f"Unknown MP role: {mp_role}")
+    
+    debate_title = debate.title
+    debate_history = await DebateRepository.get_debate_responses(db, debate_id)
+    mp_color = openai_service.mp_roles[mp_role]["color"]
+    
+    async def event_stream() -> AsyncIterator[str]:
+        parts: List[str] = []
+        try:
+            async for token in openai_service.stream_mp_response(
+                mp_role,
+                debate_title,
+                debate_history
+            ):
+                parts.append(token)
+                yield _sse_event("token", {"content": token})
+        except Exception as e:
+            logging.error(f"Streaming failed for {mp_role}: {str(e)}")
+            yield _sse_event("error", {"detail": str(e)})
+            return
+        
+        # The request-scoped session may already be closed once streaming
+        # starts, so persist through a dedicated session.
+        async with AsyncSessionLocal() as write_db:
+            try:
+                db_response = await DebateRepository.add_response(
+                    write_db,
+                    debate_id,
+                    mp_role,
+                    "".join(parts),
+                    mp_color
+                )
+                yield _sse_event("done", MPResponse.model_validate(db_response).model_dump())
+            except Exception as e:
+                logging.error(f"Failed to persist streamed response for {mp_role}: {str(e)}")
+                yield _sse_event("error", {"detail": str(e)})
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+@router.get("/{debate_id}/responses")
 async def get_debate_responses(
     debate_id: int,
-    db: Session = Depends(get_db)
-):
-    """Get all responses for a debate."""
-    try:
-        return await DebateRepository.get_debate_responses(db, debate_id)
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    request: Request,
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=500),
+    fields: Optional[str] = None,
+    round_number: Optional[int] = None,
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_db),
+    cache: ResponseCache = Depends(get_response_cache)
+) -> List[Dict[str, Any]]:
+    """
+    Get the responses of a debate in speaking order, a page at a time.
+    
+    Pass the X-Next-Cursor header of a page as cursor to get the next one;
+    fields (e.g. "id,mp_role,round_number") leaves out the rest. Pages
+    are cached and revalidated like GET /debates/{debate_id}.
+    """
+    headers: Dict[str, str] = {}
+
+    async def build() -> List[Dict[str, Any]]:
+        try:
+            rows, next_cursor = await DebateRepository.list_responses(
+                db,
+                debate_id,
+                select_fields(fields, RESPONSE_FIELDS),
+                cursor=cursor,
+                limit=limit,
+                round_number=round_number
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=422, detail=str(e))
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=str(e))
+        if next_cursor:
+            headers[NEXT_CURSOR_HEADER] = next_cursor
+        return rows
+
+    return await _respond_for_debate(request, db, cache, if_none_match, debate_id, build, headers)
 
 @router.post("/{debate_id}/votes", response_model=dict)
 async def cast_vote(
     debate_id: int,
     mp_role: str,
-    db: Session = Depends(get_db),
+    idempotency_key: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_db),
     openai_service: OpenAIService = Depends(get_openai_service),
     vote_monitor: VoteConsistencyMonitor = Depends(get_vote_monitor)
 ):
-    """Cast a vote for a specific MP role."""
-    try:
+    """
+    Cast a vote for a specific MP role.
+    
+    Send an Idempotency-Key header to make client retries safe.
+    """
+    async def vote() -> Dict[str, Any]:
         # Get debate details and history
         debate = await DebateRepository.get_debate(db, debate_id)
         if not debate:
             raise HTTPException(status_code=404, detail="Debate not found")
-            
+
+        if any(v.mp_role == mp_role for v in await DebateRepository.get_debate_votes(db, debate_id)):
+            raise HTTPException(status_code=409, detail=f"{mp_role} has already voted")
+
         debate_history = await DebateRepository.get_debate_responses(db, debate_id)
         mp_response = next((r for r in debate_history if r.mp_role == mp_role), None)
-        
+
         # Generate vote decision
         vote_decision = await openai_service.generate_vote_decision(
             mp_role,
             debate.title,
-            debate_history
+            debate_history,
+            priority="interactive"
         )
-        
+
         # Monitor vote consistency if we have an MP response
         consistency_score = None
         if mp_response:
@@ -109,16 +448,19 @@ async def cast_vote(
                 vote_decision,
                 openai_service.vote_service
             )
-        
+
         # Store vote in database
-        db_vote = await DebateRepository.create_vote(
-            db,
-            debate_id=debate_id,
-            mp_role=mp_role,
-            vote=vote_decision["vote"],
-            reasoning=vote_decision["reasoning"]
-        )
-        
+        try:
+            db_vote = await DebateRepository.create_vote(
+                db,
+                debate_id=debate_id,
+                mp_role=mp_role,
+                vote=vote_decision["vote"],
+                reasoning=vote_decision["reasoning"]
+            )
+        except DuplicateStepError:
+            raise HTTPException(status_code=409, detail=f"{mp_role} has already voted")
+
         return {
             "status": "success",
             "vote": db_vote.vote,
@@ -126,83 +468,205 @@ async def cast_vote(
             "mp_role": db_vote.mp_role,
             "debate_id": db_vote.debate_id,
             "timestamp": db_vote.timestamp,
-            "consistency_score": consistency_score
+            "consistency_score": consistency_score,
+            "degraded": vote_decision.get("degraded", False)
         }
-        
+
+    try:
+        return await _run_idempotent(
+            db,
+            idempotency_key,
+            f"POST /debates/{debate_id}/votes",
+            {"mp_role": mp_role},
+            vote
+        )
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500,
             detail=f"Error casting vote: {str(e)}"
         )
 
-@router.get("/{debate_id}/votes", response_model=List[Vote])
+@router.get("/{debate_id}/votes")
 async def get_votes(
     debate_id: int,
-    db: Session = Depends(get_db)
-):
-    """Get all votes for a debate."""
-    return await DebateRepository.get_debate_votes(db, debate_id)
+    request: Request,
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=500),
+    fields: Optional[str] = None,
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_db),
+    cache: ResponseCache = Depends(get_response_cache)
+) -> List[Dict[str, Any]]:
+    """
+    Get the votes of a debate in the order they were cast, a page at a time.
+    
+    Pass the X-Next-Cursor header of a page as cursor to get the next one;
+    fields (e.g. "id,mp_role,vote") leaves out the rest. Pages are cached
+    and revalidated like GET /debates/{debate_id}.
+    """
+    headers: Dict[str, str] = {}
+
+    async def build() -> List[Dict[str, Any]]:
+        try:
+            rows, next_cursor = await DebateRepository.list_votes(
+                db,
+                debate_id,
+                select_fields(fields, VOTE_FIELDS),
+                cursor=cursor,
+                limit=limit
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=422, detail=str(e))
+        if next_cursor:
+            headers[NEXT_CURSOR_HEADER] = next_cursor
+        return rows
+
+    return await _respond_for_debate(request, db, cache, if_none_match, debate_id, build, headers)
 
 @router.get("/{debate_id}/vote-summary")
 async def get_vote_summary(
     debate_id: int,
-    db: Session = Depends(get_db)
+    request: Request,
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_db),
+    cache: ResponseCache = Depends(get_response_cache)
 ) -> Dict[str, Any]:
     """
     Get a summary of the voting results.
     
     Args:
         debate_id: The ID of the debate
+        request: The request
+        if_none_match: ETag of a copy the client already has
         db: Database session
+        cache: Shared response cache
         
     Returns:
         Dict containing vote counts and final result
     """
-    votes = await DebateRepository.get_debate_votes(db, debate_id)
-    
-    summary: Dict[str, Any] = {
-        "for": 0,
-        "against": 0,
-        "abstain": 0,
-        "total": len(votes),
-        "result": None
-    }
+    return await _respond_for_debate(
+        request,
+        db,
+        cache,
+        if_none_match,
+        debate_id,
+        lambda: DebateRepository.get_vote_summary(db, debate_id)
+    )
+
+@router.post("/{debate_id}/parliament-vote")
+async def run_parliament_vote(
+    debate_id: int,
+    request: ParliamentVoteRequest,
+    db: AsyncSession = Depends(get_db),
+    openai_service: OpenAIService = Depends(get_openai_service)
+) -> Dict[str, Any]:
+    """
+    Put a debate to a parliament of many members drawn from a role mixture.
     
-    for vote in votes:
-        summary[vote.vote] += 1
+    Args:
+        debate_id: ID of the debate
+        request: Parliament size, role mixture, jitter, speakers and seed
+        db: Database session
+        openai_service: OpenAI service instance
+        
+    Returns:
+        Dict containing the tally and the sampled members' reasoning
+        
+    Raises:
+        HTTPException: If debate not found or the mixture is invalid
+    """
+    debate = await DebateRepository.get_debate(db, debate_id)
+    if not debate:
+        raise HTTPException(status_code=404, detail="Debate not found")
+    try:
+        return await DebateService(openai_service).run_parliament_vote(
+            db,
+            debate,
+            members=request.members,
+            mixture=request.mixture,
+            jitter=request.jitter,
+            speakers=request.speakers,
+            seed=request.seed
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
+@router.get("/{debate_id}/parliament-vote")
+async def get_parliament_vote(
+    debate_id: int,
+    db: AsyncSession = Depends(get_db)
+) -> Dict[str, Any]:
+    """
+    Get the stored parliament vote of a debate.
     
-    # Calculate voting result
-    if summary["abstain"] == summary["total"]:
-        summary["result"] = "abstained"
-    else:
-        # Only consider non-abstaining votes for the result
-        total_votes = summary["for"] + summary["against"]
-        if total_votes > 0:
-            # Calculate if we have a majority
-            if summary["for"] > total_votes / 2:
-                summary["result"] = "passed"
-            elif summary["against"] > total_votes / 2:
-                summary["result"] = "rejected"
-            else:
-                summary["result"] = "tied"
-        else:
-            summary["result"] = "abstained"
+    Args:
+        debate_id: ID of the debate
+        db: Database session
+        
+    Returns:
+        Dict containing the tally, counted in the database, and the
+        sampled members' reasoning
+    """
+    by_role = await DebateRepository.get_member_vote_counts(db, debate_id)
+    if not by_role:
+        raise HTTPException(status_code=404, detail="No parliament vote for this debate")
     
-    return summary
+    totals = {choice: sum(counts.get(choice, 0) for counts in by_role.values()) for choice in VOTE_CHOICES}
+    speeches = await DebateRepository.get_member_speeches(db, debate_id)
+    return {
+        "debate_id": debate_id,
+        "members": sum(totals.values()),
+        "summary": {
+            **totals,
+            "total": sum(totals.values()),
+            "result": vote_result(totals["for"], totals["against"], totals["abstain"]),
+            "by_role": {
+                role: {choice: counts.get(choice, 0) for choice in VOTE_CHOICES}
+                for role, counts in by_role.items()
+            }
+        },
+        "speeches": [
+            {
+                "member_index": speech.member_index,
+                "mp_role": speech.mp_role,
+                "vote": speech.vote,
+                "score": speech.score,
+                "reasoning": speech.reasoning
+            }
+            for speech in speeches
+        ]
+    }
 
 @router.post("/{paper_id}/start-full-debate")
 async def start_full_debate(
     paper_id: int,
-    db: Session = Depends(get_db),
-    openai_service: OpenAIService = Depends(get_openai_service)
+    max_concurrency: Optional[int] = Query(None, ge=1, le=len(MP_ROLES)),
+    independent_openings: bool = False,
+    rounds: int = Query(1, ge=1, le=MAX_DEBATE_ROUNDS),
+    regenerate: bool = False,
+    db: AsyncSession = Depends(get_db),
+    coordinator: FullDebateCoordinator = Depends(get_debate_coordinator)
 ) -> Dict[str, Any]:
     """
-    Start a debate and generate all MP responses and votes.
+    Get the full debate for a paper, generating all MP responses and votes if needed.
+    
+    A completed debate for the paper is returned from storage unless
+    regenerate is set, and concurrent requests for the same paper share a
+    single generation run. This holds the request open for the whole
+    pipeline; use POST /jobs/full-debate/{paper_id} to run it in the
+    background instead.
     
     Args:
         paper_id: ID of the policy paper
+        max_concurrency: Maximum number of LLM calls in flight at once;
+            one per MP role by default
+        independent_openings: Generate all opening statements in parallel
+        rounds: Number of speaking rounds; later rounds are generated concurrently
+        regenerate: Generate a new debate even if a completed one exists
         db: Database session
-        openai_service: OpenAI service instance
+        coordinator: Shared full-debate coordinator
         
     Returns:
         Dict containing debate details, responses, votes and summary
@@ -211,91 +675,17 @@ async def start_full_debate(
         HTTPException: If paper not found or debate creation fails
     """
     try:
-        # Get the paper and create debate
-        paper = db.query(PolicyPaper).filter(PolicyPaper.id == paper_id).first()
+        paper = await PaperRepository.get_paper(db, paper_id)
         if not paper:
             raise HTTPException(status_code=404, detail="Paper not found")
         
-        # Create the debate with better error handling
-        try:
-            debate_data = await openai_service.create_debate_from_paper(paper)
-            debate = await DebateRepository.create_debate_from_paper(db, paper, debate_data)
-        except Exception as e:
-            logging.error(f"Failed to create debate: {str(e)}")
-            raise HTTPException(status_code=500, detail="Failed to create debate")
-        
-        # Generate responses for all MP roles
-        mp_roles = ["corporate", "academic", "government", "civil_rights"]
-        db_responses: List[MPResponse] = []
-        response_dicts: List[Dict[str, Any]] = []
-        
-        for role in mp_roles:
-            try:
-                mp_color = openai_service.mp_roles[role]["color"]
-                content = await openai_service.generate_mp_response(
-                    role,
-                    debate.title,
-                    db_responses
-                )
-                
-                db_response = await DebateRepository.add_response(
-                    db,
-                    debate.id,
-                    role,
-                    content,
-                    mp_color
-                )
-                db_responses.append(db_response)
-                
-                response_dicts.append({
-                    "id": db_response.id,
-                    "debate_id": db_response.debate_id,
-                    "mp_role": db_response.mp_role,
-                    "content": db_response.content,
-                    "color": db_response.color,
-                    "timestamp": db_response.timestamp
-                })
-            except Exception as e:
-                logging.error(f"Failed to generate response for {role}: {str(e)}")
-                continue
-        
-        # Generate votes with error handling
-        votes = []
-        for role in mp_roles:
-            try:
-                vote_decision = await openai_service.generate_vote_decision(
-                    role,
-                    debate.title,
-                    db_responses
-                )
-                db_vote = await DebateRepository.create_vote(
-                    db,
-                    debate.id,
-                    role,
-                    vote_decision["vote"],
-                    vote_decision["reasoning"]
-                )
-                # Convert DB model to Pydantic model
-                vote_response = VoteResponse.from_orm(db_vote)
-                votes.append(vote_response)
-            except Exception as e:
-                logging.error(f"Failed to generate vote for {role}: {str(e)}")
-                continue
-        
-        # Get vote summary
-        try:
-            summary = await get_vote_summary(debate.id, db)
-        except Exception as e:
-            logging.error(f"Failed to generate vote summary: {str(e)}")
-            summary = {"error": "Failed to generate summary"}
-        
-        return {
-            "debate_id": debate.id,
-            "title": debate.title,
-            "responses": response_dicts,
-            "votes": [vote.model_dump() for vote in votes],  # Convert to dict
-            "summary": summary
-        }
+        return await coordinator.run(
+            paper_id,
+            regenerate=regenerate,
+            max_concurrency=max_concurrency or len(MP_ROLES),
+            independent_openings=independent_openings,
+            rounds=rounds
+        )
         
     except HTTPException:
         raise
@@ -0,0 +1,105 @@
+import json
+from typing import Any, Dict, Optional
+
+from db.database import get_db
+from dependencies import get_job_runner
+from fastapi import APIRouter, Depends, HTTPException, Query
+from models.schemas import JobStatus
+from repositories.job_repository import JobRepository
+from repositories.paper_repository import PaperRepository
+from services.debate_service import MAX_DEBATE_ROUNDS
+from services.job_runner import DebateJobRunner
+from services.mp_roles import MP_ROLES
+from sqlalchemy.ext.asyncio import AsyncSession
+
+router = APIRouter(prefix="/jobs", tags=["jobs"])
+
+@router.post("/full-debate/{paper_id}", status_code=202)
+async def submit_full_debate(
+    paper_id: int,
+    max_concurrency: Optional[int] = Query(None, ge=1, le=len(MP_ROLES)),
+    independent_openings: bool = False,
+    rounds: int = Query(1, ge=1, le=MAX_DEBATE_ROUNDS),
+    regenerate: bool = False,
+    db: AsyncSession = Depends(get_db),
+    job_runner: DebateJobRunner = Depends(get_job_runner)
+) -> Dict[str, Any]:
+    """
+    Queue a full debate for a paper and return immediately.
+
+    If a job for the paper is already queued or running it is returned
+    instead of starting another one.
+
+    Args:
+        paper_id: ID of the policy paper
+        max_concurrency: Maximum number of LLM calls in flight at once;
+            one per MP role by default
+        independent_openings: Generate all opening statements in parallel
+        rounds: Number of speaking rounds; later rounds are generated concurrently
+        regenerate: Generate a new debate even if a completed one exists
+        db: Database session
+        job_runner: Background job runner
+
+    Returns:
+        Dict with the job ID and the URL to poll for its status
+
+    Raises:
+        HTTPException: If paper not found
+    """
+    paper = await PaperRepository.get_paper(db, paper_id)
+    if not paper:
+        raise HTTPException(status_code=404, detail="Paper not found")
+
+    job = await job_runner.submit(
+        paper_id,
+        {
+            "max_concurrency": max_concurrency or len(MP_ROLES),
+            "independent_openings": independent_openings,
+            "rounds": rounds,
+            "regenerate": regenerate
+        }
+    )
+    return {
+        "job_id": job.id,
+        "status": job.status,
+        "status_url": f"/jobs/{job.id}"
+    }
+
+@router.get("/{job_id}", response_model=JobStatus)
+async def get_job_status(
+    job_id: str,
+    db: AsyncSession = Depends(get_db)
+) -> JobStatus:
+    """
+    Get the progress of a background job, and its result once completed.
+
+    Args:
+        job_id: ID of the job
+        db: Database session
+
+    Returns:
+        JobStatus with progress counters, result or error
+
+    Raises:
+        HTTPException: If job not found
+    """
+    job = await JobRepository.get_job(db, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    rounds = json.loads(job.params or "{}").get("rounds", 1)
+    return JobStatus(
+        id=job.id,
+        paper_id=job.paper_id,
+        status=job.status,
+        responses_done=job.responses_done or 0,
+        responses_total=len(MP_ROLES) * rounds,
+        votes_done=job.votes_done or 0,
+        votes_total=len(MP_ROLES),
+        debate_id=job.debate_id,
+        result=json.loads(job.result) if job.result else None,
+        error=job.error,
+        created_at=job.created_at,
+        started_at=job.started_at,
+        finished_at=job.finished_at
+    )
@@ -1,8 +1,60 @@
-from fastapi import APIRouter, HTTPException
-from typing import Dict
+from collections import Counter
+from typing import Any, Dict
+
+from db.database import get_db
+from dependencies import get_turn_tracker
+from fastapi import APIRouter, Depends, HTTPException
+from repositories.debate_repository import DebateRepository
+from services.mp_roles import MP_ROLES
+from services.turn_tracker import DebateTurnTracker
+from sqlalchemy.ext.asyncio import AsyncSession
 
 router = APIRouter(prefix="/moderator", tags=["moderator"])
 
+async def _turn_state(
+    debate_id: int,
+    db: AsyncSession,
+    turn_tracker: DebateTurnTracker
+) -> Dict[str, Any]:
+    """Live turn state of a running debate, or one derived from stored rows."""
+    state = turn_tracker.get(debate_id)
+    if state is not None:
+        state["live"] = True
+        return state
+
+    debate = await DebateRepository.get_debate(db, debate_id)
+    if not debate:
+        raise HTTPException(status_code=404, detail="Debate not found")
+
+    rounds = debate.rounds or 1
+    responses = await DebateRepository.get_debate_responses(db, debate_id)
+    per_round = Counter(response.round_number or 1 for response in responses)
+    current_round = next(
+        (r for r in range(1, rounds + 1) if per_round[r] < len(MP_ROLES)),
+        None
+    )
+    if current_round is None:
+        phase = "completed" if debate.status == "completed" else "voting"
+        spoken = []
+    else:
+        phase = "debating"
+        spoken = [
+            response.mp_role for response in responses
+            if (response.round_number or 1) == current_round
+        ]
+    return {
+        "debate_id": debate_id,
+        "phase": phase,
+        "round": current_round or rounds,
+        "rounds": rounds,
+        "roles": list(MP_ROLES),
+        "speaking": [],
+        "spoken": spoken,
+        "prefetching_round": None,
+        "updated_at": None,
+        "live": False
+    }
+
 @router.post("/validate-response")
 async def validate_response(response: Dict[str, str]):
     """Validate if an MP's response follows parliamentary rules."""
@@ -12,12 +64,52 @@ async def validate_response(response: Dict[str, str]):
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@router.get("/state/{debate_id}")
+async def get_turn_state(
+    debate_id: int,
+    db: AsyncSession = Depends(get_db),
+    turn_tracker: DebateTurnTracker = Depends(get_turn_tracker)
+) -> Dict[str, Any]:
+    """
+    Get the turn state of a debate.
+    
+    Args:
+        debate_id: ID of the debate
+        db: Database session
+        turn_tracker: Live turn state of running debates
+        
+    Returns:
+        Dict with the phase, current round, MPs speaking now and MPs who
+        have already spoken this round; live is false when the debate is
+        not being run by this process and the state comes from storage
+    """
+    return await _turn_state(debate_id, db, turn_tracker)
+
 @router.post("/next-turn/{debate_id}")
-async def get_next_turn(debate_id: int):
+async def get_next_turn(
+    debate_id: int,
+    db: AsyncSession = Depends(get_db),
+    turn_tracker: DebateTurnTracker = Depends(get_turn_tracker)
+):
     """Determine which MP should speak next."""
     try:
-        # Implementation for turn management
-        return {"next_mp": "corporate_representative", "time_limit": 120}
+        state = await _turn_state(debate_id, db, turn_tracker)
+        if state["phase"] != "debating":
+            next_mp = None
+        elif state["speaking"]:
+            next_mp = state["speaking"][0]
+        else:
+            next_mp = next((role for role in state["roles"] if role not in state["spoken"]), None)
+        return {
+            "next_mp": next_mp,
+            "time_limit": 120,
+            "round": state["round"],
+            "rounds": state["rounds"],
+            "phase": state["phase"],
+            "speaking": state["speaking"],
+            "live": state["live"]
+        }
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
-
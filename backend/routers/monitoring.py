@@ -1,12 +1,23 @@
 from datetime import datetime, timedelta
-from typing import Dict, List
+from typing import Any, Dict, List, Optional
 
 from db.database import get_db
-from dependencies import get_vote_monitor  # Add this import
+from dependencies import (get_debate_coordinator, get_llm_cache,
+                          get_llm_resilience, get_llm_telemetry,
+                          get_rate_limiter, get_response_cache,
+                          get_vote_monitor)
 from fastapi import APIRouter, Depends
 from models.schemas import DebateMetrics, VoteDistribution
+from monitoring.llm_metrics import LLMTelemetry
 from monitoring.vote_metrics import VoteConsistencyMonitor
-from sqlalchemy.orm import Session
+from repositories.debate_repository import DebateRepository
+from services.debate_service import FullDebateCoordinator
+from services.llm_cache import LLMCompletionCache
+from services.llm_resilience import ResilientCaller
+from services.mp_roles import MP_ROLES
+from services.rate_limiter import LLMRateLimiter
+from services.response_cache import ResponseCache
+from sqlalchemy.ext.asyncio import AsyncSession
 
 router = APIRouter(prefix="/monitoring", tags=["monitoring"])
 
@@ -63,7 +74,7 @@ async def get_role_metrics(
     """Get voting metrics broken down by MP role."""
     role_metrics = {}
     
-    for role in ["corporate", "academic", "government", "civil_rights"]:
+    for role in MP_ROLES:
         role_votes = [m for m in vote_monitor.metrics if m.mp_role == role]
         if role_votes:
             role_metrics[role] = {
@@ -92,7 +103,7 @@ async def get_debate_metrics(
         return DebateMetrics(
             debate_id=debate_id,
             average_consistency=0.0,
-            votes_by_role={role: 0 for role in ["corporate", "academic", "government", "civil_rights"]},
+            votes_by_role={role: 0 for role in MP_ROLES},
             vote_decisions=VoteDistribution(for_votes=0, against_votes=0, abstain_votes=0),
             metrics=None,
             message="No metrics found for this debate"
@@ -103,7 +114,7 @@ async def get_debate_metrics(
         average_consistency=sum(m.consistency_score for m in debate_metrics) / len(debate_metrics),
         votes_by_role={
             role: len([m for m in debate_metrics if m.mp_role == role])
-            for role in ["corporate", "academic", "government", "civil_rights"]
+            for role in MP_ROLES
         },
         vote_decisions=VoteDistribution(
             for_votes=len([m for m in debate_metrics if m.vote_decision == "for"]),
@@ -111,3 +122,98 @@ async def get_debate_metrics(
             abstain_votes=len([m for m in debate_metrics if m.vote_decision == "abstain"])
         )
     )
+
+@router.get("/llm-cache")
+async def get_llm_cache_metrics(
+    cache: Optional[LLMCompletionCache] = Depends(get_llm_cache)
+) -> Dict[str, Any]:
+    """Get hit/miss counters for the LLM completion cache."""
+    if cache is None:
+        return {"enabled": False}
+    return {"enabled": True, **cache.stats()}
+
+@router.get("/response-cache")
+async def get_response_cache_metrics(
+    cache: ResponseCache = Depends(get_response_cache)
+) -> Dict[str, Any]:
+    """Get hit/miss, 304 and invalidation counters for the debate and paper response cache."""
+    return cache.stats()
+
+@router.get("/llm-rate-limiter")
+async def get_llm_rate_limiter_metrics(
+    rate_limiter: LLMRateLimiter = Depends(get_rate_limiter)
+) -> Dict[str, Any]:
+    """Get queue depth and admission wait times for LLM calls."""
+    return rate_limiter.stats()
+
+@router.get("/llm-resilience")
+async def get_llm_resilience_metrics(
+    resilience: ResilientCaller = Depends(get_llm_resilience)
+) -> Dict[str, Any]:
+    """Get retry, hedging and deadline counters for LLM calls."""
+    return resilience.stats()
+
+@router.get("/full-debates")
+async def get_full_debate_metrics(
+    coordinator: FullDebateCoordinator = Depends(get_debate_coordinator)
+) -> Dict[str, Any]:
+    """Get how full-debate requests were served: generated, coalesced or reused."""
+    return {**coordinator.stats, "in_flight": coordinator.in_flight()}
+
+@router.get("/llm")
+async def get_llm_metrics(
+    time_window: str = "24h",
+    telemetry: LLMTelemetry = Depends(get_llm_telemetry)
+) -> Dict[str, Any]:
+    """
+    Get per-call LLM latency, token and cost aggregates.
+    
+    Args:
+        time_window: Time window for metrics (1h, 24h, 7d, all)
+        telemetry: LLM call telemetry store
+        
+    Returns:
+        Dict containing overall, per-call-type and per-role aggregates
+    """
+    now = datetime.utcnow()
+    time_thresholds = {
+        "1h": now - timedelta(hours=1),
+        "24h": now - timedelta(hours=24),
+        "7d": now - timedelta(days=7),
+        "all": None
+    }
+    threshold = time_thresholds.get(time_window, time_thresholds["24h"])
+    
+    return {
+        "time_window": time_window,
+        **telemetry.summary(since=threshold)
+    }
+
+@router.get("/vote-outcomes")
+async def get_vote_outcomes(
+    time_window: str = "all",
+    db: AsyncSession = Depends(get_db)
+) -> Dict[str, Any]:
+    """
+    Get how debates were decided, aggregated over the per-debate vote tallies.
+    
+    Args:
+        time_window: Only debates voted on within this window (24h, 7d, 30d, all)
+        db: Database session
+        
+    Returns:
+        Dict containing debates per result, the pass rate and votes cast
+    """
+    now = datetime.utcnow()
+    time_thresholds = {
+        "24h": now - timedelta(hours=24),
+        "7d": now - timedelta(days=7),
+        "30d": now - timedelta(days=30),
+        "all": None
+    }
+    threshold = time_thresholds.get(time_window, time_thresholds["all"])
+    
+    return {
+        "time_window": time_window,
+        **await DebateRepository.get_outcome_statistics(db, since=threshold)
+    }
@@ -1,14 +1,19 @@
 import logging
-from typing import List
+import os
+from datetime import timedelta
+from typing import Any, Dict, List, Optional, Tuple
 
 from db.database import get_db
-from dependencies import get_arxiv_service, get_openai_service
-from fastapi import APIRouter, Body, Depends, HTTPException
+from dependencies import get_arxiv_service, get_openai_service, get_response_cache
+from fastapi import APIRouter, Body, Depends, Header, HTTPException, Query, Request
 from models.database_models import Debate, PolicyPaper
 from repositories.debate_repository import DebateRepository
+from repositories.pagination import NEXT_CURSOR_HEADER, select_fields
+from repositories.paper_repository import PAPER_FIELDS, PaperRepository
 from services.arxiv_service import ArxivService
 from services.openai_service import OpenAIService
-from sqlalchemy.orm import Session
+from services.response_cache import ResponseCache, json_response
+from sqlalchemy.ext.asyncio import AsyncSession
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
@@ -16,51 +21,87 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/papers", tags=["papers"])
 
+def _paper_summary(paper: PolicyPaper) -> dict:
+    return {
+        "id": paper.id,
+        "arxiv_id": paper.arxiv_id,
+        "title": paper.title,
+        "status": paper.status
+    }
+
+@router.get("/")
+async def list_papers(
+    cursor: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=500),
+    fields: Optional[str] = None,
+    status: Optional[str] = None,
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_db)
+) -> List[Dict[str, Any]]:
+    """
+    List policy papers, newest first.
+    
+    Pages are keyset-based: pass the X-Next-Cursor header of a page as
+    cursor to get the next one; the header is absent on the last page.
+    Use fields (e.g. "id,title,status") to leave out the paper content.
+    The ETag is a hash of the page, so an unchanged page costs a 304.
+    """
+    try:
+        rows, next_cursor = await PaperRepository.list_papers(
+            db,
+            select_fields(fields, PAPER_FIELDS),
+            cursor=cursor,
+            limit=limit,
+            status=status
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    headers = {NEXT_CURSOR_HEADER: next_cursor} if next_cursor else {}
+    return json_response(if_none_match, rows, headers)
+
 @router.post("/arxiv/import", response_model=List[dict])
 async def import_arxiv_papers(
     max_results: int = 10,
-    db: Session = Depends(get_db),
+    refresh: bool = False,
+    db: AsyncSession = Depends(get_db),
     arxiv_service: ArxivService = Depends(get_arxiv_service)
 ):
-    """Import papers from ArXiv."""
+    """
+    Import papers from ArXiv.
+    
+    Papers are keyed on their arXiv ID, so importing the same papers again
+    refreshes them instead of adding duplicates. If the last imports already
+    stored max_results papers within ARXIV_IMPORT_TTL_SECONDS, those are
+    returned without contacting ArXiv unless refresh is set.
+    """
     try:
-        # Fetch papers from ArXiv
-        papers = await arxiv_service.fetch_ai_papers(max_results)
-        
-        stored_papers = []
-        for paper_data in papers:
-            paper = PolicyPaper(
-                title=paper_data['title'],
-                content=paper_data['summary'],
-                summary=paper_data['summary'][:500],
-                url=paper_data.get('url', ''),
-                source='arxiv',
-                status='pending'
+        if not refresh:
+            fresh = await PaperRepository.get_fresh_arxiv_papers(
+                db,
+                max_results,
+                timedelta(seconds=float(os.getenv("ARXIV_IMPORT_TTL_SECONDS", "900")))
             )
-            db.add(paper)
-            db.flush()
-            stored_papers.append({
-                "id": paper.id,
-                "title": paper.title,
-                "status": paper.status
-            })
+            if len(fresh) >= max_results:
+                return [_paper_summary(paper) for paper in fresh]
         
-        db.commit()
-        return stored_papers
+        # Fetch papers from ArXiv
+        papers = await arxiv_service.fetch_ai_papers(max_results)
+        stored_papers = await PaperRepository.upsert_arxiv_papers(db, papers)
+        return [_paper_summary(paper) for paper in stored_papers]
         
     except Exception as e:
         logger.error(f"Error importing papers: {str(e)}")
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.post("/{paper_id}/debate")
 async def start_debate(
     paper_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     openai_service: OpenAIService = Depends(get_openai_service)
 ):
     """Start a debate for a specific paper."""
-    paper = db.query(PolicyPaper).filter(PolicyPaper.id == paper_id).first()
+    paper = await PaperRepository.get_paper(db, paper_id)
     if not paper:
         raise HTTPException(status_code=404, detail="Paper not found")
     
@@ -76,7 +117,8 @@ async def start_debate(
     
     db.add(debate)
     paper.status = "debated"
-    db.commit()
+    paper.version = PolicyPaper.version + 1
+    await db.commit()
     
     return {
         "debate_id": debate.id,
@@ -87,11 +129,19 @@ async def start_debate(
 @router.get("/{paper_id}", response_model=dict)
 async def get_paper_details(
     paper_id: int,
-    db: Session = Depends(get_db)
+    request: Request,
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_db),
+    cache: ResponseCache = Depends(get_response_cache)
 ):
-    """Get details of a specific policy paper."""
-    try:
-        paper = db.query(PolicyPaper).filter(PolicyPaper.id == paper_id).first()
+    """
+    Get details of a specific policy paper.
+    
+    Responses carry the paper's version as ETag; send it back as
+    If-None-Match to get a 304 while the paper is unchanged.
+    """
+    async def build() -> Tuple[Dict[str, Any], Dict[str, str]]:
+        paper = await PaperRepository.get_paper(db, paper_id)
         if not paper:
             raise HTTPException(status_code=404, detail="Paper not found")
         return {
@@ -102,6 +152,21 @@ async def get_paper_details(
             "source": paper.source,
             "url": paper.url,
             "status": paper.status
-        }
+        }, {}
+
+    try:
+        version = await PaperRepository.get_paper_version(db, paper_id)
+        if version is None:
+            raise HTTPException(status_code=404, detail="Paper not found")
+        return await cache.respond(
+            if_none_match,
+            f"paper-{paper_id}",
+            version,
+            request.url.path,
+            build,
+            cache.cache_control()
+        )
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -0,0 +1,59 @@
+from typing import Any, Dict, List, Optional
+
+from db.database import get_db
+from fastapi import APIRouter, Depends, HTTPException, Query
+from repositories.search_repository import SEARCH_KINDS, SearchRepository
+from sqlalchemy.ext.asyncio import AsyncSession
+
+router = APIRouter(prefix="/search", tags=["search"])
+
+@router.get("/")
+async def search(
+    q: str = Query(..., min_length=1, max_length=200),
+    kinds: Optional[List[str]] = Query(None),
+    mp_role: Optional[str] = None,
+    status: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0, le=10000),
+    db: AsyncSession = Depends(get_db)
+) -> Dict[str, Any]:
+    """
+    Full-text search over policy papers, MP responses and vote reasoning.
+    
+    Args:
+        q: Search text; every word must match, stemmed
+        kinds: Any of papers, responses and votes; all of them by default,
+            or responses and votes when filtering by mp_role
+        mp_role: Only responses and votes of this MP role
+        status: Only papers, or responses and votes of debates, with this status
+        limit: Maximum hits per kind
+        offset: Number of best hits per kind to skip, for later pages
+        db: Database session
+        
+    Returns:
+        Dict with ranked hits per kind, each with a highlighted snippet
+        
+    Raises:
+        HTTPException: If an unknown kind is requested, or papers are
+            searched with an mp_role filter
+    """
+    if kinds is None:
+        # Papers have no MP role, so a role filter leaves them out
+        kinds = [kind for kind in SEARCH_KINDS if mp_role is None or kind != "papers"]
+    unknown = set(kinds) - set(SEARCH_KINDS)
+    if unknown:
+        raise HTTPException(status_code=422, detail=f"Unknown search kinds: {', '.join(sorted(unknown))}")
+    
+    try:
+        hits = await SearchRepository.search(
+            db,
+            q,
+            kinds=[kind for kind in SEARCH_KINDS if kind in kinds],
+            mp_role=mp_role,
+            status=status,
+            limit=limit,
+            offset=offset
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    return {"query": q, **hits}
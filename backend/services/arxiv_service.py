@@ -1,4 +1,5 @@
 import asyncio
+import re
 import xml.etree.ElementTree as ET
 from typing import List, Optional, Dict
 import httpx
@@ -9,6 +10,14 @@ import logging
 logging.basicConfig(level=logging.DEBUG)  # Changed to DEBUG level
 logger = logging.getLogger(__name__)
 
+# 'http://arxiv.org/abs/2401.01234v2' -> '2401.01234', 'http://arxiv.org/abs/cs/0101001v1' -> 'cs/0101001'
+ARXIV_ID_PATTERN = re.compile(r"arxiv\.org/abs/(.+?)(?:v\d+)?$")
+
+def parse_arxiv_id(entry_id: str) -> Optional[str]:
+    """Extract the version-less arXiv identifier from an Atom entry id."""
+    match = ARXIV_ID_PATTERN.search(entry_id.strip())
+    return match.group(1) if match else None
+
 class ArxivService:
     """Service to interact with ArXiv API."""
     
@@ -62,12 +71,18 @@ class ArxivService:
             for i, entry in enumerate(entries, 1):
                 try:
                     # Basic required fields
+                    id_elem = entry.find('atom:id', self.namespaces)
                     title_elem = entry.find('atom:title', self.namespaces)
                     summary_elem = entry.find('atom:summary', self.namespaces)
                     
                     if title_elem is None or summary_elem is None:
                         logger.warning(f"Entry {i} missing title or summary")
                         continue
+                    
+                    arxiv_id = parse_arxiv_id(id_elem.text) if id_elem is not None and id_elem.text else None
+                    if arxiv_id is None:
+                        logger.warning(f"Entry {i} has no arXiv id")
+                        continue
                         
                     title = title_elem.text.strip()
                     summary = summary_elem.text.strip()
@@ -75,6 +90,7 @@ class ArxivService:
                     logger.debug(f"Processing paper {i}: {title[:50]}...")
 
                     paper = {
+                        'arxiv_id': arxiv_id,
                         'title': title,
                         'summary': summary,
                         'content': f"Title: {title}\n\nAbstract:\n{summary}",
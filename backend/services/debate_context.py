@@ -0,0 +1,148 @@
+import asyncio
+import logging
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+import tiktoken
+from models.database_models import MPResponse
+
+logger = logging.getLogger(__name__)
+
+# (previous summary, newly evicted turns, max summary tokens) -> new summary
+Summarizer = Callable[[str, List[str], int], Awaitable[str]]
+
+
+class TokenCounter:
+    """Counts tokens with the model's tiktoken encoding."""
+
+    def __init__(self, model: str):
+        self.encoding: Optional[tiktoken.Encoding] = None
+        try:
+            self.encoding = tiktoken.encoding_for_model(model)
+        except KeyError:
+            self.encoding = tiktoken.get_encoding("o200k_base")
+        except Exception as e:
+            # Encodings are downloaded on first use; stay usable offline
+            logger.warning(f"Could not load tiktoken encoding for {model}, estimating tokens: {str(e)}")
+        # The same turns are counted on every prompt of a debate
+        self.count = lru_cache(maxsize=4096)(self._count)
+
+    def _count(self, text: str) -> int:
+        if self.encoding is None:
+            return len(text) // 4 + 1
+        return len(self.encoding.encode(text))
+
+    def truncate(self, text: str, max_tokens: int) -> str:
+        """Cut text down to at most max_tokens tokens."""
+        if self.encoding is None:
+            return text[:max_tokens * 4]
+        tokens = self.encoding.encode(text)
+        if len(tokens) <= max_tokens:
+            return text
+        return self.encoding.decode(tokens[:max_tokens])
+
+
+class DebateContextManager:
+    """
+    Keeps the debate history in MP prompts within a fixed token budget.
+
+    The newest turns are kept verbatim. Turns that no longer fit are folded
+    into a per-debate running summary, which is updated incrementally as more
+    turns fall out of the window and reused across calls. Summaries are kept
+    for the max_debates most recently prompted debates; finished debates
+    should be dropped with forget().
+    """
+
+    def __init__(
+        self,
+        summarize: Summarizer,
+        token_counter: TokenCounter,
+        token_budget: int = 2000,
+        summary_budget: int = 400,
+        max_debates: int = 256
+    ):
+        self.summarize = summarize
+        self.tokens = token_counter
+        self.token_budget = token_budget
+        self.summary_budget = min(summary_budget, token_budget // 2)
+        self.max_debates = max_debates
+        # debate_id -> (number of turns covered, summary text)
+        self._summaries: Dict[int, Tuple[int, str]] = {}
+        # Least recently prompted debate first
+        self._locks: "OrderedDict[int, asyncio.Lock]" = OrderedDict()
+
+    async def build_history(self, debate_history: List[MPResponse]) -> str:
+        """
+        Render the debate history for a prompt.
+
+        Args:
+            debate_history: Responses in speaking order
+
+        Returns:
+            str: Summary of older turns (if any) followed by recent turns
+        """
+        turns = [f"{response.mp_role}: {response.content}" for response in debate_history]
+        if not turns:
+            return ""
+        if sum(self.tokens.count(turn) for turn in turns) <= self.token_budget:
+            return "\n".join(turns)
+
+        debate_id = debate_history[0].debate_id
+        lock = self._lock_for(debate_id)
+        async with lock:
+            covered, summary = self._summaries.get(debate_id, (0, ""))
+            if covered > len(turns):
+                # History is not an extension of what we summarised; start over
+                covered, summary = 0, ""
+
+            verbatim_budget = self.token_budget - self.summary_budget
+            cut = self._verbatim_start(turns, verbatim_budget)
+            # Never re-expand turns that are already in the summary
+            cut = max(cut, covered)
+
+            if cut > covered:
+                summary = await self.summarize(summary, turns[covered:cut], self.summary_budget)
+                summary = self.tokens.truncate(summary, self.summary_budget)
+                covered = cut
+                self._summaries[debate_id] = (covered, summary)
+
+        recent = turns[covered:]
+        if recent and self.tokens.count(recent[-1]) > verbatim_budget:
+            recent = [self.tokens.truncate(recent[-1], verbatim_budget)]
+
+        sections = []
+        if summary:
+            sections.append(f"Summary of earlier discussion:\n{summary}")
+        if recent:
+            sections.append("\n".join(recent))
+        return "\n\n".join(sections)
+
+    def forget(self, debate_id: int) -> None:
+        """Drop the cached summary for a debate."""
+        self._summaries.pop(debate_id, None)
+        self._locks.pop(debate_id, None)
+
+    def _lock_for(self, debate_id: int) -> asyncio.Lock:
+        """Get the debate's lock, dropping the least recently used idle debates beyond max_debates."""
+        lock = self._locks.get(debate_id)
+        if lock is None:
+            lock = self._locks[debate_id] = asyncio.Lock()
+        self._locks.move_to_end(debate_id)
+        excess = len(self._locks) - self.max_debates
+        for stale in list(self._locks)[:max(0, excess)]:
+            if not self._locks[stale].locked():
+                self.forget(stale)
+        return lock
+
+    def _verbatim_start(self, turns: List[str], budget: int) -> int:
+        """Index of the oldest turn that still fits in the verbatim window."""
+        used = 0
+        start = len(turns)
+        for index in range(len(turns) - 1, -1, -1):
+            used += self.tokens.count(turns[index])
+            if used > budget:
+                break
+            start = index
+        # Always keep the latest turn, truncated later if needed
+        return min(start, len(turns) - 1)
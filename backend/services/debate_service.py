@@ -1,13 +1,679 @@
-from typing import List, Dict
-from datetime import datetime
+import asyncio
+import logging
+from contextlib import nullcontext
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, TypeVar, Union
+
+from db.database import AsyncSessionLocal
+from models.database_models import Debate, MPResponse, PolicyPaper
+from models.schemas import VoteResponse
+from repositories.debate_repository import DebateRepository
+from repositories.paper_repository import PaperRepository
+from services.mp_roles import MP_ROLES
+from services.openai_service import OpenAIService
+from services.parliament import VOTE_CHOICES, Parliament
+from services.turn_tracker import DebateTurnTracker
+from sqlalchemy.ext.asyncio import AsyncSession
+
+T = TypeVar("T")
+
+# Called with (debate_id, responses_done, votes_done) as the pipeline advances
+ProgressCallback = Callable[[int, int, int], Awaitable[None]]
+
+MAX_DEBATE_ROUNDS = 10
+
+# (paper_id, rounds, regenerate, debate_id) of a coordinated run
+RunKey = Tuple[int, int, bool, Optional[int]]
+
+
+def _response_dict(response: MPResponse) -> Dict[str, Any]:
+    return {
+        "id": response.id,
+        "debate_id": response.debate_id,
+        "mp_role": response.mp_role,
+        "content": response.content,
+        "color": response.color,
+        "round_number": response.round_number or 1,
+        "timestamp": response.timestamp
+    }
+
+
+def _round_of(response: MPResponse) -> int:
+    return response.round_number or 1
+
+
+async def _run_bounded(semaphore: asyncio.Semaphore, coro: Awaitable[T]) -> T:
+    """Await a coroutine while holding a slot of the given semaphore."""
+    async with semaphore:
+        return await coro
+
 
 class DebateService:
-    def __init__(self, openai_service, db_service):
+    """Runs the full debate pipeline for a policy paper."""
+
+    def __init__(
+        self,
+        openai_service: OpenAIService,
+        turn_tracker: Optional[DebateTurnTracker] = None
+    ):
         """Initialize debate service with dependencies."""
         self.openai = openai_service
-        self.db = db_service
-    
-    async def start_debate(self, topic: str) -> Dict:
-        """Initialize a new debate session."""
-        # ... implementation
+        self.turns = turn_tracker or DebateTurnTracker()
+
+    async def run_full_debate(
+        self,
+        db: AsyncSession,
+        paper: PolicyPaper,
+        max_concurrency: int = 4,
+        independent_openings: bool = False,
+        rounds: int = 1,
+        resume: bool = True,
+        debate_id: Optional[int] = None,
+        on_progress: Optional[ProgressCallback] = None
+    ) -> Dict[str, Any]:
+        """
+        Create a debate from a paper and run all rounds of speeches and the votes.
+
+        The pipeline is a series of persisted steps: the topic (the debate
+        row), one response per MP per round and one vote per MP. Each round's
+        responses are written in one transaction, as are the votes together
+        with the completed status, so a debate costs a handful of commits
+        rather than one per step. Sequential opening speeches are the
+        exception and are written one by one as they are made. With resume,
+        the paper's latest unfinished debate is picked up (with the number of
+        rounds it was started with) and only the steps that have no row yet
+        are run, so a failed or interrupted run only repeats the LLM calls
+        whose results were not stored yet. A round only starts once the
+        previous one is complete, votes are only cast once every round is,
+        and the debate is marked completed once every vote exists; otherwise
+        the missing steps are reported and the debate stays active for the
+        next run.
+
+        In the opening round each MP responds to the speeches before theirs,
+        unless independent_openings is set. In every later round all MPs
+        speak concurrently against the transcript of the rounds before it,
+        and the next round is drafted speculatively while the current one is
+        being persisted, so wall time grows with the number of rounds rather
+        than the number of speeches. Vote decisions only depend on the
+        finished transcript and are generated concurrently.
+
+        Args:
+            db: Database session
+            paper: The policy paper to debate
+            max_concurrency: Maximum number of LLM calls in flight at once
+            independent_openings: Generate all opening statements in parallel
+            rounds: Number of speaking rounds for a new debate
+            resume: Continue the paper's latest unfinished debate if there is one
+            debate_id: Continue this debate of the paper instead, whatever resume says
+            on_progress: Awaited once the debate row exists, after each
+                persisted round and after the votes
+
+        Returns:
+            Dict containing debate details, responses, votes, summary and
+            any steps that are still missing
+        """
+        debate = None
+        if debate_id is not None:
+            debate = await DebateRepository.get_debate(db, debate_id)
+            if debate is not None and debate.paper_id != paper.id:
+                raise ValueError(f"Debate {debate_id} is not a debate of paper {paper.id}")
+        elif resume:
+            debate = await DebateRepository.get_latest_debate_for_paper(db, paper.id, status="active")
+        if debate is None:
+            debate_data = await self.openai.create_debate_from_paper(paper)
+            debate = await DebateRepository.create_debate_from_paper(
+                db,
+                paper,
+                debate_data,
+                rounds=min(max(1, rounds), MAX_DEBATE_ROUNDS)
+            )
+        else:
+            logging.info(f"Resuming debate {debate.id} for paper {paper.id}")
+
+        total_rounds = debate.rounds or 1
+        self.turns.start(debate.id, total_rounds, MP_ROLES)
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        # Responses already persisted by an earlier run are kept as they are
+        transcript: List[MPResponse] = await DebateRepository.get_debate_responses(db, debate.id)
+        transcript.sort(key=lambda response: (_round_of(response), response.id))
+        if on_progress is not None:
+            # Lets the caller resume exactly this debate if the run is interrupted
+            await on_progress(debate.id, len(transcript), 0)
+
+        missing_steps: List[str] = []
+        prefetch: Optional["asyncio.Task[Dict[str, Union[str, BaseException]]]"] = None
+        try:
+            for round_number in range(1, total_rounds + 1):
+                pending = self._pending_roles(transcript, round_number)
+                if missing_steps:
+                    missing_steps.extend(f"response:{round_number}:{role}" for role in pending)
+                    continue
+                self.turns.update(
+                    debate.id,
+                    round=round_number,
+                    speaking=pending,
+                    spoken=[role for role in MP_ROLES if role not in pending]
+                )
+                if not pending:
+                    continue
+
+                if round_number == 1 and not independent_openings:
+                    await self._speak_in_turn(db, debate, pending, transcript, missing_steps, on_progress)
+                    continue
+
+                if prefetch is not None:
+                    drafts = await prefetch
+                    prefetch = None
+                    self.turns.update(debate.id, prefetching_round=None)
+                else:
+                    snapshot = [r for r in transcript if _round_of(r) < round_number]
+                    drafts = await self._draft_round(debate, pending, snapshot, semaphore)
+
+                # Start drafting the next round from the unpersisted drafts
+                # while this round is written; dropped if any write fails
+                if round_number < total_rounds and not any(
+                    isinstance(content, BaseException) for content in drafts.values()
+                ):
+                    snapshot = [r for r in transcript if _round_of(r) <= round_number] + [
+                        MPResponse(
+                            debate_id=debate.id,
+                            mp_role=role,
+                            content=drafts[role],
+                            round_number=round_number
+                        )
+                        for role in pending
+                    ]
+                    prefetch = asyncio.create_task(
+                        self._draft_round(
+                            debate,
+                            self._pending_roles(transcript, round_number + 1),
+                            snapshot,
+                            semaphore
+                        )
+                    )
+                    self.turns.update(debate.id, prefetching_round=round_number + 1)
+
+                overtaken = await self._persist_round(
+                    db, debate, round_number, drafts, transcript, missing_steps, on_progress
+                )
+
+                # The next round was drafted against speeches that were not stored
+                if (missing_steps or overtaken) and prefetch is not None:
+                    prefetch.cancel()
+                    await asyncio.gather(prefetch, return_exceptions=True)
+                    prefetch = None
+                    self.turns.update(debate.id, prefetching_round=None)
+        finally:
+            if prefetch is not None:
+                prefetch.cancel()
+            # The running summary is only needed while speeches are drafted
+            self.openai.context.forget(debate.id)
+
+        degraded_roles: List[str] = []
+        if missing_steps:
+            # Votes must see the whole transcript; leave them for the next run
+            missing_steps.extend(f"vote:{role}" for role in MP_ROLES)
+        else:
+            self.turns.update(debate.id, phase="voting", speaking=[], spoken=[])
+            voted = {vote.mp_role for vote in await DebateRepository.get_debate_votes(db, debate.id)}
+            pending_votes = [role for role in MP_ROLES if role not in voted]
+            votes_done = len(voted)
+
+            # Generate all vote decisions concurrently, then persist them in
+            # role order in one transaction
+            vote_decisions = await asyncio.gather(
+                *(
+                    _run_bounded(
+                        semaphore,
+                        self.openai.generate_vote_decision(role, debate.title, transcript)
+                    )
+                    for role in pending_votes
+                ),
+                return_exceptions=True
+            )
+
+            new_votes: List[Dict[str, Any]] = []
+            for role, vote_decision in zip(pending_votes, vote_decisions):
+                if isinstance(vote_decision, Exception):
+                    logging.error(f"Failed to generate vote for {role}: {str(vote_decision)}")
+                    missing_steps.append(f"vote:{role}")
+                    continue
+                if vote_decision.get("degraded"):
+                    degraded_roles.append(role)
+                new_votes.append({
+                    "mp_role": role,
+                    "vote": vote_decision["vote"],
+                    "reasoning": vote_decision["reasoning"]
+                })
+
+            try:
+                stored_votes = await DebateRepository.add_votes(
+                    db,
+                    debate.id,
+                    new_votes,
+                    status=None if missing_steps else "completed"
+                )
+                # Roles that voted in another run of the debate keep that vote
+                if len(stored_votes) < len(new_votes):
+                    logging.warning(f"Votes of debate {debate.id} were partly stored by another run")
+            except Exception as e:
+                logging.error(f"Failed to store votes for debate {debate.id}: {str(e)}")
+                await db.rollback()
+                missing_steps.extend(f"vote:{vote['mp_role']}" for vote in new_votes)
+                new_votes = []
+            for vote in new_votes:
+                self.turns.mark_spoken(debate.id, vote["mp_role"])
+            if on_progress is not None:
+                await on_progress(debate.id, len(transcript), votes_done + len(new_votes))
+
+        self.turns.update(
+            debate.id,
+            phase="incomplete" if missing_steps else "completed",
+            speaking=[],
+            prefetching_round=None
+        )
+
+        result = await self._build_result(db, debate, transcript)
+        result["degraded_votes"] = degraded_roles
+        result["missing_steps"] = missing_steps
+        return result
+
+    async def run_parliament_vote(
+        self,
+        db: AsyncSession,
+        debate: Debate,
+        members: int = 300,
+        mixture: Optional[Dict[str, float]] = None,
+        jitter: float = 0.15,
+        speakers: int = 8,
+        seed: Optional[int] = None,
+        max_concurrency: int = 4
+    ) -> Dict[str, Any]:
+        """
+        Put a debate to a parliament of many members.
+
+        Every member's vote is computed from the transcript in one
+        vectorized pass; only a sample of members, spread across roles, has
+        its reasoning written by the LLM. The votes replace any earlier
+        parliament vote on the debate.
+
+        Args:
+            db: Database session
+            debate: The debate to vote on
+            members: Number of members
+            mixture: Relative share of seats per MP role
+            jitter: Per-member spread around the role's aspect weights
+            speakers: Number of members whose reasoning is generated
+            seed: Seed for reproducible seating and speaker selection
+            max_concurrency: Maximum number of LLM calls in flight at once
+
+        Returns:
+            Dict containing the tally and the sampled members' reasoning
+        """
+        parliament = Parliament.sample(
+            members,
+            mixture=mixture,
+            jitter=jitter,
+            seed=seed,
+            vote_service=self.openai.vote_service
+        )
+        responses = await DebateRepository.get_debate_responses(db, debate.id)
+        scores = parliament.scores(responses)
+        codes = parliament.votes(scores)
+
+        chosen = parliament.sample_members(speakers, seed=seed)
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        explanations = await asyncio.gather(
+            *(
+                _run_bounded(
+                    semaphore,
+                    self.openai.explain_vote(
+                        parliament.roles[parliament.member_roles[index]],
+                        debate.title,
+                        VOTE_CHOICES[codes[index]],
+                        float(abs(scores[index]))
+                    )
+                )
+                for index in chosen
+            )
+        )
+        reasoning = {index: text for index, (text, _) in zip(chosen, explanations)}
+
+        rows = [
+            {
+                "member_index": index,
+                "mp_role": parliament.roles[role],
+                "vote": VOTE_CHOICES[code],
+                "score": float(score),
+                "reasoning": reasoning.get(index)
+            }
+            for index, (role, code, score) in enumerate(
+                zip(parliament.member_roles.tolist(), codes.tolist(), scores.tolist())
+            )
+        ]
+        await DebateRepository.replace_member_votes(db, debate.id, rows)
+
+        return {
+            "debate_id": debate.id,
+            "members": parliament.size,
+            "summary": parliament.tally(codes),
+            "speeches": [
+                {key: rows[index][key] for key in ("member_index", "mp_role", "vote", "score", "reasoning")}
+                for index in chosen
+            ],
+            "degraded_speeches": sum(1 for _, degraded in explanations if degraded)
+        }
+
+    async def _speak_in_turn(
+        self,
+        db: AsyncSession,
+        debate: Debate,
+        roles: List[str],
+        transcript: List[MPResponse],
+        missing_steps: List[str],
+        on_progress: Optional[ProgressCallback]
+    ) -> None:
+        """
+        Opening round where each MP hears the speeches before theirs.
+
+        The speeches are generated one after another anyway, so each is
+        persisted as soon as it exists and an interrupted run keeps them.
+        """
+        for role in roles:
+            self.turns.update(debate.id, speaking=[role])
+            try:
+                content: Union[str, BaseException] = await self.openai.generate_mp_response(
+                    role,
+                    debate.title,
+                    transcript
+                )
+            except Exception as e:
+                content = e
+            await self._persist_round(db, debate, 1, {role: content}, transcript, missing_steps, on_progress)
+
+    async def _persist_round(
+        self,
+        db: AsyncSession,
+        debate: Debate,
+        round_number: int,
+        drafts: Dict[str, Union[str, BaseException]],
+        transcript: List[MPResponse],
+        missing_steps: List[str],
+        on_progress: Optional[ProgressCallback]
+    ) -> bool:
+        """
+        Write a round's generated speeches in one transaction and record the failed ones.
+
+        Returns:
+            Whether another run of the debate had already stored some of
+            these speeches, which are kept in place of the drafts
+        """
+        rows: List[Dict[str, Any]] = []
+        for role, content in drafts.items():
+            if isinstance(content, BaseException):
+                logging.error(f"Failed to generate round {round_number} response for {role}: {str(content)}")
+                missing_steps.append(f"response:{round_number}:{role}")
+                continue
+            rows.append({
+                "mp_role": role,
+                "content": content,
+                "color": self.openai.mp_roles[role]["color"],
+                "round_number": round_number
+            })
+
+        try:
+            stored = await DebateRepository.add_responses(db, debate.id, rows)
+        except Exception as e:
+            logging.error(f"Failed to store round {round_number} of debate {debate.id}: {str(e)}")
+            await db.rollback()
+            missing_steps.extend(f"response:{round_number}:{row['mp_role']}" for row in rows)
+            return False
+        overtaken = len(stored) < len(rows)
+        if overtaken:
+            logging.warning(f"Round {round_number} of debate {debate.id} was partly stored by another run")
+            roles = {row["mp_role"] for row in rows}
+            stored = [
+                response for response in await DebateRepository.get_debate_responses(db, debate.id)
+                if _round_of(response) == round_number and response.mp_role in roles
+            ]
+        transcript.extend(stored)
+        for response in stored:
+            self.turns.mark_spoken(debate.id, response.mp_role)
+        if stored and on_progress is not None:
+            await on_progress(debate.id, len(transcript), 0)
+        return overtaken
+
+    async def _draft_round(
+        self,
+        debate: Debate,
+        roles: List[str],
+        snapshot: List[MPResponse],
+        semaphore: asyncio.Semaphore
+    ) -> Dict[str, Union[str, BaseException]]:
+        """Generate one round's speeches concurrently against a fixed transcript."""
+        contents = await asyncio.gather(
+            *(
+                _run_bounded(
+                    semaphore,
+                    self.openai.generate_mp_response(role, debate.title, snapshot)
+                )
+                for role in roles
+            ),
+            return_exceptions=True
+        )
+        return dict(zip(roles, contents))
+
+    @staticmethod
+    def _pending_roles(transcript: List[MPResponse], round_number: int) -> List[str]:
+        spoken = {r.mp_role for r in transcript if _round_of(r) == round_number}
+        return [role for role in MP_ROLES if role not in spoken]
+
+    @staticmethod
+    async def load_stored_result(
+        db: AsyncSession,
+        paper_id: int,
+        rounds: Optional[int] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Rebuild the run_full_debate result for a paper's latest completed debate.
+
+        Args:
+            db: Database session
+            paper_id: ID of the policy paper
+            rounds: Only accept a debate that ran this many rounds
+
+        Returns:
+            The stored debate in the same shape as run_full_debate, or None
+        """
+        debate = await DebateRepository.get_latest_debate_for_paper(db, paper_id, status="completed")
+        if debate is None or (rounds is not None and (debate.rounds or 1) != rounds):
+            return None
+
+        responses = await DebateRepository.get_debate_responses(db, debate.id)
+        responses.sort(key=lambda response: (_round_of(response), response.id))
+        result = await DebateService._build_result(db, debate, responses)
+        result["reused"] = True
+        return result
+
+    @staticmethod
+    async def _build_result(
+        db: AsyncSession,
+        debate: Debate,
+        responses: List[MPResponse]
+    ) -> Dict[str, Any]:
+        votes = await DebateRepository.get_debate_votes(db, debate.id)
+
+        # Get vote summary
+        try:
+            summary = await DebateRepository.get_vote_summary(db, debate.id)
+        except Exception as e:
+            logging.error(f"Failed to generate vote summary: {str(e)}")
+            summary = {"error": "Failed to generate summary"}
+
+        return {
+            "debate_id": debate.id,
+            "title": debate.title,
+            "rounds": debate.rounds or 1,
+            "responses": [_response_dict(response) for response in responses],
+            "votes": [VoteResponse.model_validate(vote).model_dump() for vote in votes],
+            "summary": summary,
+            "degraded_votes": [],
+            "missing_steps": [],
+            "reused": False
+        }
+
+
+class _RunProgress:
+    """Progress of an in-flight full-debate run, passed on to every caller waiting on it."""
+
+    def __init__(self) -> None:
+        self.last: Optional[Tuple[int, int, int]] = None
+        self.listeners: List[ProgressCallback] = []
+
+    async def __call__(self, debate_id: int, responses_done: int, votes_done: int) -> None:
+        progress = self.last = (debate_id, responses_done, votes_done)
+        for listener in list(self.listeners):
+            # One caller's failing callback must not fail the run for all of them
+            try:
+                await listener(*progress)
+            except Exception as e:
+                logging.error(f"Progress callback failed for debate {debate_id}: {str(e)}")
+
+    async def follow(
+        self,
+        task: "asyncio.Task[Dict[str, Any]]",
+        on_progress: Optional[ProgressCallback]
+    ) -> Dict[str, Any]:
+        """Wait for the run, reporting its progress so far and from now on to on_progress."""
+        if on_progress is not None:
+            # Catch up first; registering after the last await means no update
+            # is missed and the callback is never called twice at once
+            reported = None
+            while self.last != reported:
+                reported = self.last
+                await on_progress(*reported)
+            self.listeners.append(on_progress)
+        try:
+            return await asyncio.shield(task)
+        finally:
+            if on_progress in self.listeners:
+                self.listeners.remove(on_progress)
+
+
+class FullDebateCoordinator:
+    """
+    Process-wide entry point for full debates.
+
+    Concurrent requests for the same paper and options share one in-flight
+    computation, and a paper that already has a completed debate is answered
+    from storage unless regeneration is asked for. Otherwise an unfinished
+    debate for the paper is resumed rather than started over.
+    """
+
+    def __init__(
+        self,
+        service_factory: Callable[[], OpenAIService],
+        turn_tracker: Optional[DebateTurnTracker] = None
+    ):
+        self.service_factory = service_factory
+        self.turns = turn_tracker or DebateTurnTracker()
+        self._inflight: Dict[RunKey, "asyncio.Task[Dict[str, Any]]"] = {}
+        self._progress: Dict[RunKey, _RunProgress] = {}
+        self.stats = {"generated": 0, "coalesced": 0, "reused": 0}
+
+    async def run(
+        self,
+        paper_id: int,
+        regenerate: bool = False,
+        on_progress: Optional[ProgressCallback] = None,
+        **options: Any
+    ) -> Dict[str, Any]:
+        """
+        Get the full debate for a paper, generating it only when needed.
+
+        Args:
+            paper_id: ID of the policy paper
+            regenerate: Generate a new debate even if a completed one exists
+            on_progress: Progress callback, also called for a run this call joins
+            **options: Passed through to DebateService.run_full_debate
+
+        Returns:
+            Dict containing debate details, responses, votes and summary
+        """
+        # Registered before the first await, so callers arriving while the
+        # stored result is being looked up join this run instead of racing it
+        key = (paper_id, options.get("rounds", 1), regenerate, options.get("debate_id"))
+        task = self._inflight.get(key)
+        if task is not None:
+            self.stats["coalesced"] += 1
+            return dict(await self._progress[key].follow(task, on_progress))
+
+        # Runs for the same paper with other options go one after another,
+        # so a regeneration never writes to a debate that is being resumed
+        earlier = [other for (other_paper, *_), other in self._inflight.items() if other_paper == paper_id]
+
+        # The run gets its own task and session so a disconnecting caller
+        # does not cancel it for everyone else waiting on the same paper
+        progress = _RunProgress()
+        task = asyncio.create_task(self._run_once(paper_id, regenerate, progress, options, earlier))
+        self._inflight[key] = task
+        self._progress[key] = progress
+        task.add_done_callback(lambda done: self._release(key, done))
+        return dict(await progress.follow(task, on_progress))
+
+    def in_flight(self) -> List[int]:
+        return sorted({paper_id for paper_id, *_ in self._inflight})
+
+    def _release(self, key: RunKey, task: "asyncio.Task[Dict[str, Any]]") -> None:
+        # A later run may have taken the key over; only remove our own entry
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+            del self._progress[key]
+
+    async def _run_once(
+        self,
+        paper_id: int,
+        regenerate: bool,
+        on_progress: Optional[ProgressCallback],
+        options: Dict[str, Any],
+        earlier: List["asyncio.Task[Dict[str, Any]]"]
+    ) -> Dict[str, Any]:
+        if earlier:
+            await asyncio.wait(earlier)
+
+        # A run that continues a given debate must not answer with another one
+        if not regenerate and options.get("debate_id") is None:
+            async with AsyncSessionLocal() as db:
+                stored = await DebateService.load_stored_result(
+                    db,
+                    paper_id,
+                    rounds=options.get("rounds", 1)
+                )
+            if stored is not None:
+                self.stats["reused"] += 1
+                return stored
+
+        self.stats["generated"] += 1
+        return await self._generate(paper_id, regenerate, on_progress, options)
 
+    async def _generate(
+        self,
+        paper_id: int,
+        regenerate: bool,
+        on_progress: Optional[ProgressCallback],
+        options: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        async with AsyncSessionLocal() as db:
+            paper = await PaperRepository.get_paper(db, paper_id)
+            if not paper:
+                raise ValueError(f"Paper {paper_id} not found")
+            service = self.service_factory()
+            # A regenerated debate must not be the cached text of the last one
+            with service.fresh_completions() if regenerate else nullcontext():
+                return await DebateService(service, self.turns).run_full_debate(
+                    db,
+                    paper,
+                    resume=not regenerate,
+                    on_progress=on_progress,
+                    **options
+                )
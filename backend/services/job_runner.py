@@ -0,0 +1,117 @@
+import asyncio
+import json
+import logging
+from typing import Any, Dict, List
+
+from db.database import AsyncSessionLocal
+from models.database_models import DebateJob
+from repositories.job_repository import JobRepository
+from services.debate_service import FullDebateCoordinator
+
+logger = logging.getLogger(__name__)
+
+
+class DebateJobRunner:
+    """
+    Worker pool that runs full debates in the background.
+
+    Jobs live in the debate_jobs table, so anything still queued or running
+    when the process stops is picked up again on the next start.
+    """
+
+    def __init__(
+        self,
+        coordinator: FullDebateCoordinator,
+        workers: int = 2
+    ):
+        self.coordinator = coordinator
+        self.workers = workers
+        self._queue: "asyncio.Queue[str]" = asyncio.Queue()
+        self._tasks: List[asyncio.Task] = []
+
+    async def start(self) -> None:
+        """Start the workers and re-enqueue jobs left over from a previous run."""
+        async with AsyncSessionLocal() as db:
+            for job in await JobRepository.get_unfinished_jobs(db):
+                if job.status == "running":
+                    await JobRepository.requeue(db, job)
+                self._queue.put_nowait(job.id)
+                logger.info(f"Resuming debate job {job.id} for paper {job.paper_id}")
+
+        self._tasks = [
+            asyncio.create_task(self._worker(index))
+            for index in range(self.workers)
+        ]
+
+    async def stop(self) -> None:
+        """Cancel the workers; interrupted jobs are resumed on next start."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def submit(self, paper_id: int, params: Dict[str, Any]) -> DebateJob:
+        """
+        Persist a new job and queue it for the workers.
+
+        Unless params ask to regenerate, a job that is already queued or
+        running for the same paper is returned instead of creating another.
+        """
+        async with AsyncSessionLocal() as db:
+            if not params.get("regenerate"):
+                active = await JobRepository.get_active_job_for_paper(db, paper_id)
+                if active is not None:
+                    return active
+            job = await JobRepository.create_job(db, paper_id, params)
+        self._queue.put_nowait(job.id)
+        return job
+
+    def queue_depth(self) -> int:
+        return self._queue.qsize()
+
+    async def _worker(self, index: int) -> None:
+        while True:
+            job_id = await self._queue.get()
+            try:
+                await self.run_job(job_id)
+            except Exception as e:
+                logger.error(f"Worker {index} crashed on job {job_id}: {str(e)}")
+            finally:
+                self._queue.task_done()
+
+    async def run_job(self, job_id: str) -> None:
+        """Run a single job to completion or failure in its own session."""
+        async with AsyncSessionLocal() as db:
+            job = await JobRepository.get_job(db, job_id)
+            if job is None or job.status not in ("queued", "running"):
+                return
+
+            await JobRepository.mark_running(db, job)
+            try:
+                async def on_progress(debate_id: int, responses_done: int, votes_done: int) -> None:
+                    await JobRepository.update_progress(db, job, responses_done, votes_done, debate_id)
+
+                params = json.loads(job.params or "{}")
+                if job.debate_id is not None:
+                    # Requeued after its debate was created: continue that
+                    # debate, even if the job asked to regenerate
+                    params["debate_id"] = job.debate_id
+                result = await self.coordinator.run(
+                    job.paper_id,
+                    on_progress=on_progress,
+                    **params
+                )
+                if result.get("missing_steps"):
+                    # Steps are checkpointed; resubmitting the job resumes the debate
+                    raise RuntimeError(
+                        f"Debate {result['debate_id']} is incomplete, missing "
+                        f"{', '.join(result['missing_steps'])}"
+                    )
+                await JobRepository.mark_completed(db, job, result)
+            except asyncio.CancelledError:
+                # Shutdown: leave the job as running so start() requeues it
+                raise
+            except Exception as e:
+                logger.error(f"Debate job {job_id} failed: {str(e)}")
+                await db.rollback()
+                await JobRepository.mark_failed(db, job, str(e))
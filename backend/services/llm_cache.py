@@ -0,0 +1,179 @@
+import asyncio
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class LLMCompletionCache:
+    """
+    Content-addressed cache for chat completions.
+
+    Lookups go to an in-memory LRU first and fall back to a SQLite table that
+    survives restarts. Both tiers honour a TTL; the persistent tier is trimmed
+    to max_entries by least-recent access.
+    """
+
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        memory_size: int = 512,
+        max_entries: int = 10000,
+        ttl_seconds: float = 7 * 24 * 3600
+    ):
+        self.memory_size = memory_size
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._memory: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+
+        self.memory_hits = 0
+        self.persistent_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        if db_path:
+            self._conn = sqlite3.connect(db_path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                """CREATE TABLE IF NOT EXISTS llm_cache (
+                    key TEXT PRIMARY KEY,
+                    content TEXT NOT NULL,
+                    expires_at REAL NOT NULL,
+                    last_access REAL NOT NULL
+                )"""
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS ix_llm_cache_last_access ON llm_cache (last_access)"
+            )
+            self._conn.commit()
+
+    @staticmethod
+    def make_key(
+        model: str,
+        messages: List[Dict[str, str]],
+        temperature: float,
+        max_tokens: int
+    ) -> str:
+        """Hash the request parameters that determine a completion."""
+        payload = json.dumps(
+            {
+                "model": model,
+                "messages": messages,
+                "temperature": temperature,
+                "max_tokens": max_tokens
+            },
+            sort_keys=True,
+            separators=(",", ":")
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    async def get(self, key: str) -> Optional[str]:
+        """Return a cached completion, or None on a miss."""
+        now = time.time()
+        entry = self._memory.get(key)
+        if entry is not None:
+            content, expires_at = entry
+            if expires_at > now:
+                self._memory.move_to_end(key)
+                self.memory_hits += 1
+                return content
+            del self._memory[key]
+
+        if self._conn is not None:
+            row = await asyncio.to_thread(self._load, key, now)
+            if row is not None:
+                content, expires_at = row
+                self._remember(key, content, expires_at)
+                self.persistent_hits += 1
+                return content
+
+        self.misses += 1
+        return None
+
+    async def set(self, key: str, content: str) -> None:
+        """Store a completion in both tiers."""
+        expires_at = time.time() + self.ttl_seconds
+        self._remember(key, content, expires_at)
+        if self._conn is not None:
+            await asyncio.to_thread(self._store, key, content, expires_at)
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and tier sizes."""
+        lookups = self.memory_hits + self.persistent_hits + self.misses
+        hits = self.memory_hits + self.persistent_hits
+        persistent_entries = 0
+        if self._conn is not None:
+            with self._lock:
+                persistent_entries = self._conn.execute(
+                    "SELECT COUNT(*) FROM llm_cache"
+                ).fetchone()[0]
+        return {
+            "memory_hits": self.memory_hits,
+            "persistent_hits": self.persistent_hits,
+            "misses": self.misses,
+            "hit_rate": hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "memory_entries": len(self._memory),
+            "persistent_entries": persistent_entries
+        }
+
+    def close(self) -> None:
+        """Close the persistent tier."""
+        if self._conn is not None:
+            with self._lock:
+                self._conn.close()
+            self._conn = None
+
+    def _remember(self, key: str, content: str, expires_at: float) -> None:
+        self._memory[key] = (content, expires_at)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_size:
+            self._memory.popitem(last=False)
+
+    def _load(self, key: str, now: float) -> Optional[Tuple[str, float]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT content, expires_at FROM llm_cache WHERE key = ?",
+                (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if row[1] <= now:
+                self._conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                self._conn.commit()
+                return None
+            self._conn.execute(
+                "UPDATE llm_cache SET last_access = ? WHERE key = ?",
+                (now, key)
+            )
+            self._conn.commit()
+            return row[0], row[1]
+
+    def _store(self, key: str, content: str, expires_at: float) -> None:
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                """INSERT OR REPLACE INTO llm_cache (key, content, expires_at, last_access)
+                VALUES (?, ?, ?, ?)""",
+                (key, content, expires_at, now)
+            )
+            self._conn.execute("DELETE FROM llm_cache WHERE expires_at <= ?", (now,))
+            count = self._conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0]
+            overflow = count - self.max_entries
+            if overflow > 0:
+                self._conn.execute(
+                    """DELETE FROM llm_cache WHERE key IN (
+                        SELECT key FROM llm_cache ORDER BY last_access LIMIT ?
+                    )""",
+                    (overflow,)
+                )
+                self.evictions += overflow
+            self._conn.commit()
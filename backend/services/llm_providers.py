@@ -0,0 +1,263 @@
+import asyncio
+import hashlib
+import os
+import random
+import re
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import AsyncIterator, Dict, List, Optional
+
+import httpx
+from openai import AsyncOpenAI
+
+
+@dataclass
+class LLMCompletion:
+    """Text and token usage of a finished completion."""
+    content: str
+    prompt_tokens: int
+    completion_tokens: int
+
+    @property
+    def total_tokens(self) -> int:
+        return self.prompt_tokens + self.completion_tokens
+
+
+class TransientProviderError(Exception):
+    """A provider failure that is worth retrying."""
+
+
+class LLMProvider(ABC):
+    """Interface every chat completion backend implements."""
+
+    name: str = "base"
+
+    @abstractmethod
+    async def complete(
+        self,
+        model: str,
+        messages: List[Dict[str, str]],
+        temperature: float,
+        max_tokens: int
+    ) -> LLMCompletion:
+        """Run a chat completion and return the full text."""
+
+    @abstractmethod
+    async def open_stream(
+        self,
+        model: str,
+        messages: List[Dict[str, str]],
+        temperature: float,
+        max_tokens: int
+    ) -> AsyncIterator[str]:
+        """Start a streamed completion and return an iterator over text chunks."""
+
+    async def aclose(self) -> None:
+        """Release any connections held by the provider."""
+
+
+class OpenAIProvider(LLMProvider):
+    """Chat completions from the OpenAI API over a shared connection pool."""
+
+    name = "openai"
+
+    def __init__(self, api_key: str, max_retries: int = 2):
+        if not api_key:
+            raise ValueError("OpenAI API key is required")
+        # One pooled HTTP client for the whole process
+        self.http_client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=int(os.getenv("OPENAI_MAX_CONNECTIONS", "20")),
+                max_keepalive_connections=int(os.getenv("OPENAI_MAX_KEEPALIVE", "10"))
+            ),
+            timeout=httpx.Timeout(float(os.getenv("OPENAI_TIMEOUT", "60")), connect=10.0)
+        )
+        self.client = AsyncOpenAI(
+            api_key=api_key,
+            http_client=self.http_client,
+            max_retries=max_retries
+        )
+
+    async def complete(
+        self,
+        model: str,
+        messages: List[Dict[str, str]],
+        temperature: float,
+        max_tokens: int
+    ) -> LLMCompletion:
+        response = await self.client.chat.completions.create(
+            model=model,
+            messages=messages,
+            temperature=temperature,
+            max_tokens=max_tokens
+        )
+        usage = response.usage
+        return LLMCompletion(
+            content=response.choices[0].message.content,
+            prompt_tokens=usage.prompt_tokens if usage else 0,
+            completion_tokens=usage.completion_tokens if usage else 0
+        )
+
+    async def open_stream(
+        self,
+        model: str,
+        messages: List[Dict[str, str]],
+        temperature: float,
+        max_tokens: int
+    ) -> AsyncIterator[str]:
+        stream = await self.client.chat.completions.create(
+            model=model,
+            messages=messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            stream=True
+        )
+
+        async def chunks() -> AsyncIterator[str]:
+            async for chunk in stream:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    yield delta
+
+        return chunks()
+
+    async def aclose(self) -> None:
+        await self.client.close()
+
+
+# Phrases the local provider strings together for each MP role
+ROLE_PHRASES = {
+    "corporate": [
+        "market-driven innovation", "competitive advantage", "regulatory burden",
+        "economic growth", "investment certainty", "industry self-regulation"
+    ],
+    "academic": [
+        "peer-reviewed evidence", "research funding", "reproducible evaluation",
+        "ethical review", "long-term study", "open scientific inquiry"
+    ],
+    "government": [
+        "public safety", "structured oversight", "implementation capacity",
+        "clear compliance standards", "accountable institutions", "national security"
+    ],
+    "civil_rights": [
+        "individual privacy", "algorithmic fairness", "transparency obligations",
+        "protection from discrimination", "meaningful consent", "rights of redress"
+    ]
+}
+
+GENERIC_PHRASES = [
+    "the proposal", "stakeholder impact", "balanced safeguards",
+    "practical implementation", "long-term consequences", "public trust"
+]
+
+
+class LocalLLMProvider(LLMProvider):
+    """
+    Offline stand-in that needs no network or API key.
+
+    Text is derived deterministically from the prompt and flavoured by the MP
+    role it mentions. Latency is simulated as a log-normal time to first token
+    plus a fixed token rate, and a configurable fraction of calls fails with a
+    retryable error, so throughput work can be measured on an isolated box.
+    """
+
+    name = "local"
+
+    def __init__(
+        self,
+        latency_median_ms: float = 800.0,
+        latency_sigma: float = 0.5,
+        tokens_per_second: float = 60.0,
+        error_rate: float = 0.0,
+        seed: Optional[int] = None
+    ):
+        self.latency_median_ms = latency_median_ms
+        self.latency_sigma = latency_sigma
+        self.tokens_per_second = tokens_per_second
+        self.error_rate = error_rate
+        # Only timing and failures use this; text depends on the prompt alone
+        self._rng = random.Random(seed)
+
+    async def complete(
+        self,
+        model: str,
+        messages: List[Dict[str, str]],
+        temperature: float,
+        max_tokens: int
+    ) -> LLMCompletion:
+        words = self._generate(messages, max_tokens)
+        await asyncio.sleep(self._first_token_delay())
+        self._maybe_fail()
+        await asyncio.sleep(len(words) / self.tokens_per_second)
+        return LLMCompletion(
+            content=" ".join(words),
+            prompt_tokens=self._prompt_tokens(messages),
+            completion_tokens=len(words)
+        )
+
+    async def open_stream(
+        self,
+        model: str,
+        messages: List[Dict[str, str]],
+        temperature: float,
+        max_tokens: int
+    ) -> AsyncIterator[str]:
+        words = self._generate(messages, max_tokens)
+        await asyncio.sleep(self._first_token_delay())
+        self._maybe_fail()
+
+        async def chunks() -> AsyncIterator[str]:
+            for index, word in enumerate(words):
+                if index:
+                    await asyncio.sleep(1 / self.tokens_per_second)
+                yield word if index == 0 else f" {word}"
+
+        return chunks()
+
+    def _first_token_delay(self) -> float:
+        return self._rng.lognormvariate(0.0, self.latency_sigma) * self.latency_median_ms / 1000
+
+    def _maybe_fail(self) -> None:
+        if self.error_rate and self._rng.random() < self.error_rate:
+            raise TransientProviderError("Simulated provider error")
+
+    @staticmethod
+    def _prompt_tokens(messages: List[Dict[str, str]]) -> int:
+        return sum(len(message["content"]) for message in messages) // 4
+
+    def _generate(self, messages: List[Dict[str, str]], max_tokens: int) -> List[str]:
+        system_prompt = messages[0]["content"].lower() if messages else ""
+        prompt = messages[-1]["content"] if messages else ""
+        digest = hashlib.sha256(
+            "\n".join(message["content"] for message in messages).encode("utf-8")
+        ).digest()
+        rng = random.Random(digest)
+
+        if "consistency" in system_prompt:
+            return [rng.choice(["YES", "YES", "YES", "NO"])]
+
+        match = re.search(r"representing (\w+) interests", prompt)
+        role = match.group(1) if match else None
+        phrases = ROLE_PHRASES.get(role, GENERIC_PHRASES)
+
+        if "moderator" in system_prompt:
+            subject = rng.choice(GENERIC_PHRASES)
+            words = f"Should Parliament adopt binding rules on {subject} for advanced AI systems?".split()
+        elif "summarize" in system_prompt:
+            words = ["Summary:"] + [
+                f"members weighed {rng.choice(GENERIC_PHRASES)};"
+                for _ in range(4)
+            ]
+        else:
+            target = min(max_tokens, rng.randint(max_tokens // 3, max_tokens // 2) + 10)
+            words = []
+            speaker = role.replace("_", " ") if role else "this House"
+            while len(words) < target:
+                sentence = (
+                    f"Speaking for {speaker}, {rng.choice(phrases)} must guide "
+                    f"{rng.choice(GENERIC_PHRASES)} while respecting {rng.choice(phrases)}."
+                )
+                words.extend(sentence.split())
+        return words[:max_tokens]
@@ -0,0 +1,213 @@
+import asyncio
+import logging
+import random
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional, TypeVar
+
+import numpy as np
+import openai
+from services.llm_providers import TransientProviderError
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Errors worth another attempt; anything else is raised immediately.
+RETRYABLE_ERRORS = (
+    openai.RateLimitError,
+    openai.APITimeoutError,
+    openai.APIConnectionError,
+    openai.InternalServerError,
+    TransientProviderError,
+    asyncio.TimeoutError
+)
+
+
+class LLMDeadlineExceeded(Exception):
+    """Raised when an LLM call cannot complete within its deadline budget."""
+
+
+class ResilientCaller:
+    """
+    Runs LLM requests with retries, a deadline and optional hedging.
+
+    Retryable errors are retried with full-jitter exponential backoff until
+    max_attempts or the per-call deadline is reached. With hedging enabled a
+    second identical request is fired once the first has been outstanding
+    longer than the observed latency quantile; whichever finishes first wins.
+    Waiting for admission (e.g. by a rate limiter) happens outside of the
+    measured latency, and no hedge is fired while admission is contended.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 4,
+        base_delay: float = 0.5,
+        max_delay: float = 8.0,
+        deadline_seconds: float = 45.0,
+        hedge: bool = False,
+        hedge_quantile: float = 95.0,
+        hedge_min_samples: int = 20,
+        latency_sample_size: int = 500
+    ):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.deadline_seconds = deadline_seconds
+        self.hedge = hedge
+        self.hedge_quantile = hedge_quantile
+        self.hedge_min_samples = hedge_min_samples
+        self._latencies: Deque[float] = deque(maxlen=latency_sample_size)
+
+        self.retries = 0
+        self.hedges_fired = 0
+        self.hedges_won = 0
+        self.hedges_skipped = 0
+        self.deadline_exceeded = 0
+
+    async def call(
+        self,
+        make_request: Callable[[], Awaitable[T]],
+        hedge: Optional[bool] = None,
+        deadline_seconds: Optional[float] = None,
+        admit: Optional[Callable[[], Awaitable[Any]]] = None,
+        can_hedge: Optional[Callable[[], bool]] = None
+    ) -> T:
+        """
+        Run make_request under the retry, deadline and hedging policy.
+
+        Args:
+            make_request: Factory returning a fresh request coroutine per attempt
+            hedge: Override the default hedging setting for this call
+            deadline_seconds: Override the default deadline budget for this call
+            admit: Awaited before every request, including hedges; its wait
+                counts against the deadline but not the latency or hedge delay
+            can_hedge: Checked before firing a hedge; False skips it
+
+        Returns:
+            The result of the first successful attempt
+
+        Raises:
+            LLMDeadlineExceeded: If the deadline ran out before a success
+            Exception: The last error once attempts are exhausted, or any
+                non-retryable error
+        """
+        loop = asyncio.get_running_loop()
+        budget = deadline_seconds if deadline_seconds is not None else self.deadline_seconds
+        deadline = loop.time() + budget
+        use_hedge = self.hedge if hedge is None else hedge
+        last_error: Optional[BaseException] = None
+
+        for attempt in range(self.max_attempts):
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                return await asyncio.wait_for(
+                    self._attempt(make_request, use_hedge, admit, can_hedge),
+                    timeout=remaining
+                )
+            except RETRYABLE_ERRORS as e:
+                last_error = e
+                if attempt + 1 >= self.max_attempts:
+                    break
+                delay = self._backoff_delay(attempt, e)
+                if loop.time() + delay >= deadline:
+                    break
+                self.retries += 1
+                logger.warning(
+                    f"Retryable LLM error (attempt {attempt + 1}/{self.max_attempts}), "
+                    f"retrying in {delay:.2f}s: {str(e)}"
+                )
+                await asyncio.sleep(delay)
+
+        if last_error is None or isinstance(last_error, asyncio.TimeoutError):
+            self.deadline_exceeded += 1
+            raise LLMDeadlineExceeded(f"LLM call exceeded its {budget:g}s deadline")
+        raise last_error
+
+    def stats(self) -> Dict[str, Any]:
+        """Retry and hedging counters plus the current hedge threshold."""
+        return {
+            "retries": self.retries,
+            "hedges_fired": self.hedges_fired,
+            "hedges_won": self.hedges_won,
+            "hedges_skipped": self.hedges_skipped,
+            "deadline_exceeded": self.deadline_exceeded,
+            "hedge_after_seconds": self._hedge_threshold()
+        }
+
+    def _backoff_delay(self, attempt: int, error: BaseException) -> float:
+        """Full-jitter exponential backoff, honouring Retry-After when sent."""
+        cap = min(self.max_delay, self.base_delay * (2 ** attempt))
+        delay = random.uniform(0, cap)
+        response = getattr(error, "response", None)
+        retry_after = response.headers.get("retry-after") if response is not None else None
+        if retry_after:
+            try:
+                delay = max(delay, float(retry_after))
+            except ValueError:
+                pass
+        return delay
+
+    def _hedge_threshold(self) -> Optional[float]:
+        if len(self._latencies) < self.hedge_min_samples:
+            return None
+        return float(np.percentile(np.fromiter(self._latencies, dtype=float), self.hedge_quantile))
+
+    async def _attempt(
+        self,
+        make_request: Callable[[], Awaitable[T]],
+        use_hedge: bool,
+        admit: Optional[Callable[[], Awaitable[Any]]],
+        can_hedge: Optional[Callable[[], bool]]
+    ) -> T:
+        if admit is not None:
+            await admit()
+        # Latency and the hedge delay only cover the provider call itself
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        hedge_after = self._hedge_threshold() if use_hedge else None
+        if hedge_after is None:
+            result = await make_request()
+            self._latencies.append(loop.time() - started)
+            return result
+
+        primary = asyncio.ensure_future(make_request())
+        backup: Optional[asyncio.Future] = None
+        try:
+            done, _ = await asyncio.wait({primary}, timeout=hedge_after)
+            if not done and can_hedge is not None and not can_hedge():
+                # A hedge would only queue behind the calls already waiting
+                self.hedges_skipped += 1
+                await asyncio.wait({primary})
+            elif not done:
+                self.hedges_fired += 1
+                backup = asyncio.ensure_future(self._admitted(make_request, admit))
+                pending = {primary, backup}
+                while pending:
+                    done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        if task.exception() is None:
+                            if task is backup:
+                                self.hedges_won += 1
+                            self._latencies.append(loop.time() - started)
+                            return task.result()
+                # Both failed; surface the primary's error
+            result = primary.result()
+            self._latencies.append(loop.time() - started)
+            return result
+        finally:
+            # Also runs when the deadline cancels this attempt
+            for task in (primary, backup):
+                if task is not None and not task.done():
+                    task.cancel()
+
+    @staticmethod
+    async def _admitted(
+        make_request: Callable[[], Awaitable[T]],
+        admit: Optional[Callable[[], Awaitable[Any]]]
+    ) -> T:
+        if admit is not None:
+            await admit()
+        return await make_request()
@@ -0,0 +1,28 @@
+from typing import Dict, List
+
+# How each MP role is briefed in prompts and drawn in the UI, in speaking order
+MP_ROLE_PROFILES: Dict[str, Dict[str, str]] = {
+    "corporate": {
+        "description": "Represents business and industry interests",
+        "bias": "Favors market-driven solutions and minimal regulation",
+        "color": "#DA0211"  # Business blue
+    },
+    "academic": {
+        "description": "Represents academic and research institutions",
+        "bias": "Favors evidence-based policy and thorough research",
+        "color": "#FDA003"  # Academic purple
+    },
+    "government": {
+        "description": "Represents governmental and regulatory interests",
+        "bias": "Favors structured oversight and public safety",
+        "color": "#2CAFFE"  # Government green
+    },
+    "civil_rights": {
+        "description": "Represents civil society and individual rights",
+        "bias": "Favors privacy and individual protections",
+        "color": "#000099"  # Advocacy red
+    }
+}
+
+# The roles every debate is argued between, in speaking order
+MP_ROLES: List[str] = list(MP_ROLE_PROFILES)
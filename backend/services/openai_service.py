@@ -1,65 +1,315 @@
 import json
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple
 
 from fastapi import HTTPException
 from models.database_models import MPResponse, PolicyPaper
-from openai import OpenAI
+from monitoring.llm_metrics import LLMCallMetric, LLMTelemetry
+from services.debate_context import DebateContextManager, TokenCounter
+from services.llm_cache import LLMCompletionCache
+from services.llm_providers import LLMProvider, OpenAIProvider
+from services.llm_resilience import ResilientCaller
+from services.mp_roles import MP_ROLE_PROFILES
+from services.rate_limiter import LLMRateLimiter
 from services.vote_decision_service import VoteDecisionService
 import logging
 
+DEFAULT_MODEL = "gpt-4o-mini"
+
+# Set while cached completions must not be served, e.g. when a debate is
+# regenerated; tasks started from that context inherit it
+_bypass_cache: ContextVar[bool] = ContextVar("bypass_llm_cache", default=False)
+
 
 class OpenAIService:
-    """Service for handling OpenAI API interactions."""
+    """Service for handling LLM interactions for debates."""
     
-    def __init__(self, api_key: str = None):
-        """Initialize OpenAI client with API key."""
-        if not api_key:
-            raise ValueError("OpenAI API key is required")
+    def __init__(
+        self,
+        api_key: str = None,
+        model: str = DEFAULT_MODEL,
+        cache: Optional[LLMCompletionCache] = None,
+        rate_limiter: Optional[LLMRateLimiter] = None,
+        resilience: Optional[ResilientCaller] = None,
+        context_token_budget: int = 2000,
+        provider: Optional[LLMProvider] = None,
+        telemetry: Optional[LLMTelemetry] = None
+    ):
+        """
+        Initialize the service on top of an LLM provider.
         
-        self.client = OpenAI(api_key=api_key)
+        Without an explicit provider, an OpenAIProvider is built from api_key.
+        """
+        if provider is None:
+            # Retries are handled by the resilience layer, not the SDK
+            provider = OpenAIProvider(
+                api_key=api_key,
+                max_retries=0 if resilience is not None else 2
+            )
         
-        self.mp_roles = {
-            "corporate": {
-                "description": "Represents business and industry interests",
-                "bias": "Favors market-driven solutions and minimal regulation",
-                "color": "#DA0211"  # Business blue
-            },
-            "academic": {
-                "description": "Represents academic and research institutions",
-                "bias": "Favors evidence-based policy and thorough research",
-                "color": "#FDA003"  # Academic purple
-            },
-            "government": {
-                "description": "Represents governmental and regulatory interests",
-                "bias": "Favors structured oversight and public safety",
-                "color": "#2CAFFE"  # Government green
-            },
-            "civil_rights": {
-                "description": "Represents civil society and individual rights",
-                "bias": "Favors privacy and individual protections",
-                "color": "#000099"  # Advocacy red
-            }
-        }
+        self.provider = provider
+        self.model = model
+        self.cache = cache
+        self.rate_limiter = rate_limiter
+        self.resilience = resilience
+        self.telemetry = telemetry
+        self.token_counter = TokenCounter(model)
+        self.context = DebateContextManager(
+            self._summarize_turns,
+            self.token_counter,
+            token_budget=context_token_budget
+        )
+        
+        self.mp_roles = MP_ROLE_PROFILES
 
         self.vote_service = VoteDecisionService()
 
-    async def generate_mp_response(
-        self, 
-        role: str, 
-        debate_topic: str, 
-        debate_history: List[MPResponse]
+    async def aclose(self) -> None:
+        """Close the provider's connections and the cache."""
+        await self.provider.aclose()
+        if self.cache is not None:
+            self.cache.close()
+
+    @contextmanager
+    def fresh_completions(self) -> Iterator[None]:
+        """
+        Request every completion made inside the block from the provider.
+
+        The new text still replaces the cached one, so later identical
+        calls are served the latest completion.
+        """
+        token = _bypass_cache.set(True)
+        try:
+            yield
+        finally:
+            _bypass_cache.reset(token)
+
+    async def _chat_completion(
+        self,
+        system_prompt: str,
+        prompt: str,
+        temperature: float = 0.7,
+        max_tokens: int = 500,
+        priority: str = "bulk",
+        call_type: str = "other",
+        role: Optional[str] = None,
+        fallback_on_error: bool = False
     ) -> str:
-        """Generate an MP's response based on their role and debate context."""
+        """
+        Run a single chat completion, served from the cache when possible.
+        
+        Every call is recorded in telemetry. fallback_on_error marks calls
+        whose caller degrades to canned output when this raises, so the
+        failure is counted as a fallback rather than an error.
+        """
+        started = time.perf_counter()
+        messages = [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": prompt}
+        ]
+        cache_key = None
+        if self.cache is not None:
+            cache_key = self._cache_key(messages, temperature, max_tokens)
+            cached = None if _bypass_cache.get() else await self.cache.get(cache_key)
+            if cached is not None:
+                self._record_call(call_type, role, started, "ok", cached=True)
+                return cached
+        
+        estimated_tokens = self._estimate_tokens(messages, max_tokens)
+        
+        async def admit():
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire(estimated_tokens, priority)
+        
+        def request():
+            return self.provider.complete(self.model, messages, temperature, max_tokens)
+        
         try:
-            # Format debate history for context
-            formatted_history = "\n".join([
-                f"{response.mp_role}: {response.content}" 
-                for response in debate_history
-            ])
-            
-            # Construct the prompt
-            prompt = f"""You are an AI Member of Parliament representing {role} interests.
+            if self.resilience is not None:
+                # Admission waits are kept out of the hedge's latency samples
+                completion = await self.resilience.call(
+                    request,
+                    admit=admit,
+                    can_hedge=self._can_hedge
+                )
+            else:
+                await admit()
+                completion = await request()
+        except Exception:
+            self._record_call(call_type, role, started, "fallback" if fallback_on_error else "error")
+            raise
+        content = completion.content
+        
+        self._record_call(
+            call_type,
+            role,
+            started,
+            "ok",
+            prompt_tokens=completion.prompt_tokens,
+            completion_tokens=completion.completion_tokens
+        )
+        if self.rate_limiter is not None and completion.total_tokens:
+            self.rate_limiter.record_usage(estimated_tokens, completion.total_tokens)
+        
+        if cache_key is not None and content:
+            await self.cache.set(cache_key, content)
+        return content
+
+    async def _stream_chat_completion(
+        self,
+        system_prompt: str,
+        prompt: str,
+        temperature: float = 0.7,
+        max_tokens: int = 500,
+        priority: str = "interactive",
+        call_type: str = "other",
+        role: Optional[str] = None
+    ) -> AsyncIterator[str]:
+        """Stream a chat completion token by token, caching the final text."""
+        started = time.perf_counter()
+        messages = [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": prompt}
+        ]
+        cache_key = None
+        if self.cache is not None:
+            cache_key = self._cache_key(messages, temperature, max_tokens)
+            cached = None if _bypass_cache.get() else await self.cache.get(cache_key)
+            if cached is not None:
+                self._record_call(call_type, role, started, "ok", cached=True)
+                yield cached
+                return
+        
+        estimated_tokens = self._estimate_tokens(messages, max_tokens)
+        
+        async def admit():
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire(estimated_tokens, priority)
+        
+        def open_stream():
+            return self.provider.open_stream(self.model, messages, temperature, max_tokens)
+        
+        parts: List[str] = []
+        try:
+            # Only opening the stream is retried; tokens already relayed to the
+            # client cannot be taken back, so streams are never hedged.
+            if self.resilience is not None:
+                stream = await self.resilience.call(open_stream, hedge=False, admit=admit)
+            else:
+                await admit()
+                stream = await open_stream()
+            async for delta in stream:
+                parts.append(delta)
+                yield delta
+        except Exception:
+            self._record_call(call_type, role, started, "error")
+            raise
+        
+        # Streamed chunks carry no usage block, so count the text ourselves
+        completion_tokens = self.token_counter.count("".join(parts))
+        self._record_call(
+            call_type,
+            role,
+            started,
+            "ok",
+            prompt_tokens=estimated_tokens - max_tokens,
+            completion_tokens=completion_tokens
+        )
+        if self.rate_limiter is not None:
+            # Refund the unused part of the max_tokens reservation
+            self.rate_limiter.record_usage(max_tokens, completion_tokens)
+        
+        if cache_key is not None and parts:
+            await self.cache.set(cache_key, "".join(parts))
+
+    def _record_call(
+        self,
+        call_type: str,
+        role: Optional[str],
+        started: float,
+        outcome: str,
+        prompt_tokens: int = 0,
+        completion_tokens: int = 0,
+        cached: bool = False
+    ) -> None:
+        if self.telemetry is None:
+            return
+        self.telemetry.record(LLMCallMetric(
+            call_type=call_type,
+            mp_role=role,
+            model=self.model,
+            provider=self.provider.name,
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            latency=time.perf_counter() - started,
+            outcome=outcome,
+            cached=cached,
+            timestamp=datetime.utcnow()
+        ))
+
+    def _can_hedge(self) -> bool:
+        # A hedge sent while callers queue for admission would join that queue
+        return self.rate_limiter is None or not self.rate_limiter.saturated()
+
+    def _cache_key(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: float,
+        max_tokens: int
+    ) -> str:
+        # Namespaced by provider so simulated output never serves real calls
+        return self.cache.make_key(
+            f"{self.provider.name}:{self.model}",
+            messages,
+            temperature,
+            max_tokens
+        )
+
+    def _estimate_tokens(self, messages: List[Dict[str, str]], max_tokens: int) -> int:
+        """Upper bound on tokens a call may consume: prompt tokens plus max_tokens."""
+        prompt_tokens = sum(self.token_counter.count(message["content"]) for message in messages)
+        return prompt_tokens + max_tokens
+
+    async def _summarize_turns(
+        self,
+        previous_summary: str,
+        turns: List[str],
+        max_tokens: int
+    ) -> str:
+        """Fold older debate turns into the running debate summary."""
+        formatted_turns = "\n".join(turns)
+        prompt = f"""Update the running summary of a parliamentary debate.
+
+Current summary:
+{previous_summary or "(none yet)"}
+
+New speeches to fold in:
+{formatted_turns}
+
+Write a concise updated summary that keeps each MP's position and key arguments."""
+
+        return await self._chat_completion(
+            "You summarize parliamentary debates faithfully and concisely.",
+            prompt,
+            temperature=0.3,
+            max_tokens=max_tokens,
+            call_type="summary"
+        )
+
+    async def _build_mp_prompt(
+        self,
+        role: str,
+        debate_topic: str,
+        debate_history: List[MPResponse]
+    ) -> str:
+        """Build the prompt for an MP speech."""
+        # Older turns are summarised so the prompt stays within budget
+        formatted_history = await self.context.build_history(debate_history)
+        
+        return f"""You are an AI Member of Parliament representing {role} interests.
 Role Description: {self.mp_roles[role]['description']}
 Bias: {self.mp_roles[role]['bias']}
 
@@ -70,18 +320,26 @@ Previous Discussion:
 
 Please provide your response to the current debate, considering your role's perspective:"""
 
-            # The OpenAI client is not async, so we don't use await here
-            response = self.client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[
-                    {"role": "system", "content": "You are an AI MP in a parliamentary debate."},
-                    {"role": "user", "content": prompt}
-                ],
+    async def generate_mp_response(
+        self, 
+        role: str, 
+        debate_topic: str, 
+        debate_history: List[MPResponse],
+        priority: str = "bulk"
+    ) -> str:
+        """Generate an MP's response based on their role and debate context."""
+        try:
+            prompt = await self._build_mp_prompt(role, debate_topic, debate_history)
+
+            return await self._chat_completion(
+                "You are an AI MP in a parliamentary debate.",
+                prompt,
                 temperature=0.7,
-                max_tokens=500
+                max_tokens=500,
+                priority=priority,
+                call_type="response",
+                role=role
             )
-            
-            return response.choices[0].message.content
 
         except Exception as e:
             raise HTTPException(
@@ -89,14 +347,32 @@ Please provide your response to the current debate, considering your role's pers
                 detail=f"Error generating MP response: {str(e)}"
             )
 
+    async def stream_mp_response(
+        self,
+        role: str,
+        debate_topic: str,
+        debate_history: List[MPResponse],
+        priority: str = "interactive"
+    ) -> AsyncIterator[str]:
+        """Stream an MP's response as it is generated."""
+        prompt = await self._build_mp_prompt(role, debate_topic, debate_history)
+        async for token in self._stream_chat_completion(
+            "You are an AI MP in a parliamentary debate.",
+            prompt,
+            temperature=0.7,
+            max_tokens=500,
+            priority=priority,
+            call_type="response",
+            role=role
+        ):
+            yield token
+
     async def evaluate_policy(self, policy_text: str) -> Dict:
         """Evaluate a proposed policy from multiple perspectives."""
         try:
-            response = await self.client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[
-                    {"role": "system", "content": "You are an AI policy analyst."},
-                    {"role": "user", "content": f"""Analyze this AI policy proposal from multiple perspectives:
+            analysis = await self._chat_completion(
+                "You are an AI policy analyst.",
+                f"""Analyze this AI policy proposal from multiple perspectives:
 
 Policy Text:
 {policy_text}
@@ -105,14 +381,14 @@ Please provide:
 1. Potential benefits
 2. Potential risks
 3. Implementation challenges
-4. Stakeholder impacts"""}
-                ],
+4. Stakeholder impacts""",
                 temperature=0.7,
-                max_tokens=1000
+                max_tokens=1000,
+                call_type="evaluation"
             )
             
             return {
-                "analysis": response.choices[0].message.content,
+                "analysis": analysis,
                 "timestamp": datetime.utcnow()
             }
 
@@ -126,42 +402,27 @@ Please provide:
         self, 
         role: str, 
         debate_topic: str, 
-        debate_history: List[MPResponse]
+        debate_history: List[MPResponse],
+        priority: str = "bulk"
     ) -> dict:
         """Generate MP's voting decision based on the debate."""
         try:
             # Calculate vote score using the new service
             vote_analysis = self.vote_service.calculate_vote_score(role, debate_history)
             
-            # Use GPT to generate reasoning based on the vote
-            prompt = f"""As an AI MP representing {role} interests, explain this voting decision:
-            Topic: {debate_topic}
-            Vote: {vote_analysis['vote']}
-            Confidence: {vote_analysis['confidence']:.2f}
-            
-            Provide a convincing explanation for this voting decision from your role's perspective.
-            """
-
-            try:
-                response = self.client.chat.completions.create(
-                    model="gpt-4o-mini",
-                    messages=[
-                        {"role": "system", "content": "You are an AI MP explaining your voting decision."},
-                        {"role": "user", "content": prompt}
-                    ],
-                    temperature=0.7,
-                    max_tokens=200
-                )
-                reasoning = response.choices[0].message.content
-            except Exception as e:
-                logging.error(f"OpenAI API error for {role}: {str(e)}")
-                # Provide a fallback reasoning if OpenAI fails
-                reasoning = f"As a {role} representative, I have considered the implications and reached this decision."
+            reasoning, degraded = await self.explain_vote(
+                role,
+                debate_topic,
+                vote_analysis['vote'],
+                vote_analysis['confidence'],
+                priority=priority
+            )
             
             return {
                 "vote": vote_analysis['vote'],
                 "reasoning": reasoning,
-                "confidence": vote_analysis['confidence']
+                "confidence": vote_analysis['confidence'],
+                "degraded": degraded
             }
             
         except Exception as e:
@@ -170,9 +431,50 @@ Please provide:
             return {
                 "vote": "abstain",
                 "reasoning": f"Due to technical difficulties, as a {role} representative, I must abstain from voting.",
-                "confidence": 0.0
+                "confidence": 0.0,
+                "degraded": True
             }
 
+    async def explain_vote(
+        self,
+        role: str,
+        debate_topic: str,
+        vote: str,
+        confidence: float,
+        priority: str = "bulk"
+    ) -> Tuple[str, bool]:
+        """
+        Write an MP's reasoning for a vote that has already been decided.
+        
+        Returns:
+            Tuple of (reasoning, degraded); degraded is True when the LLM
+            failed and a canned explanation was used instead
+        """
+        prompt = f"""As an AI MP representing {role} interests, explain this voting decision:
+            Topic: {debate_topic}
+            Vote: {vote}
+            Confidence: {confidence:.2f}
+            
+            Provide a convincing explanation for this voting decision from your role's perspective.
+            """
+
+        try:
+            reasoning = await self._chat_completion(
+                "You are an AI MP explaining your voting decision.",
+                prompt,
+                temperature=0.7,
+                max_tokens=200,
+                priority=priority,
+                call_type="vote",
+                role=role,
+                fallback_on_error=True
+            )
+            return reasoning, False
+        except Exception as e:
+            logging.error(f"OpenAI API error for {role} after retries: {str(e)}")
+            # Provide a fallback reasoning if OpenAI fails, flagged as such
+            return f"As a {role} representative, I have considered the implications and reached this decision.", True
+
     async def create_debate_from_paper(self, paper: PolicyPaper) -> dict:
         """Create a structured debate from a policy paper."""
         try:
@@ -182,35 +484,34 @@ Summary: {paper.summary}
 
 Create a debate topic that MPs can discuss regarding AI policy implications."""
 
-            response = self.client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[
-                    {"role": "system", "content": "You are a parliamentary debate moderator."},
-                    {"role": "user", "content": prompt}
-                ],
+            content = await self._chat_completion(
+                "You are a parliamentary debate moderator.",
+                prompt,
                 temperature=0.7,
-                max_tokens=300
+                max_tokens=300,
+                call_type="topic",
+                fallback_on_error=True
             )
             
-            # Always return a structured response, even if OpenAI fails
-            try:
-                content = response.choices[0].message.content
-            except:
+            # Always return a structured response, even if OpenAI returns nothing
+            if not content:
                 content = paper.title
 
             return {
                 "debate_topic": content,
                 "background": paper.summary,
-                "key_considerations": ["Safety", "Ethics", "Implementation"]
+                "key_considerations": ["Safety", "Ethics", "Implementation"],
+                "degraded": False
             }
             
         except Exception as e:
-            print(f"OpenAI Error: {str(e)}")
+            logging.error(f"OpenAI error creating debate topic after retries: {str(e)}")
             # Return a fallback response instead of raising an error
             return {
                 "debate_topic": f"Policy Implications of: {paper.title}",
                 "background": paper.summary,
-                "key_considerations": ["Safety", "Ethics", "Implementation"]
+                "key_considerations": ["Safety", "Ethics", "Implementation"],
+                "degraded": True
             }
 
     async def validate_vote_consistency(
@@ -240,17 +541,17 @@ Create a debate topic that MPs can discuss regarding AI policy implications."""
             
             Is this vote consistent with the position expressed in the debate? Answer only YES or NO."""
             
-            response = self.client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[
-                    {"role": "system", "content": "You are analyzing voting consistency."},
-                    {"role": "user", "content": prompt}
-                ],
+            answer = await self._chat_completion(
+                "You are analyzing voting consistency.",
+                prompt,
                 temperature=0.3,
-                max_tokens=50
+                max_tokens=50,
+                call_type="consistency",
+                role=role,
+                fallback_on_error=True
             )
             
-            return "YES" in response.choices[0].message.content.upper()
+            return "YES" in answer.upper()
             
         except Exception as e:
             logging.warning(f"Consistency check failed: {str(e)}")
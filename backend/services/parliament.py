@@ -0,0 +1,208 @@
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+from models.database_models import MPResponse
+from services.mp_roles import MP_ROLES
+from services.vote_decision_service import VoteDecisionService
+
+# Vote codes used in the member arrays
+VOTE_CHOICES = ["for", "against", "abstain"]
+
+
+def aspect_matrix(
+    responses: Sequence[MPResponse],
+    aspects: List[str],
+    vote_service: VoteDecisionService
+) -> np.ndarray:
+    """
+    Score each response on each aspect.
+
+    Args:
+        responses: Debate responses
+        aspects: Aspect names, one per column
+        vote_service: Scores a response's aspects from its keywords
+
+    Returns:
+        Array of shape (responses, aspects) with the scores of
+        VoteDecisionService.analyze_response_sentiment
+    """
+    matrix = np.zeros((len(responses), len(aspects)))
+    for row, response in enumerate(responses):
+        sentiment = vote_service.analyze_response_sentiment(response.content or "")
+        matrix[row] = [sentiment.get(aspect, 0.0) for aspect in aspects]
+    return matrix
+
+
+def _apportion(seats: int, shares: np.ndarray) -> np.ndarray:
+    """Largest-remainder seat allocation so counts always sum to seats."""
+    quotas = shares * seats
+    counts = np.floor(quotas).astype(int)
+    remainder = seats - counts.sum()
+    if remainder:
+        counts[np.argsort(quotas - counts)[::-1][:remainder]] += 1
+    return counts
+
+
+@dataclass
+class Parliament:
+    """
+    A chamber of members drawn from a mixture of MP roles.
+
+    Members are rows of NumPy arrays rather than objects, so scoring and
+    tallying a chamber of hundreds or thousands is a handful of array
+    operations regardless of its size.
+    """
+    roles: List[str]
+    aspects: List[str]
+    vote_service: VoteDecisionService
+    member_roles: np.ndarray  # (members,) index into roles
+    weights: np.ndarray  # (members, aspects)
+
+    @classmethod
+    def sample(
+        cls,
+        size: int,
+        mixture: Optional[Dict[str, float]] = None,
+        jitter: float = 0.15,
+        seed: Optional[int] = None,
+        vote_service: Optional[VoteDecisionService] = None
+    ) -> "Parliament":
+        """
+        Seat a parliament.
+
+        Args:
+            size: Number of members
+            mixture: Relative share of seats per role; equal shares if omitted
+            jitter: Standard deviation of each member's multiplicative
+                deviation from their role's aspect weights
+            seed: Seed for reproducible jitter
+            vote_service: Source of the per-role aspect weights
+
+        Returns:
+            Parliament with members grouped by role
+
+        Raises:
+            ValueError: If the size or mixture is invalid
+        """
+        if size < 1:
+            raise ValueError("A parliament needs at least one member")
+        mixture = mixture or {role: 1.0 for role in MP_ROLES}
+        unknown = set(mixture) - set(MP_ROLES)
+        if unknown:
+            raise ValueError(f"Unknown MP roles: {', '.join(sorted(unknown))}")
+        shares = np.array([max(0.0, mixture.get(role, 0.0)) for role in MP_ROLES])
+        if shares.sum() <= 0:
+            raise ValueError("Role mixture must give at least one role a positive share")
+
+        vote_service = vote_service or VoteDecisionService()
+        role_weights = vote_service.role_weights
+        aspects = sorted({aspect for role in MP_ROLES for aspect in role_weights.get(role, {})})
+        base = np.array([
+            [role_weights.get(role, {}).get(aspect, 0.0) for aspect in aspects]
+            for role in MP_ROLES
+        ])
+
+        counts = _apportion(size, shares / shares.sum())
+        member_roles = np.repeat(np.arange(len(MP_ROLES)), counts)
+        rng = np.random.default_rng(seed)
+        weights = base[member_roles] * (1.0 + jitter * rng.standard_normal((size, len(aspects))))
+        return cls(list(MP_ROLES), aspects, vote_service, member_roles, weights)
+
+    @property
+    def size(self) -> int:
+        return len(self.member_roles)
+
+    def scores(self, responses: Sequence[MPResponse]) -> np.ndarray:
+        """
+        Score every member's support for the motion in one pass.
+
+        Each member weighs the speeches by their aspect weights the way
+        VoteDecisionService.keyword_score does for a single MP: the first
+        speech of their own role counts twice, its other speeches not at all.
+
+        Returns:
+            Array of shape (members,) with scores in (-1, 1)
+        """
+        if not responses:
+            return np.zeros(self.size)
+        speech_aspects = aspect_matrix(responses, self.aspects, self.vote_service)
+        speech_roles = np.array([
+            self.roles.index(r.mp_role) if r.mp_role in self.roles else -1
+            for r in responses
+        ])
+
+        # Per role: every speech of the other roles plus twice its own first one
+        total = speech_aspects.sum(axis=0)
+        own = np.zeros((len(self.roles), len(self.aspects)))
+        first = np.zeros((len(self.roles), len(self.aspects)))
+        known = speech_roles >= 0
+        np.add.at(own, speech_roles[known], speech_aspects[known])
+        roles_spoken, first_rows = np.unique(speech_roles[known], return_index=True)
+        first[roles_spoken] = speech_aspects[known][first_rows]
+        evidence = self.vote_service.keyword_sensitivity * (total - own + 2 * first) / (len(responses) + 1)
+
+        return np.tanh(np.einsum("ma,ma->m", self.weights, evidence[self.member_roles]))
+
+    def votes(self, scores: np.ndarray, threshold: float = 0.3) -> np.ndarray:
+        """Map scores to vote codes (indexes into VOTE_CHOICES)."""
+        return np.select([scores > threshold, scores < -threshold], [0, 1], default=2)
+
+    def tally(self, codes: np.ndarray) -> Dict[str, Any]:
+        """
+        Count votes overall and per role.
+
+        Returns:
+            Dict with the overall counts, counts by role and the result
+        """
+        by_role = np.bincount(
+            self.member_roles * len(VOTE_CHOICES) + codes,
+            minlength=len(self.roles) * len(VOTE_CHOICES)
+        ).reshape(len(self.roles), len(VOTE_CHOICES))
+        overall = by_role.sum(axis=0)
+        return {
+            **{choice: int(count) for choice, count in zip(VOTE_CHOICES, overall)},
+            "total": self.size,
+            "result": vote_result(int(overall[0]), int(overall[1]), int(overall[2])),
+            "by_role": {
+                role: {choice: int(count) for choice, count in zip(VOTE_CHOICES, counts)}
+                for role, counts in zip(self.roles, by_role)
+                if counts.sum()
+            }
+        }
+
+    def sample_members(self, count: int, seed: Optional[int] = None) -> List[int]:
+        """
+        Pick members to speak for the chamber, spread across roles.
+
+        Seats are shared out between roles in proportion to their size, with
+        every seated role getting at least one speaker while count allows.
+        """
+        count = min(count, self.size)
+        if count <= 0:
+            return []
+        rng = np.random.default_rng(seed)
+        seated = np.bincount(self.member_roles, minlength=len(self.roles))
+        quota = _apportion(count, seated / seated.sum())
+        present = np.flatnonzero(seated)
+        for role in present:
+            if quota[role] == 0 and quota.max() > 1:
+                quota[np.argmax(quota)] -= 1
+                quota[role] = 1
+        chosen: List[int] = []
+        for role in present:
+            members = np.flatnonzero(self.member_roles == role)
+            chosen.extend(rng.choice(members, size=min(quota[role], len(members)), replace=False).tolist())
+        return sorted(chosen)
+
+
+def vote_result(votes_for: int, against: int, abstain: int) -> str:
+    """Outcome of a vote; abstentions do not count towards the majority."""
+    total_votes = votes_for + against
+    if total_votes == 0:
+        return "abstained"
+    if votes_for > total_votes / 2:
+        return "passed"
+    if against > total_votes / 2:
+        return "rejected"
+    return "tied"
@@ -0,0 +1,169 @@
+import asyncio
+import heapq
+import itertools
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+import numpy as np
+
+# Lower value = served first
+PRIORITIES = {
+    "interactive": 0,
+    "bulk": 1
+}
+
+
+class LLMRateLimiter:
+    """
+    Process-wide admission control for LLM calls.
+
+    Two token buckets enforce the requests/min and tokens/min budgets. Callers
+    that cannot be admitted immediately wait in a priority queue, so
+    interactive calls always go ahead of queued bulk generation.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: int = 500,
+        tokens_per_minute: int = 200000,
+        wait_sample_size: int = 1000
+    ):
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self._request_rate = requests_per_minute / 60.0
+        self._token_rate = tokens_per_minute / 60.0
+
+        # Buckets start full
+        self._request_allowance = float(requests_per_minute)
+        self._token_allowance = float(tokens_per_minute)
+        self._last_refill = time.monotonic()
+
+        self._waiters: List[Tuple[int, int, int, asyncio.Future]] = []
+        self._sequence = itertools.count()
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+        self._admitted: Dict[str, int] = {name: 0 for name in PRIORITIES}
+        self._throttled: Dict[str, int] = {name: 0 for name in PRIORITIES}
+        self._wait_times: Dict[str, Deque[float]] = {
+            name: deque(maxlen=wait_sample_size) for name in PRIORITIES
+        }
+
+    async def acquire(self, estimated_tokens: int, priority: str = "bulk") -> float:
+        """
+        Wait until the call fits in both budgets.
+
+        Args:
+            estimated_tokens: Prompt plus completion tokens the call may use
+            priority: "interactive" or "bulk"
+
+        Returns:
+            float: Seconds spent waiting for admission
+        """
+        if priority not in PRIORITIES:
+            priority = "bulk"
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        started = time.monotonic()
+
+        heapq.heappush(
+            self._waiters,
+            (PRIORITIES[priority], next(self._sequence), estimated_tokens, future)
+        )
+        self._dispatch()
+        if not future.done():
+            self._throttled[priority] += 1
+        await future
+
+        waited = time.monotonic() - started
+        self._admitted[priority] += 1
+        self._wait_times[priority].append(waited)
+        return waited
+
+    def saturated(self) -> bool:
+        """Whether callers are queued for admission because a budget is used up."""
+        return any(not future.done() for _, _, _, future in self._waiters)
+
+    def record_usage(self, estimated_tokens: int, actual_tokens: int) -> None:
+        """Correct the token bucket once the real usage of a call is known."""
+        self._token_allowance -= actual_tokens - estimated_tokens
+        # Tokens refunded by an overestimate may admit queued callers now
+        self._dispatch()
+
+    def stats(self) -> Dict[str, Any]:
+        """Queue depth, admission counts and wait-time percentiles."""
+        queue_depth = {name: 0 for name in PRIORITIES}
+        names = {value: name for name, value in PRIORITIES.items()}
+        for priority, _, _, future in self._waiters:
+            if not future.done():
+                queue_depth[names[priority]] += 1
+
+        wait_times = {}
+        for name, samples in self._wait_times.items():
+            if samples:
+                values = np.fromiter(samples, dtype=float)
+                wait_times[name] = {
+                    "mean": float(values.mean()),
+                    "p50": float(np.percentile(values, 50)),
+                    "p95": float(np.percentile(values, 95)),
+                    "max": float(values.max())
+                }
+            else:
+                wait_times[name] = {"mean": 0.0, "p50": 0.0, "p95": 0.0, "max": 0.0}
+
+        self._refill()
+        return {
+            "requests_per_minute": self.requests_per_minute,
+            "tokens_per_minute": self.tokens_per_minute,
+            "available_requests": self._request_allowance,
+            "available_tokens": self._token_allowance,
+            "queue_depth": queue_depth,
+            "admitted": dict(self._admitted),
+            "throttled": dict(self._throttled),
+            "wait_seconds": wait_times
+        }
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._last_refill
+        self._last_refill = now
+        self._request_allowance = min(
+            float(self.requests_per_minute),
+            self._request_allowance + elapsed * self._request_rate
+        )
+        self._token_allowance = min(
+            float(self.tokens_per_minute),
+            self._token_allowance + elapsed * self._token_rate
+        )
+
+    def _dispatch(self) -> None:
+        """Admit queued callers in priority order while the budgets allow."""
+        self._refill()
+        while self._waiters:
+            _, _, tokens, future = self._waiters[0]
+            if future.done():
+                # Cancelled while waiting
+                heapq.heappop(self._waiters)
+                continue
+
+            # A single call larger than the whole budget would never fit
+            tokens = min(tokens, self.tokens_per_minute)
+            if self._request_allowance >= 1 and self._token_allowance >= tokens:
+                heapq.heappop(self._waiters)
+                self._request_allowance -= 1
+                self._token_allowance -= tokens
+                future.set_result(None)
+                continue
+
+            if self._timer is None:
+                delay = max(
+                    (1 - self._request_allowance) / self._request_rate,
+                    (tokens - self._token_allowance) / self._token_rate,
+                    0.01
+                )
+                self._timer = asyncio.get_running_loop().call_later(delay, self._on_timer)
+            break
+
+    def _on_timer(self) -> None:
+        self._timer = None
+        self._dispatch()
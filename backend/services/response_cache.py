@@ -0,0 +1,205 @@
+import hashlib
+import json
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from fastapi import Response
+from fastapi.encoders import jsonable_encoder
+
+# Serialized JSON body and the headers that belong with it, e.g. the next-page cursor
+Payload = Tuple[bytes, Dict[str, str]]
+
+
+def make_etag(resource: str, version: int, variant: str = "") -> str:
+    """
+    Strong ETag for one version of a resource, e.g. "debate-12-v5-1a2b3c4d".
+
+    The suffix hashes the variant, so the responses and votes of a debate
+    never share an ETag with the debate itself.
+    """
+    suffix = hashlib.sha256(variant.encode("utf-8")).hexdigest()[:8]
+    return f'"{resource}-v{version}-{suffix}"'
+
+
+def body_etag(body: bytes) -> str:
+    """Strong ETag for a response body that has no version of its own."""
+    return f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Whether an If-None-Match header names the ETag; weak tags compare equal to strong ones."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return etag in {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+
+
+def serialize(payload: Any) -> bytes:
+    """Encode a response body the way FastAPI's JSONResponse does."""
+    return json.dumps(
+        jsonable_encoder(payload),
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=None,
+        separators=(",", ":")
+    ).encode("utf-8")
+
+
+def json_response(
+    if_none_match: Optional[str],
+    payload: Any,
+    headers: Optional[Dict[str, str]] = None,
+    cache_control: str = "no-cache"
+) -> Response:
+    """
+    Serialize a body that has no version and answer with 304 if the client has it.
+
+    The ETag is a hash of the body, so this saves the transfer but not the
+    work of building the body; use ResponseCache.respond for versioned resources.
+    """
+    body = serialize(payload)
+    etag = body_etag(body)
+    headers = {**(headers or {}), "ETag": etag, "Cache-Control": cache_control}
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+class ResponseCache:
+    """
+    In-process LRU of serialized read responses for debates and papers.
+
+    Payloads are stored per resource (e.g. "debate-12") and request URL,
+    together with the resource version they were built from. Every write
+    bumps the version in the database, in the same transaction, and the
+    first read to see a newer version drops the older payloads. Stale
+    payloads are therefore never served, and each worker process
+    invalidates its own cache without coordination.
+    """
+
+    def __init__(self, max_entries: int = 2048, completed_max_age: int = 86400):
+        self.max_entries = max_entries
+        self.completed_max_age = completed_max_age
+        self._resources: "OrderedDict[str, Tuple[int, Dict[str, Payload]]]" = OrderedDict()
+        self._size = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.not_modified = 0
+        self.invalidations = 0
+        self.evictions = 0
+
+    def cache_control(self, status: Optional[str] = None) -> str:
+        """
+        Cache-Control for a resource in the given status.
+
+        Completed debates may be cached by clients and proxies for
+        completed_max_age seconds; everything else is revalidated on
+        every use, which costs a 304 while its version is unchanged.
+        """
+        if status == "completed" and self.completed_max_age > 0:
+            return f"public, max-age={self.completed_max_age}"
+        return "no-cache"
+
+    def get(self, resource: str, version: int, variant: str) -> Optional[Payload]:
+        """Return the payload of a URL at this resource version, or None on a miss."""
+        entry = self._resources.get(resource)
+        if entry is not None and entry[0] < version:
+            self.invalidate(resource)
+            entry = None
+        payload = entry[1].get(variant) if entry is not None and entry[0] == version else None
+        if payload is None:
+            self.misses += 1
+            return None
+        self._resources.move_to_end(resource)
+        self.hits += 1
+        return payload
+
+    def put(self, resource: str, version: int, variant: str, payload: Payload) -> None:
+        """Store the payload of a URL at this resource version."""
+        if self.max_entries <= 0:
+            return
+        entry = self._resources.get(resource)
+        if entry is not None and entry[0] > version:
+            # Built from a version that a concurrent write already replaced
+            return
+        if entry is None or entry[0] < version:
+            self._drop(resource)
+            entry = (version, {})
+            self._resources[resource] = entry
+        if variant not in entry[1]:
+            self._size += 1
+        entry[1][variant] = payload
+        self._resources.move_to_end(resource)
+        while self._size > self.max_entries:
+            oldest = next(iter(self._resources))
+            self.evictions += len(self._resources[oldest][1])
+            self._drop(oldest)
+
+    def invalidate(self, resource: str) -> None:
+        """Drop every payload of a resource."""
+        if self._drop(resource):
+            self.invalidations += 1
+
+    async def respond(
+        self,
+        if_none_match: Optional[str],
+        resource: str,
+        version: int,
+        variant: str,
+        build: Callable[[], Awaitable[Tuple[Any, Dict[str, str]]]],
+        cache_control: str
+    ) -> Response:
+        """
+        Answer a read of a versioned resource from the client's or this cache.
+
+        Args:
+            if_none_match: Value of the If-None-Match header, if sent
+            resource: Resource the response is derived from, e.g. "debate-12"
+            version: Current version of the resource
+            variant: What distinguishes responses of the resource, usually path and query
+            build: Produces the body and its extra headers on a cache miss
+            cache_control: Cache-Control header to send
+
+        Returns:
+            A 304 if the client's ETag is current, otherwise the JSON body
+        """
+        etag = make_etag(resource, version, variant)
+        headers = {"ETag": etag, "Cache-Control": cache_control}
+        if etag_matches(if_none_match, etag):
+            self.not_modified += 1
+            return Response(status_code=304, headers=headers)
+
+        payload = self.get(resource, version, variant)
+        if payload is None:
+            body, extra_headers = await build()
+            payload = (serialize(body), extra_headers)
+            self.put(resource, version, variant, payload)
+        body, extra_headers = payload
+        return Response(
+            content=body,
+            media_type="application/json",
+            headers={**extra_headers, **headers}
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and cache size."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "not_modified": self.not_modified,
+            "invalidations": self.invalidations,
+            "evictions": self.evictions,
+            "resources": len(self._resources),
+            "entries": self._size
+        }
+
+    def _drop(self, resource: str) -> bool:
+        entry = self._resources.pop(resource, None)
+        if entry is None:
+            return False
+        self._size -= len(entry[1])
+        return True
@@ -0,0 +1,55 @@
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+
+class DebateTurnTracker:
+    """
+    In-memory view of debates the engine is currently running.
+
+    The engine reports each phase change here so the moderator endpoints can
+    show who is speaking without touching the database. Finished debates are
+    kept for a while, oldest dropped first.
+    """
+
+    def __init__(self, max_debates: int = 256):
+        self.max_debates = max_debates
+        self._states: "OrderedDict[int, Dict[str, Any]]" = OrderedDict()
+
+    def start(self, debate_id: int, rounds: int, roles: List[str]) -> None:
+        self._states[debate_id] = {
+            "debate_id": debate_id,
+            "phase": "debating",  # 'debating', 'voting', 'completed', 'incomplete'
+            "round": 1,
+            "rounds": rounds,
+            "roles": list(roles),
+            "speaking": [],
+            "spoken": [],
+            "prefetching_round": None,
+            "updated_at": datetime.utcnow()
+        }
+        self._states.move_to_end(debate_id)
+        while len(self._states) > self.max_debates:
+            self._states.popitem(last=False)
+
+    def update(self, debate_id: int, **fields: Any) -> None:
+        state = self._states.get(debate_id)
+        if state is None:
+            return
+        state.update(fields, updated_at=datetime.utcnow())
+
+    def mark_spoken(self, debate_id: int, role: str) -> None:
+        state = self._states.get(debate_id)
+        if state is None:
+            return
+        if role in state["speaking"]:
+            state["speaking"] = [r for r in state["speaking"] if r != role]
+        if role not in state["spoken"]:
+            state["spoken"] = state["spoken"] + [role]
+        state["updated_at"] = datetime.utcnow()
+
+    def get(self, debate_id: int) -> Optional[Dict[str, Any]]:
+        state = self._states.get(debate_id)
+        if state is None:
+            return None
+        return {**state, "speaking": list(state["speaking"]), "spoken": list(state["spoken"])}
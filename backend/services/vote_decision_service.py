@@ -42,17 +42,31 @@ class VoteDecisionService:
             # ... similar definitions for academic and government roles
         }
         
-        # Keywords associated with different aspects
+        # Keywords associated with different aspects; every aspect in
+        # role_weights has a group, so no weight goes without evidence
         self.aspect_keywords = {
             "economic_impact": ["cost", "economy", "market", "business", "financial"],
-            "innovation": ["research", "development", "progress", "advancement"],
-            "regulation": ["rules", "compliance", "standards", "requirements"],
+            "innovation": ["research", "development", "progress", "advancement", "innovation"],
+            "regulation": ["rules", "compliance", "standards", "requirements", "regulat", "oversight"],
             "social_impact": ["society", "community", "public", "people"],
             "privacy": ["privacy", "data", "personal", "surveillance"],
             "fairness": ["equality", "bias", "discrimination", "fair"],
-            "implementation": ["implement", "deploy", "execute", "operate"]
+            "implementation": ["implement", "deploy", "execute", "operate"],
+            "economic": ["econom", "cost", "financial", "growth", "investment"],
+            "market": ["market", "business", "competiti", "industry"],
+            "research": ["research", "study", "studies", "scientific"],
+            "evidence": ["evidence", "findings", "empirical", "measur"],
+            "ethics": ["ethic", "moral", "responsib", "harm"],
+            "safety": ["safety", "safe", "risk", "security"],
+            "transparency": ["transparen", "accountab", "disclos", "explain"],
+            "rights": ["rights", "consent", "freedom", "redress"]
         }
 
+        # Sentiment scores are keyword rates per word. keyword_score scales
+        # them to rates per 10 words, where a typical speech's weighted
+        # evidence is around the ±0.3 vote threshold
+        self.keyword_sensitivity = 10.0
+
         self.role_weights = {
             "corporate": {
                 "economic": 0.8,
@@ -99,69 +113,47 @@ class VoteDecisionService:
         
         return aspects_score
 
-    def calculate_vote_score(
-        self, 
-        role: str, 
-        responses: List[MPResponse]
-    ) -> Dict[str, Any]:
+    def keyword_score(self, role: str, responses: List[MPResponse]) -> float:
         """
-        Calculate voting score based on role weights and response analysis.
+        Score a role's support for the motion from the keywords of the debate.
         
         Args:
             role: The MP role calculating the vote
             responses: List of all debate responses
         
         Returns:
-            Dict containing vote decision and confidence
+            Score in (-1, 1); the role's own first response counts twice
         """
-        try:
-            # Get the current MP's response and other responses
-            own_response = next((r for r in responses if r.mp_role == role), None)
-            other_responses = [r for r in responses if r.mp_role != role]
-            
-            # Get role weights
-            weights = self.role_weights.get(role, {})
-            if not weights:
-                return {"vote": "abstain", "confidence": 0.02}
-            
-            # Calculate sentiment scores
-            total_score = 0.0
-            if own_response:
-                sentiment = self.analyze_response_sentiment(own_response.content)
-                own_score = sum(
-                    sentiment.get(aspect, 0) * weight 
-                    for aspect, weight in weights.items()
-                )
-                total_score += own_score * 2  # Double weight for own response
-                
-            # Consider other responses
-            for response in other_responses:
-                sentiment = self.analyze_response_sentiment(response.content)
-                score = sum(
-                    sentiment.get(aspect, 0) * weight 
-                    for aspect, weight in weights.items()
-                )
-                total_score += score
-            
-            # Normalize score
-            final_score = np.tanh(total_score / (len(responses) + 1))
-            
-            # Determine vote
-            if final_score > 0.3:
-                vote = "for"
-            elif final_score < -0.3:
-                vote = "against"
-            else:
-                vote = "abstain"
-                
-            return {
-                "vote": vote,
-                "confidence": abs(final_score)
-            }
+        # Get the current MP's response and other responses
+        own_response = next((r for r in responses if r.mp_role == role), None)
+        other_responses = [r for r in responses if r.mp_role != role]
+        
+        # Get role weights
+        weights = self.role_weights.get(role, {})
+        if not weights:
+            return 0.0
+        
+        # Calculate sentiment scores
+        total_score = 0.0
+        if own_response:
+            sentiment = self.analyze_response_sentiment(own_response.content)
+            own_score = sum(
+                sentiment.get(aspect, 0) * weight 
+                for aspect, weight in weights.items()
+            )
+            total_score += own_score * 2  # Double weight for own response
             
-        except Exception as e:
-            logging.error(f"Error calculating vote for {role}: {str(e)}")
-            return {"vote": "abstain", "confidence": 0.02}
+        # Consider other responses
+        for response in other_responses:
+            sentiment = self.analyze_response_sentiment(response.content)
+            score = sum(
+                sentiment.get(aspect, 0) * weight 
+                for aspect, weight in weights.items()
+            )
+            total_score += score
+        
+        # Normalize score
+        return float(np.tanh(self.keyword_sensitivity * total_score / (len(responses) + 1)))
 
     def _determine_vote(self, score: float) -> str:
         """Convert numerical score to vote decision."""
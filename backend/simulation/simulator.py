@@ -3,6 +3,7 @@ import logging
 from typing import Dict, List, Optional
 
 import httpx
+from services.mp_roles import MP_ROLES
 from simulation.base_scenario import BaseScenario
 
 logging.basicConfig(level=logging.INFO)
@@ -14,7 +15,7 @@ class ParliamentSimulator:
     def __init__(self, base_url: str = "http://localhost:8000"):
         self.base_url = base_url
         self.client = httpx.AsyncClient(timeout=30.0)
-        self.mp_roles = ["corporate", "academic", "government", "civil_rights"]
+        self.mp_roles = list(MP_ROLES)
 
     async def run(self, scenario: BaseScenario) -> Dict:
         """Run a simulation with the given scenario."""
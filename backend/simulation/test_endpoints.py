@@ -77,6 +77,18 @@ async def test_endpoints():
     except Exception as e:
         print("Error getting vote summary:", str(e))
 
+    # Get the whole debate in one request
+    try:
+        response = requests.get(f"{BASE_URL}/debates/{debate_id}/full")
+        response.raise_for_status()
+        full_debate = response.json()
+        print(
+            f"\nFull Debate: {len(full_debate['responses'])} responses, "
+            f"{len(full_debate['votes'])} votes, summary {full_debate['summary']}"
+        )
+    except Exception as e:
+        print("Error getting full debate:", str(e))
+
 if __name__ == "__main__":
     import asyncio
     asyncio.run(test_endpoints())
@@ -4,8 +4,12 @@ from typing import Dict, List
 
 import httpx
 import pytest
+from models.database_models import MPResponse
 from models.schemas import DebateMetrics, VoteDistribution
 from monitoring.vote_metrics import VoteConsistencyMonitor
+from services.mp_roles import MP_ROLES
+from services.parliament import Parliament
+from services.vote_decision_service import VoteDecisionService
 from simulation.simulator import ParliamentSimulator
 
 
@@ -99,5 +103,69 @@ async def test_full_debate_cycle():
     finally:
         await simulator.client.aclose()
 
+def test_parliament_scores_match_vote_decision_service():
+    """Without jitter every member scores a debate as VoteDecisionService does for their role."""
+    speeches = [
+        "Research and development drive progress, but compliance rules must not stall innovation.",
+        "Privacy of personal data needs standards; surveillance erodes rights.",
+        "We must implement and deploy requirements that agencies can operate.",
+        "Advancement without privacy is no progress; data protection rules first."
+    ]
+    responses = [
+        MPResponse(
+            debate_id=1,
+            mp_role=role,
+            content=speeches[(index + round_number) % len(speeches)],
+            round_number=round_number
+        )
+        for round_number in (1, 2)
+        for index, role in enumerate(MP_ROLES)
+    ]
+    parliament = Parliament.sample(len(MP_ROLES) * 3, jitter=0.0)
+    scores = parliament.scores(responses)
+
+    vote_service = VoteDecisionService()
+    for member, role_index in enumerate(parliament.member_roles):
+        expected = vote_service.keyword_score(parliament.roles[role_index], responses)
+        assert scores[member] == pytest.approx(expected)
+
+def test_parliament_votes_on_a_realistic_debate():
+    """Realistic speeches move members past the vote threshold, both for and against."""
+    def transcript(speeches: Dict[str, str]) -> List[MPResponse]:
+        return [
+            MPResponse(debate_id=1, mp_role=role, content=speeches[role], round_number=1)
+            for role in MP_ROLES
+        ]
+
+    def votes_by_role(responses: List[MPResponse]) -> Dict[str, Dict[str, int]]:
+        parliament = Parliament.sample(300, seed=1)
+        return parliament.tally(parliament.votes(parliament.scores(responses)))["by_role"]
+
+    oversight = votes_by_role(transcript({
+        "corporate": "New compliance requirements and licensing rules would burden every business deploying AI. "
+                     "Startups cannot absorb the cost of audits, and the market will move abroad.",
+        "academic": "The research evidence on model failures is still thin. Independent studies and measurement "
+                    "of deployed systems should come first, with researchers given access to data.",
+        "government": "Public safety requires oversight. Agencies need clear standards they can implement, and a "
+                      "risk-based regime lets us focus inspection where harm is most likely.",
+        "civil_rights": "Facial recognition and data collection threaten privacy and the rights of people who never "
+                        "consented. Any framework must guarantee transparency and redress for those harmed."
+    }))
+    for role in ("academic", "government", "civil_rights"):
+        assert oversight[role]["for"] > oversight[role]["abstain"]
+
+    licensing = votes_by_role(transcript({
+        "corporate": "A licensing regime means compliance filings, mandatory audits and rules written before anyone "
+                     "knows what to audit. Regulators would set requirements that only incumbents can meet.",
+        "academic": "The proposal asks for compliance with standards that do not exist yet. Regulators should fund "
+                    "work on audit methods before writing the rules.",
+        "government": "Regulation is overdue. A licensing authority with oversight powers, binding standards and "
+                      "compliance requirements gives regulators the tools they need.",
+        "civil_rights": "Rules alone are not enough; the regulation must include standards for audits and compliance "
+                        "reporting that regulators publish."
+    }))
+    assert licensing["corporate"]["against"] > licensing["corporate"]["abstain"]
+    assert licensing["government"]["for"] > licensing["government"]["abstain"]
+
 if __name__ == "__main__":
     asyncio.run(test_full_debate_cycle())